@@ -5,7 +5,7 @@ Implements Card, Suit, Rank, and Deck classes.
 from __future__ import annotations
 from enum import Enum, auto
 import random
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 
 class Suit(Enum):
@@ -40,39 +40,86 @@ class Rank(Enum):
     @property
     def symbol(self) -> str:
         """Return the display symbol for the rank."""
-        if self.value <= 10:
-            return str(self.value)
-        symbols = {
-            Rank.JACK: "J",
-            Rank.QUEEN: "Q",
-            Rank.KING: "K",
-            Rank.ACE: "A"
-        }
-        return symbols[self]
+        return _RANK_SYMBOLS[self]
+
+
+_RANK_SYMBOLS = {rank: str(rank.value) for rank in Rank if rank.value <= 10}
+_RANK_SYMBOLS.update({
+    Rank.JACK: "J",
+    Rank.QUEEN: "Q",
+    Rank.KING: "K",
+    Rank.ACE: "A"
+})
+
+
+# Cactus-Kev card encoding: one bit per rank (bits 16-28), one bit per suit
+# (bits 12-15), the rank index 0-12 (bits 8-11) and a prime per rank (bits 0-5)
+_RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_SUIT_BITS = {
+    Suit.CLUBS: 0x8000,
+    Suit.DIAMONDS: 0x4000,
+    Suit.HEARTS: 0x2000,
+    Suit.SPADES: 0x1000
+}
+# Lane of each suit in a card's 64-bit bitmask (clubs lowest)
+_SUIT_LANES = {
+    Suit.CLUBS: 0,
+    Suit.DIAMONDS: 1,
+    Suit.HEARTS: 2,
+    Suit.SPADES: 3
+}
+
+
+def _card_int(rank: Rank, suit: Suit) -> int:
+    """Cactus-Kev integer encoding of a card."""
+    index = rank.value - 2
+    return (1 << (16 + index)) | _SUIT_BITS[suit] | (index << 8) | _RANK_PRIMES[index]
+
+
+def _card_bitmask(rank: Rank, suit: Suit) -> int:
+    """Bit of a card in a 64-bit hand mask: one 16-bit lane per suit, bit 0-12 per rank."""
+    return 1 << (16 * _SUIT_LANES[suit] + rank.value - 2)
 
 
 class Card:
     """
     Represents a playing card with a rank and suit.
+    
+    Cards are interned: there is a single instance per rank and suit, which
+    every Card(rank, suit) call returns. Cards must therefore never be mutated.
     """
-    def __init__(self, rank: Rank, suit: Suit):
-        """Initialize a new card with the given rank and suit."""
-        self.rank = rank
-        self.suit = suit
+    _interned: Dict[Tuple[Rank, Suit], Card] = {}
+
+    def __new__(cls, rank: Rank, suit: Suit) -> Card:
+        """Return the card with the given rank and suit, creating it on first use."""
+        card = cls._interned.get((rank, suit))
+        if card is None:
+            card = super().__new__(cls)
+            card.rank = rank
+            card.suit = suit
+            card.int_value = _card_int(rank, suit)  # Cactus-Kev encoding, unique per card
+            card.bitmask = _card_bitmask(rank, suit)  # Single bit, OR-ed together into hand masks
+            card._label = f"{rank.symbol}{suit.value}"  # Display label, returned by __repr__
+            cls._interned[(rank, suit)] = card
+        return card
+
+    def __reduce__(self):
+        """Unpickle (e.g. from a worker process) to the interned card."""
+        return Card, (self.rank, self.suit)
 
     def __repr__(self) -> str:
         """String representation of the card."""
-        return f"{self.rank.symbol}{self.suit.value}"
+        return self._label
 
     def __eq__(self, other: object) -> bool:
         """Compare two cards for equality."""
         if not isinstance(other, Card):
             return NotImplemented
-        return self.rank == other.rank and self.suit == other.suit
+        return self.int_value == other.int_value
 
     def __hash__(self) -> int:
         """Hash value for the card."""
-        return hash((self.rank, self.suit))
+        return self.int_value
 
     @property
     def value(self) -> int:
@@ -80,6 +127,10 @@ class Card:
         return self.rank.value
 
 
+# The 52 cards in new-deck order, shared by every deck (cards are never mutated)
+CANONICAL_DECK: Tuple[Card, ...] = tuple(Card(rank, suit) for suit in Suit for rank in Rank)
+
+
 class Deck:
     """
     Represents a deck of 52 playing cards.
@@ -91,7 +142,7 @@ class Deck:
 
     def reset(self) -> None:
         """Reset the deck to its initial state."""
-        self.cards = [Card(rank, suit) for suit in Suit for rank in Rank]
+        self.cards = list(CANONICAL_DECK)
 
     def shuffle(self) -> None:
         """Shuffle the cards in the deck."""
@@ -4,7 +4,7 @@ Implements the main game logic for a poker hand.
 """
 from __future__ import annotations
 from enum import Enum, auto
-from typing import List, Dict, Optional, Tuple, Set, Any
+from typing import Callable, List, Dict, Optional, Tuple, Set, Any
 import uuid
 import logging
 from dataclasses import dataclass, field
@@ -89,7 +89,8 @@ class Game:
     """
     Manages a Texas Hold'em poker game.
     """
-    def __init__(self, game_id: str = None, table: Table = None, config: GameConfig = None):
+    def __init__(self, game_id: str = None, table: Table = None, config: GameConfig = None,
+                 deck_factory: Optional[Callable[[], Deck]] = None):
         """
         Initialize a new poker game.
         
@@ -97,10 +98,13 @@ class Game:
             game_id: Unique identifier for the game (auto-generated if None)
             table: Table object for the game
             config: Game configuration settings
+            deck_factory: Callable returning the deck for each hand
+                (a fresh shuffled deck if None)
         """
         self.game_id = game_id or str(uuid.uuid4())
         self.table = table or Table(str(uuid.uuid4()), "Default Table")
         self.config = config or GameConfig()
+        self.deck_factory = deck_factory
         
         self.state = GameState(
             game_id=self.game_id,
@@ -153,15 +157,15 @@ class Game:
         # Check if we have enough players
         active_count = sum(1 for p in self.table.seats if p is not None and p.chips > 0)
         if active_count < self.config.min_players:
-            self.logger.warning(f"Cannot start hand: need at least {self.config.min_players} players")
+            self.logger.warning("Cannot start hand: need at least %s players", self.config.min_players)
             return False
         
         self.state.hand_number += 1
-        self.logger.info(f"Starting hand #{self.state.hand_number}")
+        self.logger.info("Starting hand #%s", self.state.hand_number)
         
         # Reset the game state
         self.state.status = GameStatus.STARTING
-        self.state.deck = create_deck()
+        self.state.deck = self.deck_factory() if self.deck_factory else create_deck()
         self.state.community_cards = []
         self.state.pot = 0
         self.state.main_pot = 0
@@ -178,7 +182,7 @@ class Game:
         # Advance the dealer button
         old_dealer = self.table.dealer_position
         new_dealer = self.table.advance_dealer_button()
-        self.logger.info(f"Dealer button moved from position {old_dealer} to {new_dealer}")
+        self.logger.info("Dealer button moved from position %s to %s", old_dealer, new_dealer)
         
         # Assign dealer and blinds
         if self.table.dealer_position != -1:
@@ -199,7 +203,7 @@ class Game:
                 # Post small blind (will be limited by available chips)
                 sb_amount = sb_player.place_bet(self.config.small_blind)
                 self.state.pot += sb_amount
-                self.logger.info(f"Player {sb_player.name} posts small blind: {sb_amount}")
+                self.logger.info("Player %s posts small blind: %s", sb_player.name, sb_amount)
                 
                 self.state.action_history.append(ActionInfo(
                     player_id=sb_player.id,
@@ -211,7 +215,7 @@ class Game:
                 bb_amount = bb_player.place_bet(self.config.big_blind)
                 self.state.pot += bb_amount
                 self.state.current_bet = bb_amount  # Set the current bet to the BB amount (could be less if all-in)
-                self.logger.info(f"Player {bb_player.name} posts big blind: {bb_amount}")
+                self.logger.info("Player %s posts big blind: %s", bb_player.name, bb_amount)
                 
                 self.state.action_history.append(ActionInfo(
                     player_id=bb_player.id,
@@ -229,7 +233,7 @@ class Game:
                 if player is not None and player.status == PlayerStatus.ACTIVE:
                     ante_amount = player.place_bet(self.config.ante)
                     self.state.pot += ante_amount
-                    self.logger.info(f"Player {player.name} posts ante: {ante_amount}")
+                    self.logger.info("Player %s posts ante: %s", player.name, ante_amount)
                     
         # Calculate initial pots after blinds and antes
         self._update_pots()
@@ -251,7 +255,7 @@ class Game:
                    self.table.get_player_at_position(self.state.current_player_idx).status != PlayerStatus.ACTIVE)):
                 self.state.current_player_idx = (self.state.current_player_idx + 1) % self.table.max_seats
         
-        self.logger.info(f"Hand #{self.state.hand_number} started successfully")
+        self.logger.info("Hand #%s started successfully", self.state.hand_number)
         return True
     
     def _deal_hole_cards(self) -> None:
@@ -376,20 +380,16 @@ class Game:
             return False
         
         # Find the player
-        player = None
-        for p in self.table.seats:
-            if p is not None and p.id == player_id:
-                player = p
-                break
+        player = self.table.get_player(player_id)
         
         if player is None:
-            self.logger.warning(f"Player {player_id} not found")
+            self.logger.warning("Player %s not found", player_id)
             return False
         
         # Check if it's the player's turn
         current_player = self.table.get_player_at_position(self.state.current_player_idx)
         if current_player is None or current_player.id != player_id:
-            self.logger.warning(f"Not {player.name}'s turn to act")
+            self.logger.warning("Not %s's turn to act", player.name)
             return False
         
         # Process the action
@@ -399,20 +399,20 @@ class Game:
         if action == GameAction.FOLD:
             # Can only fold if there's a bet to call
             if self.state.current_bet <= player.current_bet:
-                self.logger.warning(f"Player {player.name} cannot fold, must check")
+                self.logger.warning("Player %s cannot fold, must check", player.name)
                 return False
                 
             player.fold()
-            self.logger.info(f"Player {player.name} folds")
+            self.logger.info("Player %s folds", player.name)
             action_successful = True
         
         elif action == GameAction.CHECK:
             # Can only check if current bet is 0 or player has already matched it
             if self.state.current_bet <= player.current_bet:
-                self.logger.info(f"Player {player.name} checks")
+                self.logger.info("Player %s checks", player.name)
                 action_successful = True
             else:
-                self.logger.warning(f"Player {player.name} cannot check")
+                self.logger.warning("Player %s cannot check", player.name)
                 return False
         
         elif action == GameAction.CALL:
@@ -420,7 +420,7 @@ class Game:
             call_amount = self.state.current_bet - player.current_bet
             if call_amount <= 0:
                 # Player has already matched the current bet, treat as check
-                self.logger.info(f"Player {player.name} checks (no need to call)")
+                self.logger.info("Player %s checks (no need to call)", player.name)
                 action_info.action = GameAction.CHECK
                 action_successful = True
             else:
@@ -431,17 +431,17 @@ class Game:
                 
                 if actual_amount < call_amount and player.chips == 0:
                     # Player couldn't match the full bet - they're all in
-                    self.logger.info(f"Player {player.name} calls {actual_amount} and is all-in")
+                    self.logger.info("Player %s calls %s and is all-in", player.name, actual_amount)
                     action_info.action = GameAction.ALL_IN
                 else:
-                    self.logger.info(f"Player {player.name} calls {actual_amount}")
+                    self.logger.info("Player %s calls %s", player.name, actual_amount)
                 
                 action_successful = True
         
         elif action == GameAction.BET:
             # Can only bet if no previous bet in this round
             if self.state.current_bet > 0:
-                self.logger.warning(f"Player {player.name} cannot bet, must raise")
+                self.logger.warning("Player %s cannot bet, must raise", player.name)
                 return False
             
             # Ensure minimum bet
@@ -461,10 +461,10 @@ class Game:
                     p.has_acted = False
             
             if player.chips == 0:
-                self.logger.info(f"Player {player.name} bets {actual_amount} and is all-in")
+                self.logger.info("Player %s bets %s and is all-in", player.name, actual_amount)
                 action_info.action = GameAction.ALL_IN
             else:
-                self.logger.info(f"Player {player.name} bets {actual_amount}")
+                self.logger.info("Player %s bets %s", player.name, actual_amount)
             
             action_successful = True
         
@@ -497,19 +497,19 @@ class Game:
                 action_info.amount = actual_amount
                 
                 if player.chips == 0:
-                    self.logger.info(f"Player {player.name} raises to {new_bet} and is all-in")
+                    self.logger.info("Player %s raises to %s and is all-in", player.name, new_bet)
                     action_info.action = GameAction.ALL_IN
                 else:
-                    self.logger.info(f"Player {player.name} raises to {new_bet}")
+                    self.logger.info("Player %s raises to %s", player.name, new_bet)
                 
                 action_successful = True
             else:
                 # Player couldn't raise enough, treat as call/all-in
                 if player.chips == 0:
-                    self.logger.info(f"Player {player.name} calls {actual_amount} and is all-in")
+                    self.logger.info("Player %s calls %s and is all-in", player.name, actual_amount)
                     action_info.action = GameAction.ALL_IN
                 else:
-                    self.logger.info(f"Player {player.name} calls {actual_amount}")
+                    self.logger.info("Player %s calls %s", player.name, actual_amount)
                     action_info.action = GameAction.CALL
                 
                 action_successful = True
@@ -517,7 +517,7 @@ class Game:
         elif action == GameAction.ALL_IN:
             # Player is going all-in
             if player.chips == 0:
-                self.logger.warning(f"Player {player.name} is already all-in")
+                self.logger.warning("Player %s is already all-in", player.name)
                 return False
             
             actual_amount = player.place_bet(player.chips)  # Bet everything
@@ -539,10 +539,10 @@ class Game:
                         if p is not None and p.id != player.id and p.status == PlayerStatus.ACTIVE:
                             p.has_acted = False
                 
-                self.logger.info(f"Player {player.name} raises to {new_bet} (all-in)")
+                self.logger.info("Player %s raises to %s (all-in)", player.name, new_bet)
             else:
                 # This all-in is a call or less than a call
-                self.logger.info(f"Player {player.name} calls {actual_amount} (all-in)")
+                self.logger.info("Player %s calls %s (all-in)", player.name, actual_amount)
             
             action_successful = True
         
@@ -617,9 +617,7 @@ class Game:
     def _advance_betting_round(self) -> None:
         """Advance to the next betting round or showdown."""
         # Reset player acted flags and bet amounts for the new round
-        for player in self.table.seats:
-            if player is not None:
-                player.reset_for_new_betting_round()
+        Player.reset_all_for_new_betting_round(p for p in self.table.seats if p is not None)
         
         # Check if only one player remains
         active_players = [p for p in self.table.seats if p is not None and 
@@ -722,7 +720,7 @@ class Game:
         if len(active_players) == 1:
             winner = active_players[0]
             winner.add_chips(self.state.pot)
-            self.logger.info(f"Player {winner.name} wins {self.state.pot} (uncontested)")
+            self.logger.info("Player %s wins %s (uncontested)", winner.name, self.state.pot)
             
             self.state.status = GameStatus.FINISHED
             self.state.pot = 0
@@ -730,21 +728,24 @@ class Game:
         
         # Evaluate hands and determine winners
         player_hands = {}
-        for player in active_players:
+        scores = HandEvaluator.evaluate_fast_many(
+            [player.hand.cards for player in active_players], self.state.community_cards)
+        for player, score in zip(active_players, scores):
             # Combine hole cards and community cards
             all_cards = player.hand.cards + self.state.community_cards
             
-            # Evaluate the best hand
+            # Evaluate the best hand for display; the score decides the pots
             hand_rank, best_cards, description = HandEvaluator.evaluate(all_cards)
             
             player_hands[player.id] = {
                 "player": player,
                 "hand_rank": hand_rank,
                 "best_cards": best_cards,
-                "description": description
+                "description": description,
+                "score": score
             }
             
-            self.logger.info(f"Player {player.name}: {description}")
+            self.logger.info("Player %s: %s", player.name, description)
         
         # Determine winners using side pots if needed
         self._calculate_and_award_pots(player_hands)
@@ -817,38 +818,13 @@ class Game:
             eligible_players = [player_hands[p_id] for p_id in eligible_ids if p_id in player_hands]
             
             if not eligible_players:
-                self.logger.warning(f"No eligible players found for pot {i+1}")
+                self.logger.warning("No eligible players found for pot %s", i+1)
                 continue
             
-            # Find the best hand(s)
-            best_rank = max(p["hand_rank"] for p in eligible_players)
-            best_players = [p for p in eligible_players if p["hand_rank"] == best_rank]
-            
-            # If tie, compare kickers
-            if len(best_players) > 1:
-                # Use HandEvaluator._get_kicker_key to compare hands
-                best_key = None
-                true_best_players = []
-                
-                for player_hand in best_players:
-                    player = player_hand["player"]
-                    best_cards = player_hand["best_cards"]
-                    hand_rank = player_hand["hand_rank"]
-                    
-                    # Get kicker key for this hand
-                    key = HandEvaluator._get_kicker_key(best_cards, hand_rank)
-                    
-                    # If this is the first player or this hand is better
-                    if best_key is None or key > best_key:
-                        best_key = key
-                        true_best_players = [player_hand]
-                    elif key == best_key:
-                        # True tie
-                        true_best_players.append(player_hand)
-                
-                winners = true_best_players
-            else:
-                winners = best_players
+            # Find the best hand(s): the scores order hands by rank, then
+            # kickers, so equal scores are exact ties
+            winners = [eligible_players[i] for i in
+                       HandEvaluator.winning_indices([p["score"] for p in eligible_players])]
             
             # Award pot to winner(s)
             amount_per_winner = pot_amount // len(winners)
@@ -862,7 +838,7 @@ class Game:
                 # Update player statistics
                 player.update_statistics(True, win_amount, winner["description"])
                 
-                self.logger.info(f"Player {player.name} wins {win_amount} with {winner['description']}")
+                self.logger.info("Player %s wins %s with %s", player.name, win_amount, winner['description'])
         
         # Update statistics for non-winners
         for player in all_players:
@@ -885,11 +861,7 @@ class Game:
         actions = {}
         
         # Find the player
-        player = None
-        for p in self.table.seats:
-            if p is not None and p.id == player_id:
-                player = p
-                break
+        player = self.table.get_player(player_id)
         
         if player is None or self.state.status != GameStatus.BETTING:
             return actions
@@ -929,23 +901,19 @@ class Game:
         
         return actions
     
-    def get_game_state_for_player(self, player_id: str) -> Dict[str, Any]:
+    def get_public_state(self) -> Dict[str, Any]:
         """
-        Get the visible game state for a specific player.
-        
-        Args:
-            player_id: ID of the player
-            
+        Get the game state as seen by someone with no cards in the hand.
+
+        Hole cards are hidden unless the hand is at showdown, and there are no
+        available actions. get_game_state_for_player adds one player's view on
+        top, so a broadcast can build this once and share it between players.
+
         Returns:
-            Dictionary with visible game state
+            Dictionary with the public game state
         """
-        # Find the player
-        target_player = None
-        for p in self.table.seats:
-            if p is not None and p.id == player_id:
-                target_player = p
-                break
-        
+        showdown = self.state.status == GameStatus.SHOWDOWN
+
         # Basic game state info
         state = {
             "game_id": self.game_id,
@@ -959,20 +927,20 @@ class Game:
             "community_cards": [str(card) for card in self.state.community_cards],
             "players": [],
             "current_player_idx": self.state.current_player_idx,
-            "available_actions": {} if target_player else {},
+            "available_actions": {},
             "blinds": {
                 "small_blind": self.config.small_blind,
                 "big_blind": self.config.big_blind,
                 "ante": self.config.ante
             }
         }
-        
+
         # Add player information
-        for i, player in enumerate(self.table.seats):
+        for player in self.table.seats:
             if player is None:
                 state["players"].append(None)
                 continue
-            
+
             player_info = {
                 "id": player.id,
                 "name": player.name,
@@ -987,17 +955,51 @@ class Game:
                 "has_acted": player.has_acted,
                 "avatar": player.avatar
             }
-            
-            # Only show hole cards to their owner or at showdown
-            if player.id == player_id or self.state.status == GameStatus.SHOWDOWN:
+
+            # Hole cards are only public at showdown
+            if showdown:
                 player_info["cards"] = [str(card) for card in player.hand.cards]
             else:
                 player_info["cards"] = ["??"] * len(player.hand.cards)
-            
+
             state["players"].append(player_info)
-        
+
+        return state
+
+    def get_game_state_for_player(self, player_id: str,
+                                  public_state: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Get the visible game state for a specific player.
+
+        Args:
+            player_id: ID of the player
+            public_state: A current get_public_state() result to build on, so that
+                several players' views can share it (built here if omitted)
+
+        Returns:
+            Dictionary with visible game state
+        """
+        if public_state is None:
+            public_state = self.get_public_state()
+
+        state = dict(public_state)
+
+        # Find the player
+        target_player = self.table.get_player(player_id)
+        if target_player is None:
+            state["available_actions"] = {}
+            return state
+
+        # Show the player their own hole cards
+        if self.state.status != GameStatus.SHOWDOWN:
+            players = list(state["players"])
+            for i, player_info in enumerate(players):
+                if player_info is not None and player_info["id"] == player_id:
+                    players[i] = dict(player_info, cards=[str(card) for card in target_player.hand.cards])
+                    break
+            state["players"] = players
+
         # Add available actions if it's the player's turn
-        if target_player:
-            state["available_actions"] = self.get_available_actions(player_id)
-        
+        state["available_actions"] = self.get_available_actions(player_id)
+
         return state
\ No newline at end of file
@@ -6,7 +6,6 @@ from __future__ import annotations
 from enum import IntEnum
 from typing import List, Tuple, Dict, Set, Optional
 from collections import Counter
-from itertools import combinations
 
 from core.card import Card, Rank, Suit
 
@@ -28,6 +27,48 @@ class HandRank(IntEnum):
     ROYAL_FLUSH = 10
 
 
+def _build_rank_mask_tables() -> Tuple[Tuple[Tuple[int, ...], ...], Tuple[int, ...]]:
+    """
+    Precompute lookups over 13-bit rank masks (bit 0 = two, bit 12 = ace).
+    
+    Returns:
+        A tuple containing:
+        - For each mask, the rank values it contains, highest first
+        - For each mask, the high card value of the best straight it contains (0 if none)
+    """
+    ranks_by_mask = []
+    straight_by_mask = []
+    wheel = 0b1000000001111  # A-2-3-4-5
+    for mask in range(1 << 13):
+        ranks_by_mask.append(tuple(bit + 2 for bit in range(12, -1, -1) if mask >> bit & 1))
+        high = 0
+        for top_bit in range(12, 3, -1):
+            straight = 0b11111 << (top_bit - 4)
+            if mask & straight == straight:
+                high = top_bit + 2
+                break
+        else:
+            if mask & wheel == wheel:
+                high = 5
+        straight_by_mask.append(high)
+    return tuple(ranks_by_mask), tuple(straight_by_mask)
+
+
+_RANKS_BY_MASK, _STRAIGHT_HIGH_BY_MASK = _build_rank_mask_tables()
+# How many cards of each rank named in a score (highest nibble first) make up
+# the best hand, for the hand ranks that cannot contain a flush or straight
+_RANK_COUNTS = {
+    HandRank.FOUR_OF_A_KIND: (4, 1),
+    HandRank.FULL_HOUSE: (3, 2),
+    HandRank.THREE_OF_A_KIND: (3, 1, 1),
+    HandRank.TWO_PAIR: (2, 2, 1),
+    HandRank.PAIR: (2, 1, 1, 1),
+    HandRank.HIGH_CARD: (1, 1, 1, 1, 1)
+}
+# Suit bit of a card's Cactus-Kev int_value -> index into the clubs/diamonds/hearts/spades masks
+_SUIT_INDEX = {0x8000: 0, 0x4000: 1, 0x2000: 2, 0x1000: 3}
+
+
 class Hand:
     """
     Represents a poker hand with evaluation logic.
@@ -71,7 +112,7 @@ class HandEvaluator:
             raise ValueError("At least 5 cards are required for evaluation")
 
         # Special handling for straights and flushes
-        # Check if we have a straight or flush before generating all combinations
+        # Check if we have a straight or flush before looking at ranks alone
         all_suits = [card.suit for card in cards]
         most_common_suit = Counter(all_suits).most_common(1)[0]
         has_flush_possibility = most_common_suit[1] >= 5
@@ -92,7 +133,7 @@ class HandEvaluator:
                 is_straight = HandEvaluator._is_straight(ranks)
                 
                 # Special case: A-5 straight flush (wheel)
-                if not is_straight and set(ranks) & {14} and sorted(ranks) == [14, 5, 4, 3, 2]:
+                if not is_straight and sorted(ranks, reverse=True) == [14, 5, 4, 3, 2]:
                     # Adjust the order of cards for the wheel
                     ace = next(card for card in best_flush_cards if card.value == 14)
                     best_flush_cards.remove(ace)
@@ -161,36 +202,209 @@ class HandEvaluator:
             high_card_str = "5" if highest_straight_rank == 5 and 14 in [c.value for c in best_straight_cards] else high_card_symbol
             return HandRank.STRAIGHT, best_straight_cards, f"Straight, {high_card_str} high"
         
-        # Generate all possible 5-card combinations for other hand types
-        five_card_combinations = list(combinations(cards, 5))
-        
-        # Evaluate each combination
-        best_rank = HandRank.HIGH_CARD
-        best_hand = None
+        # No flush or straight is possible, so the best hand only depends on
+        # ranks: the score names each rank it uses, and the hand takes the
+        # earliest cards of those ranks (the first matching 5-card combination)
+        best_score = HandEvaluator.evaluate_fast(cards)
+        needed = {}
+        for shift, count in zip((16, 12, 8, 4, 0), _RANK_COUNTS[best_score >> 20]):
+            needed[best_score >> shift & 0xF] = count
         best_cards = []
-        best_key = []
+        for card in cards:
+            if needed.get(card.value):
+                needed[card.value] -= 1
+                best_cards.append(card)
+        best_rank, best_hand = HandEvaluator._evaluate_five_card_hand(best_cards)
+        return best_rank, best_cards, best_hand
+
+    @staticmethod
+    def evaluate_fast(cards: List[Card]) -> int:
+        """
+        Score the best 5-card poker hand from the given cards without building it.
         
-        for combo in five_card_combinations:
-            combo_cards = list(combo)
-            rank, description = HandEvaluator._evaluate_five_card_hand(combo_cards)
+        Higher scores are better hands and equal scores are ties. The hand rank is
+        score >> 20; the lower 20 bits hold up to five rank values (4 bits each)
+        that break ties within the hand rank.
+        
+        Args:
+            cards: A list of 5 to 7 cards
             
-            # Generate kicker key for proper comparison
-            current_key = HandEvaluator._get_kicker_key(combo_cards, rank)
+        Returns:
+            The hand score
+        """
+        hand_mask = 0
+        for card in cards:
+            hand_mask |= card.bitmask
+        return HandEvaluator.evaluate_bits(hand_mask)
+
+    @staticmethod
+    def evaluate_bits(hand_mask: int) -> int:
+        """
+        Score a hand given as a 64-bit mask, the OR of its cards' bitmasks.
+        
+        Each suit occupies a 16-bit lane (clubs lowest) holding one bit per rank,
+        so a flush is a lane with five bits set and a straight is five adjacent
+        bits in the OR of the lanes.
+        
+        Args:
+            hand_mask: The combined bitmask of 5 to 7 cards
             
-            # Update best hand if this one is better
-            if rank > best_rank:
-                best_rank = rank
-                best_hand = description
-                best_cards = combo_cards
-                best_key = current_key
-            elif rank == best_rank:
-                # If same rank, compare kickers
-                if current_key > best_key:
-                    best_cards = combo_cards
-                    best_hand = description
-                    best_key = current_key
+        Returns:
+            The evaluate_fast score of the hand
+        """
+        return HandEvaluator._score_suit_masks(
+            hand_mask & 0x1FFF,
+            hand_mask >> 16 & 0x1FFF,
+            hand_mask >> 32 & 0x1FFF,
+            hand_mask >> 48
+        )
+
+    @staticmethod
+    def precompute_board(community_cards: List[Card]) -> Tuple[int, int, int, int]:
+        """
+        Reduce the community cards to the rank mask held in each suit.
         
-        return best_rank, best_cards, best_hand
+        Args:
+            community_cards: The shared community cards
+            
+        Returns:
+            The clubs, diamonds, hearts and spades rank masks, for evaluate_with_board
+        """
+        board_masks = [0, 0, 0, 0]
+        for card in community_cards:
+            value = card.int_value
+            board_masks[_SUIT_INDEX[value & 0xF000]] |= value >> 16
+        return tuple(board_masks)
+
+    @staticmethod
+    def evaluate_with_board(hole_cards: List[Card], board: Tuple[int, int, int, int]) -> int:
+        """
+        Score a player's hand against a board reduced by precompute_board.
+        
+        Args:
+            hole_cards: The player's hole cards
+            board: Suit masks of the community cards
+            
+        Returns:
+            The evaluate_fast score of the hole cards plus the board
+        """
+        clubs, diamonds, hearts, spades = board
+        for card in hole_cards:
+            value = card.int_value
+            suit = value & 0xF000
+            if suit == 0x8000:
+                clubs |= value >> 16
+            elif suit == 0x4000:
+                diamonds |= value >> 16
+            elif suit == 0x2000:
+                hearts |= value >> 16
+            else:
+                spades |= value >> 16
+        return HandEvaluator._score_suit_masks(clubs, diamonds, hearts, spades)
+
+    @staticmethod
+    def evaluate_fast_many(hole_cards: List[List[Card]], community_cards: List[Card]) -> List[int]:
+        """
+        Score several players' hands that share the same community cards.
+        
+        The community cards are reduced to suit masks once; each player only adds
+        their own hole cards on top.
+        
+        Args:
+            hole_cards: Each player's hole cards
+            community_cards: The shared community cards
+            
+        Returns:
+            The evaluate_fast score of each player's hand, in the same order
+        """
+        board = HandEvaluator.precompute_board(community_cards)
+        evaluate_with_board = HandEvaluator.evaluate_with_board
+        return [evaluate_with_board(cards, board) for cards in hole_cards]
+
+    @staticmethod
+    def winning_indices(scores: List[int]) -> List[int]:
+        """
+        Find the winners among evaluate_fast scores.
+        
+        Args:
+            scores: One hand score per player
+            
+        Returns:
+            The indices of every score tied for the best, in order
+        """
+        best_score = max(scores)
+        return [i for i, score in enumerate(scores) if score == best_score]
+
+    @staticmethod
+    def _score_suit_masks(clubs: int, diamonds: int, hearts: int, spades: int) -> int:
+        """Score a hand given the rank mask held in each suit."""
+        ranks_by_mask = _RANKS_BY_MASK
+        straight_high = _STRAIGHT_HIGH_BY_MASK
+        
+        # A rank is held as many times as the number of suit masks it appears in
+        any_mask = clubs | diamonds | hearts | spades
+        two_mask = ((clubs & diamonds) | (clubs & hearts) | (clubs & spades) |
+                    (diamonds & hearts) | (diamonds & spades) | (hearts & spades))
+        three_mask = ((clubs & diamonds & (hearts | spades)) |
+                      (hearts & spades & (clubs | diamonds)))
+        four_mask = clubs & diamonds & hearts & spades
+        
+        flush_mask = 0
+        for suit_mask in (clubs, diamonds, hearts, spades):
+            if len(ranks_by_mask[suit_mask]) >= 5:
+                flush_mask = suit_mask
+                break
+        
+        if flush_mask:
+            high = straight_high[flush_mask]
+            if high == 14:
+                return HandRank.ROYAL_FLUSH << 20 | high << 16
+            if high:
+                return HandRank.STRAIGHT_FLUSH << 20 | high << 16
+        
+        if four_mask:
+            quads = ranks_by_mask[four_mask][0]
+            kicker = ranks_by_mask[any_mask & ~(1 << (quads - 2))][0]
+            return HandRank.FOUR_OF_A_KIND << 20 | quads << 16 | kicker << 12
+        
+        if three_mask:
+            trips = ranks_by_mask[three_mask][0]
+            pair_mask = two_mask & ~(1 << (trips - 2))
+            if pair_mask:
+                return HandRank.FULL_HOUSE << 20 | trips << 16 | ranks_by_mask[pair_mask][0] << 12
+        
+        if flush_mask:
+            score = HandRank.FLUSH
+            for rank in ranks_by_mask[flush_mask][:5]:
+                score = score << 4 | rank
+            return score
+        
+        high = straight_high[any_mask]
+        if high:
+            return HandRank.STRAIGHT << 20 | high << 16
+        
+        if three_mask:
+            score = HandRank.THREE_OF_A_KIND << 4 | trips
+            for rank in ranks_by_mask[any_mask & ~three_mask][:2]:
+                score = score << 4 | rank
+            return score << 8
+        
+        if two_mask:
+            pairs = ranks_by_mask[two_mask]
+            if len(pairs) >= 2:
+                high_pair, low_pair = pairs[0], pairs[1]
+                kicker = ranks_by_mask[any_mask & ~(1 << (high_pair - 2)) & ~(1 << (low_pair - 2))][0]
+                return (HandRank.TWO_PAIR << 20 | high_pair << 16 | low_pair << 12 |
+                        kicker << 8)
+            score = HandRank.PAIR << 4 | pairs[0]
+            for rank in ranks_by_mask[any_mask & ~two_mask][:3]:
+                score = score << 4 | rank
+            return score << 4
+        
+        score = HandRank.HIGH_CARD
+        for rank in ranks_by_mask[any_mask][:5]:
+            score = score << 4 | rank
+        return score
 
     @staticmethod
     def _evaluate_five_card_hand(cards: List[Card]) -> Tuple[HandRank, str]:
@@ -353,4 +567,8 @@ class HandEvaluator:
         else:
             # For straights, flushes, straight flushes, and high cards,
             # just compare the ranks in descending order
-            return [c.value for c in sorted_cards]
\ No newline at end of file
+            values = [c.value for c in sorted_cards]
+            if hand_rank in (HandRank.STRAIGHT, HandRank.STRAIGHT_FLUSH) and values == [14, 5, 4, 3, 2]:
+                # The ace plays low in a wheel, below every other straight
+                return [5, 4, 3, 2, 1]
+            return values
\ No newline at end of file
@@ -4,7 +4,7 @@ Implements Player class and related functionality.
 """
 from __future__ import annotations
 from enum import Enum, auto
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable
 from dataclasses import dataclass, field
 import uuid
 
@@ -25,8 +25,13 @@ class Player:
     """
     Represents a player in the poker game.
     """
+    __slots__ = ("id", "name", "chips", "avatar", "hand", "_table", "_status",
+                 "current_bet", "total_bet", "position", "is_dealer", "is_small_blind",
+                 "is_big_blind", "has_acted", "statistics")
+
     def __init__(self, player_id: str = None, name: str = "Player", 
-                 chips: int = 0, avatar: str = None):
+                 chips: int = 0, avatar: str = None,
+                 status: PlayerStatus = PlayerStatus.SITTING_OUT):
         """
         Initialize a new player.
         
@@ -35,13 +40,15 @@ class Player:
             name: Display name for the player
             chips: Starting chip count
             avatar: Path or URL to player's avatar image
+            status: Starting status (sitting out by default)
         """
         self.id = player_id or str(uuid.uuid4())
         self.name = name
         self.chips = chips
         self.avatar = avatar
         self.hand = Hand()
-        self.status = PlayerStatus.SITTING_OUT
+        self._table = None  # Table the player is seated at, notified of status changes
+        self._status = status
         self.current_bet = 0  # Amount bet in the current round
         self.total_bet = 0    # Total amount bet in the current hand
         self.position = -1    # Seat position at the table
@@ -57,6 +64,19 @@ class Player:
             "biggest_pot": 0
         }
 
+    @property
+    def status(self) -> PlayerStatus:
+        """The player's current status."""
+        return self._status
+    
+    @status.setter
+    def status(self, status: PlayerStatus) -> None:
+        """Set the player's status, letting their table update its counters."""
+        old_status = self._status
+        self._status = status
+        if self._table is not None and old_status is not status:
+            self._table._on_status_change(self, old_status, status)
+
     def __repr__(self) -> str:
         """String representation of the player."""
         return f"Player({self.name}, {self.chips} chips, {self.status.name})"
@@ -124,6 +144,13 @@ class Player:
         self.current_bet = 0
         self.has_acted = False
 
+    @staticmethod
+    def reset_all_for_new_betting_round(players: Iterable[Player]) -> None:
+        """Reset several players for a new betting round in one pass."""
+        for player in players:
+            player.current_bet = 0
+            player.has_acted = False
+
     def can_act(self) -> bool:
         """Check if the player can act in the current round."""
         return (self.status == PlayerStatus.ACTIVE and 
@@ -4,10 +4,29 @@ Implements Table class for managing players and seats.
 """
 from __future__ import annotations
 from typing import List, Dict, Optional, Tuple, Set
+from bisect import bisect_right
+from functools import lru_cache
 import random
 
 from core.player import Player, PlayerStatus
 
+# Statuses of players still in the hand
+_IN_HAND_STATUSES = frozenset((PlayerStatus.ACTIVE, PlayerStatus.ALL_IN))
+
+
+@lru_cache(maxsize=None)
+def _ring_orders(max_seats: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Precompute the clockwise seat order after each position for a table size.
+    
+    Entry i lists the seats after seat i, wrapping around and ending with i
+    itself. Entry -1 (the last one) is therefore plain seat order.
+    """
+    return tuple(
+        tuple(range(start + 1, max_seats)) + tuple(range(0, start + 1))
+        for start in range(max_seats)
+    )
+
 
 class Table:
     """
@@ -25,14 +44,62 @@ class Table:
         self.id = table_id
         self.name = name
         self.max_seats = max_seats
-        self.seats: List[Optional[Player]] = [None] * max_seats
+        self._ring_orders = _ring_orders(max_seats)
+        self._seats: List[Optional[Player]] = [None] * max_seats
+        self._all_seats_mask = (1 << max_seats) - 1
+        self._occupied = 0  # Bit i is set while seat i is taken
+        self._occupied_players: List[Player] = []  # Seated players in seat order
+        self._players_by_id: Dict[str, Player] = {}  # Seated players by player ID
+        self._positions_by_id: Dict[str, int] = {}  # Seat positions by player ID
+        self._active_count = 0  # Seated players who are not eliminated
+        self._in_hand_count = 0  # Seated players who are active or all-in
+        self._in_hand: Optional[List[Player]] = None  # Cached get_players_in_hand result
         self.dealer_position = -1  # Position of the dealer button
         self.active_players: List[Player] = []  # Players currently in the hand
+        self._active_positions: List[int] = []  # Seat positions parallel to active_players
+        self._active_wrap_idx = 0  # Index where active_players wraps past the last seat
+    
+    @property
+    def seats(self) -> List[Optional[Player]]:
+        """The seat list, indexed by position (None for an empty seat)."""
+        return self._seats
+    
+    @seats.setter
+    def seats(self, seats: List[Optional[Player]]) -> None:
+        """Replace the seat list and rebuild the derived seat indexes."""
+        for player in self._occupied_players:
+            player._table = None
+        self._seats = seats
+        self._occupied_players = [seat for seat in seats if seat is not None]
+        self._occupied = sum(1 << i for i, seat in enumerate(seats) if seat is not None)
+        self._players_by_id = {player.id: player for player in self._occupied_players}
+        self._positions_by_id = {seat.id: i for i, seat in enumerate(seats) if seat is not None}
+        for player in self._occupied_players:
+            player._table = self
+        self._active_count = sum(1 for p in self._occupied_players
+                                 if p.status != PlayerStatus.ELIMINATED)
+        self._in_hand_count = sum(1 for p in self._occupied_players
+                                  if p.status in _IN_HAND_STATUSES)
+        self._in_hand = None
+    
+    @property
+    def active_count(self) -> int:
+        """Number of seated players who have not been eliminated."""
+        return self._active_count
+    
+    def _on_status_change(self, player: Player, old_status: PlayerStatus,
+                          new_status: PlayerStatus) -> None:
+        """Keep the seat counters in sync when a seated player's status changes."""
+        self._in_hand = None
+        self._in_hand_count += (new_status in _IN_HAND_STATUSES) - (old_status in _IN_HAND_STATUSES)
+        if old_status == PlayerStatus.ELIMINATED:
+            self._active_count += 1
+        elif new_status == PlayerStatus.ELIMINATED:
+            self._active_count -= 1
         
     def __repr__(self) -> str:
         """String representation of the table."""
-        occupied = sum(1 for seat in self.seats if seat is not None)
-        return f"Table({self.name}, {occupied}/{self.max_seats} players)"
+        return f"Table({self.name}, {self.player_count()}/{self.max_seats} players)"
     
     def add_player(self, player: Player, position: int = -1) -> bool:
         """
@@ -44,20 +111,29 @@ class Table:
         """
         # If no position specified, find the first available seat
         if position == -1:
-            for i, seat in enumerate(self.seats):
-                if seat is None:
-                    position = i
-                    break
-            else:
+            free = ~self._occupied & self._all_seats_mask
+            if not free:
                 return False  # No seats available
+            position = (free & -free).bit_length() - 1
         
         # Check if the position is valid and available
-        if position < 0 or position >= self.max_seats or self.seats[position] is not None:
+        if position < 0 or position >= self.max_seats or self._occupied >> position & 1:
             return False
         
-        # Add the player to the table
+        # Add the player to the table, keeping the occupied list in seat order
         self.seats[position] = player
+        self._occupied |= 1 << position
         player.position = position
+        index = sum(1 for p in self._occupied_players if p.position < position)
+        self._occupied_players.insert(index, player)
+        self._players_by_id[player.id] = player
+        self._positions_by_id[player.id] = position
+        player._table = self
+        if player.status != PlayerStatus.ELIMINATED:
+            self._active_count += 1
+        if player.status in _IN_HAND_STATUSES:
+            self._in_hand_count += 1
+        self._in_hand = None
         return True
     
     def remove_player(self, player: Player) -> bool:
@@ -70,10 +146,25 @@ class Table:
         position = player.position
         if position >= 0 and position < self.max_seats and self.seats[position] == player:
             self.seats[position] = None
+            self._occupied &= ~(1 << position)
+            self._occupied_players.remove(player)
+            if self._players_by_id.get(player.id) is player:
+                del self._players_by_id[player.id]
+                del self._positions_by_id[player.id]
+            player._table = None
+            if player.status != PlayerStatus.ELIMINATED:
+                self._active_count -= 1
+            if player.status in _IN_HAND_STATUSES:
+                self._in_hand_count -= 1
+            self._in_hand = None
             player.position = -1
             return True
         return False
     
+    def get_player(self, player_id: str) -> Optional[Player]:
+        """Get the seated player with the given ID."""
+        return self._players_by_id.get(player_id)
+    
     def get_player_at_position(self, position: int) -> Optional[Player]:
         """Get the player at the specified position."""
         if 0 <= position < self.max_seats:
@@ -87,32 +178,58 @@ class Table:
         Returns:
             Dictionary mapping player IDs to seat positions
         """
-        result = {}
-        for i, player in enumerate(self.seats):
-            if player is not None:
-                result[player.id] = i
-        return result
+        return dict(self._positions_by_id)
     
     def get_empty_seats(self) -> List[int]:
         """Get a list of empty seat positions."""
-        return [i for i, seat in enumerate(self.seats) if seat is None]
+        empty = []
+        free = ~self._occupied & self._all_seats_mask
+        while free:
+            lowest = free & -free
+            empty.append(lowest.bit_length() - 1)
+            free ^= lowest
+        return empty
     
     def is_full(self) -> bool:
         """Check if the table is full."""
-        return None not in self.seats
+        return self._occupied == self._all_seats_mask
     
     def is_empty(self) -> bool:
         """Check if the table is empty."""
-        return all(seat is None for seat in self.seats)
+        return self._occupied == 0
     
     def player_count(self) -> int:
         """Get the number of players at the table."""
-        return sum(1 for seat in self.seats if seat is not None)
+        return self._occupied.bit_count()
     
     def active_player_count(self) -> int:
         """Get the number of active players at the table."""
-        return sum(1 for seat in self.seats if seat is not None and 
-                  seat.status in (PlayerStatus.ACTIVE, PlayerStatus.ALL_IN))
+        return self._in_hand_count
+    
+    def _is_button_eligible(self, position: int) -> bool:
+        """Check if the seat at the given position can hold the button or post a blind."""
+        if not 0 <= position < self.max_seats:
+            return False
+        seat = self.seats[position]
+        return seat is not None and seat.status != PlayerStatus.ELIMINATED and seat.chips > 0
+    
+    def _next_button_position(self, from_position: int) -> int:
+        """
+        Find the next button-eligible seat after the specified position, wrapping around.
+        The starting seat itself is checked last, so a lone eligible seat finds itself.
+        
+        Args:
+            from_position: Starting position (-1 to start from the first seat)
+            
+        Returns:
+            The position of the next eligible seat, or -1 if there is none
+        """
+        seats = self.seats
+        for position in self._ring_orders[from_position]:
+            seat = seats[position]
+            if seat is not None and seat.status != PlayerStatus.ELIMINATED and seat.chips > 0:
+                return position
+        return -1
     
     def advance_dealer_button(self) -> int:
         """
@@ -121,52 +238,10 @@ class Table:
         Returns:
             The new dealer position
         """
-        # Get list of active positions (seats with non-eliminated players)
-        active_positions = [i for i, seat in enumerate(self.seats) if seat is not None and 
-                         seat.status != PlayerStatus.ELIMINATED and seat.chips > 0]
-        
-        if not active_positions:
-            self.dealer_position = -1
-            return -1
-        
-        # If dealer position is invalid, or current dealer is eliminated/has no chips
-        if (self.dealer_position == -1 or 
-            self.dealer_position >= len(self.seats) or 
-            self.seats[self.dealer_position] is None or
-            self.seats[self.dealer_position].status == PlayerStatus.ELIMINATED or
-            self.seats[self.dealer_position].chips == 0):
-            
-            # If we have a valid dealer position, find the next seat after it
-            if 0 <= self.dealer_position < len(self.seats):
-                # Find positions after the current dealer
-                next_positions = [pos for pos in active_positions if pos > self.dealer_position]
-                if next_positions:
-                    # Move to next active position after current dealer
-                    self.dealer_position = next_positions[0]
-                    return self.dealer_position
-            
-            # Otherwise, move to the first active position
-            self.dealer_position = active_positions[0]
-            return self.dealer_position
-        
-        # Find the current dealer's index in our active positions list
-        try:
-            current_idx = active_positions.index(self.dealer_position)
-            # Move to the next active position (wrap around if needed)
-            next_idx = (current_idx + 1) % len(active_positions)
-            self.dealer_position = active_positions[next_idx]
-            return self.dealer_position
-        except ValueError:
-            # Current dealer position not in active positions
-            # Find positions after the current dealer
-            next_positions = [pos for pos in active_positions if pos > self.dealer_position]
-            if next_positions:
-                # Move to next active position after current dealer
-                self.dealer_position = next_positions[0]
-            else:
-                # Wrap around to first active position
-                self.dealer_position = active_positions[0]
-            return self.dealer_position
+        # An invalid dealer position restarts the search from the first seat
+        start = self.dealer_position if 0 <= self.dealer_position < self.max_seats else -1
+        self.dealer_position = self._next_button_position(start)
+        return self.dealer_position
     
     def get_blinds_positions(self) -> Tuple[int, int]:
         """
@@ -179,32 +254,42 @@ class Table:
         if self.dealer_position == -1:
             return -1, -1
         
-        # Get list of active players with chips
-        active_players = [i for i, seat in enumerate(self.seats) if seat is not None and 
-                        seat.status != PlayerStatus.ELIMINATED and seat.chips > 0]
+        # Anchor on the dealer, or on the first eligible seat if the dealer
+        # can't hold the button (shouldn't happen but just in case)
+        if self._is_button_eligible(self.dealer_position):
+            anchor = self.dealer_position
+        else:
+            anchor = self._next_button_position(-1)
+            if anchor == -1:
+                return -1, -1
         
-        if len(active_players) < 2:
+        first = self._next_button_position(anchor)
+        if first == anchor:
+            # Fewer than 2 players with chips
             return -1, -1
-            
-        # Find dealer index in active players list
-        try:
-            dealer_idx = active_players.index(self.dealer_position)
-        except ValueError:
-            # Dealer not in active players (shouldn't happen but just in case)
-            dealer_idx = 0
+        second = self._next_button_position(first)
         
         # For heads-up play (2 players), the dealer posts the small blind
-        if len(active_players) == 2:
-            sb_idx = dealer_idx
-            bb_idx = (dealer_idx + 1) % 2
-            
-            return active_players[sb_idx], active_players[bb_idx]
+        if second == anchor:
+            return anchor, first
         
         # For 3+ players, small blind is to the left of the dealer
-        sb_idx = (dealer_idx + 1) % len(active_players)
-        bb_idx = (dealer_idx + 2) % len(active_players)
+        return first, second
+    
+    def get_players_in_hand(self) -> List[Player]:
+        """
+        Get the seated players who are still in the hand (active or all-in).
+        
+        The list is cached until a seat or player status changes, so callers
+        must not modify it.
         
-        return active_players[sb_idx], active_players[bb_idx]
+        Returns:
+            Players in the hand, in seat order
+        """
+        if self._in_hand is None:
+            self._in_hand = [p for p in self._occupied_players
+                             if p.status in _IN_HAND_STATUSES]
+        return self._in_hand
     
     def get_active_players(self) -> List[Player]:
         """
@@ -213,32 +298,31 @@ class Table:
         Returns:
             List of active players starting from the seat after the dealer
         """
-        active = []
-        if self.dealer_position == -1:
-            # No dealer yet, just return players in seat order
-            for seat in self.seats:
-                if seat is not None and seat.status in (PlayerStatus.ACTIVE, PlayerStatus.ALL_IN):
-                    active.append(seat)
-        else:
-            # Start from the seat after the dealer
-            start_pos = (self.dealer_position + 1) % self.max_seats
-            current_pos = start_pos
-            
-            # Go around the table once
-            while True:
-                seat = self.seats[current_pos]
-                if seat is not None and seat.status in (PlayerStatus.ACTIVE, PlayerStatus.ALL_IN):
-                    active.append(seat)
-                
-                current_pos = (current_pos + 1) % self.max_seats
-                if current_pos == start_pos:
-                    break
-        
-        return active
+        # The cached players in hand are in seat order: rotate them so the
+        # seats after the dealer come first (no dealer yet means no rotation)
+        in_hand = self.get_players_in_hand()
+        dealer_position = self.dealer_position
+        split = 0
+        for player in in_hand:
+            if player.position > dealer_position:
+                break
+            split += 1
+        return in_hand[split:] + in_hand[:split]
     
     def update_active_players(self) -> None:
         """Update the list of active players."""
         self.active_players = self.get_active_players()
+        
+        # active_players runs from the seat after the dealer around the table,
+        # so its positions form two ascending runs split where it wraps
+        positions = [player.position for player in self.active_players]
+        wrap_idx = len(positions)
+        for i in range(1, len(positions)):
+            if positions[i] < positions[i - 1]:
+                wrap_idx = i
+                break
+        self._active_positions = positions
+        self._active_wrap_idx = wrap_idx
     
     def get_next_to_act(self, after_position: int = -1) -> Optional[Player]:
         """
@@ -254,20 +338,18 @@ class Table:
         if not self.active_players:
             return None
         
-        # Find players who can still act
-        can_act = [p for p in self.active_players if p.status == PlayerStatus.ACTIVE and not p.has_acted]
-        if not can_act:
-            return None
-        
         if after_position == -1:
-            return can_act[0]
-        
-        # Find the next player after the specified position
-        start_idx = 0
-        for i, player in enumerate(self.active_players):
-            if player.position > after_position:
-                start_idx = i
-                break
+            start_idx = 0
+        else:
+            # Find the first player seated after the specified position,
+            # bisecting each ascending run of positions in acting order
+            positions = self._active_positions
+            wrap_idx = self._active_wrap_idx
+            start_idx = bisect_right(positions, after_position, 0, wrap_idx)
+            if start_idx == wrap_idx:
+                start_idx = bisect_right(positions, after_position, wrap_idx)
+                if start_idx == len(positions):
+                    start_idx = 0
         
         # Check from start_idx to the end
         for player in self.active_players[start_idx:]:
@@ -291,17 +373,16 @@ class Table:
         Returns:
             The position of the next occupied seat
         """
-        current_pos = (from_position + 1) % self.max_seats
-        while current_pos != from_position:
-            if self.seats[current_pos] is not None:
-                return current_pos
-            current_pos = (current_pos + 1) % self.max_seats
+        for position in self._ring_orders[from_position]:
+            if position == from_position:
+                break
+            if self.seats[position] is not None:
+                return position
         
         # If we've gone full circle and found nothing, return the starting position
         return from_position
     
     def reset_player_states(self) -> None:
         """Reset the state of all players for a new hand."""
-        for player in self.seats:
-            if player is not None:
-                player.reset_for_new_hand()
\ No newline at end of file
+        for player in self._occupied_players:
+            player.reset_for_new_hand()
\ No newline at end of file
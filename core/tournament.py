@@ -5,10 +5,14 @@ Implements tournament structure and management.
 from __future__ import annotations
 from enum import Enum, auto
 from typing import List, Dict, Optional, Tuple, Set, Any
+import heapq
+import itertools
+from operator import attrgetter
+import random
 import uuid
 import logging
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
 
 from core.player import Player, PlayerStatus
 from core.table import Table
@@ -24,7 +28,7 @@ class TournamentStatus(Enum):
     FINISHED = auto()     # Tournament is complete
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BlindLevel:
     """Defines a blind level in a tournament."""
     level: int
@@ -69,11 +73,26 @@ class Tournament:
         self.tables: List[Table] = []
         self.games: Dict[str, Game] = {}
         self.players: Dict[str, Player] = {}
-        self.eliminated_players: List[Player] = []
+        self.eliminated_players: List[Player] = []  # In elimination order
+        self._eliminated_ids: Set[str] = set()
+        self._player_table: Dict[str, Table] = {}  # Player ID -> table they are seated at
+        self._active_count = 0  # Registered players not yet eliminated
+        self._prize_pool = 0
+        self._max_table_count = 0  # Largest table as of the last balance
         self.current_level = 0
+        self._current_blinds: Optional[BlindLevel] = None
+        self._current_blinds_dict: Optional[Dict[str, int]] = None
         self.start_time: Optional[float] = None
         self.level_start_time: Optional[float] = None
         self.status = TournamentStatus.REGISTERING
+        self._rng = random.Random()  # Seat draw; reseed for reproducible seating
+        
+        # Status fields that never change after creation
+        self._static_status = {
+            "id": self.id,
+            "name": self.config.name,
+            "buy_in": self.config.buy_in
+        }
         
         self.logger = logging.getLogger(f"poker.tournament.{self.id}")
     
@@ -129,23 +148,25 @@ class Tournament:
             True if registration was successful, False otherwise
         """
         if self.status != TournamentStatus.REGISTERING:
-            self.logger.warning(f"Cannot register player {player.name}: tournament is not in REGISTERING state")
+            self.logger.warning("Cannot register player %s: tournament is not in REGISTERING state", player.name)
             return False
         
         if len(self.players) >= self.config.max_players:
-            self.logger.warning(f"Cannot register player {player.name}: tournament is full")
+            self.logger.warning("Cannot register player %s: tournament is full", player.name)
             return False
         
         if player.id in self.players:
-            self.logger.warning(f"Player {player.name} is already registered")
+            self.logger.warning("Player %s is already registered", player.name)
             return False
         
         # Set up player for tournament
         player.chips = self.config.starting_chips
         player.status = PlayerStatus.SITTING_OUT
         self.players[player.id] = player
+        self._active_count += 1
+        self._prize_pool += self.config.buy_in
         
-        self.logger.info(f"Player {player.name} registered for tournament")
+        self.logger.info("Player %s registered for tournament", player.name)
         return True
     
     def unregister_player(self, player_id: str) -> bool:
@@ -163,11 +184,13 @@ class Tournament:
             return False
         
         if player_id not in self.players:
-            self.logger.warning(f"Player {player_id} is not registered")
+            self.logger.warning("Player %s is not registered", player_id)
             return False
         
         player = self.players.pop(player_id)
-        self.logger.info(f"Player {player.name} unregistered from tournament")
+        self._active_count -= 1
+        self._prize_pool -= self.config.buy_in
+        self.logger.info("Player %s unregistered from tournament", player.name)
         return True
     
     def start_tournament(self) -> bool:
@@ -182,13 +205,14 @@ class Tournament:
             return False
         
         if len(self.players) < self.config.min_players:
-            self.logger.warning(f"Cannot start tournament: need at least {self.config.min_players} players")
+            self.logger.warning("Cannot start tournament: need at least %s players", self.config.min_players)
             return False
         
         self.status = TournamentStatus.STARTING
         self.start_time = time.time()
         self.level_start_time = self.start_time
         self.current_level = 0
+        self._set_current_blinds()
         
         # Create tables and assign players
         self._create_tables()
@@ -198,7 +222,7 @@ class Tournament:
         self.status = TournamentStatus.RUNNING
         self._start_all_tables()
         
-        self.logger.info(f"Tournament started with {len(self.players)} players at {self.level_start_time}")
+        self.logger.info("Tournament started with %s players at %s", len(self.players), self.level_start_time)
         return True
     
     def _create_tables(self) -> None:
@@ -208,7 +232,7 @@ class Tournament:
         players_per_table = self.config.players_per_table
         num_tables = (num_players + players_per_table - 1) // players_per_table
         
-        self.logger.info(f"Creating {num_tables} tables for {num_players} players")
+        self.logger.info("Creating %s tables for %s players", num_tables, num_players)
         
         # Create tables
         self.tables = []
@@ -228,8 +252,7 @@ class Tournament:
             return
         
         # Shuffle players for random seating
-        import random
-        random.shuffle(player_list)
+        self._rng.shuffle(player_list)
         
         # Calculate ideal distribution
         players_per_table = len(player_list) // num_tables
@@ -245,10 +268,13 @@ class Tournament:
             for _ in range(table_size):
                 if player_index < len(player_list):
                     player = player_list[player_index]
-                    table.add_player(player)
+                    if table.add_player(player):
+                        self._player_table[player.id] = table
                     player_index += 1
             
-            self.logger.info(f"Table {table.name} has {table_size} players")
+            self.logger.info("Table %s has %s players", table.name, table_size)
+        
+        self._max_table_count = max(table.active_count for table in self.tables)
     
     def _start_all_tables(self) -> None:
         """Start games at all tables."""
@@ -256,7 +282,7 @@ class Tournament:
         
         for table in self.tables:
             if table.player_count() < 2:
-                self.logger.warning(f"Cannot start game at {table.name}: not enough players")
+                self.logger.warning("Cannot start game at %s: not enough players", table.name)
                 continue
             
             # Create game config with current blind levels
@@ -274,7 +300,7 @@ class Tournament:
             self.games[table.id] = game
             game.start_hand()
             
-            self.logger.info(f"Started game at {table.name}")
+            self.logger.info("Started game at %s", table.name)
     
     def advance_level(self) -> bool:
         """
@@ -287,32 +313,42 @@ class Tournament:
             self.logger.warning("Cannot advance level: tournament is not running")
             return False
         
-        if self.current_level >= len(self.config.blind_levels) - 1:
+        blind_levels = self.config.blind_levels
+        if self.current_level >= len(blind_levels) - 1:
             self.logger.warning("Cannot advance level: already at maximum level")
             return False
         
         self.current_level += 1
         self.level_start_time = time.time()
+        self._set_current_blinds()
         
         # Update blind levels for all active games
-        current_blinds = self._get_current_blinds()
+        current_blinds = self._current_blinds
+        small_blind = current_blinds.small_blind
+        big_blind = current_blinds.big_blind
+        ante = current_blinds.ante
         for game in self.games.values():
-            game.config.small_blind = current_blinds.small_blind
-            game.config.big_blind = current_blinds.big_blind
-            game.config.ante = current_blinds.ante
+            game_config = game.config
+            game_config.small_blind = small_blind
+            game_config.big_blind = big_blind
+            game_config.ante = ante
         
-        self.logger.info(f"Advanced to blind level {self.current_level+1}: "
-                        f"SB {current_blinds.small_blind}, BB {current_blinds.big_blind}, "
-                        f"Ante {current_blinds.ante}")
+        self.logger.info("Advanced to blind level %s: SB %s, BB %s, Ante %s",
+                         self.current_level + 1, small_blind, big_blind, ante)
         return True
     
-    def _get_current_blinds(self) -> BlindLevel:
-        """Get the current blind level."""
+    def _set_current_blinds(self) -> None:
+        """Cache the blind level for the current level."""
         if self.current_level < len(self.config.blind_levels):
-            return self.config.blind_levels[self.current_level]
+            self._current_blinds = self.config.blind_levels[self.current_level]
         else:
-            # Return the highest level if beyond the defined levels
-            return self.config.blind_levels[-1]
+            # Use the highest level if beyond the defined levels
+            self._current_blinds = self.config.blind_levels[-1]
+        self._current_blinds_dict = asdict(self._current_blinds)
+    
+    def _get_current_blinds(self) -> BlindLevel:
+        """Get the current blind level."""
+        return self._current_blinds or self.config.blind_levels[0]
     
     def eliminate_player(self, player_id: str) -> bool:
         """
@@ -325,86 +361,98 @@ class Tournament:
             True if elimination was successful, False otherwise
         """
         if player_id not in self.players:
-            self.logger.warning(f"Cannot eliminate player {player_id}: not found in tournament")
+            self.logger.warning("Cannot eliminate player %s: not found in tournament", player_id)
+            return False
+        
+        if player_id in self._eliminated_ids:
+            self.logger.warning("Cannot eliminate player %s: already eliminated", player_id)
             return False
         
         player = self.players[player_id]
         player.status = PlayerStatus.ELIMINATED
+        self._eliminated_ids.add(player_id)
+        self._active_count -= 1
         
-        # Find the player's table
-        for table in self.tables:
-            for i, seat in enumerate(table.seats):
-                if seat is not None and seat.id == player_id:
-                    # Remove player from table
-                    table.seats[i] = None
-                    break
+        # Remove player from their table
+        table = self._player_table.pop(player_id, None)
+        if table is not None:
+            table.remove_player(player)
         
         # Add to eliminated players list
         self.eliminated_players.append(player)
         
         # Check if tournament is finished
-        remaining_players = sum(1 for p in self.players.values() if p.status != PlayerStatus.ELIMINATED)
+        remaining_players = self._active_count
         if remaining_players <= 1:
             self._finish_tournament()
-        else:
-            # Check if tables need to be balanced
+        elif table is None or table.active_count < max(1, self._max_table_count - 1):
+            # Tables were balanced before this elimination, so they only need
+            # rebalancing if this table emptied or fell two below the largest
             self._balance_tables()
         
-        self.logger.info(f"Player {player.name} eliminated from tournament")
+        self.logger.info("Player %s eliminated from tournament", player.name)
         return True
     
     def _balance_tables(self) -> None:
         """Balance players across tables if needed."""
-        # Count active players at each table
-        table_counts = [(table, sum(1 for seat in table.seats if seat is not None and 
-                                  seat.status != PlayerStatus.ELIMINATED))
-                        for table in self.tables]
+        # Count active players at each table (parallel to tables)
+        tables = self.tables
+        counts = [table.active_count for table in tables]
         
         # Check if any tables need to be removed
-        active_tables = [t for t, count in table_counts if count > 0]
-        if len(active_tables) < len(self.tables):
-            self.logger.info(f"Reducing from {len(self.tables)} to {len(active_tables)} tables")
-            self.tables = active_tables
-            table_counts = [(table, count) for table, count in table_counts if count > 0]
+        if 0 in counts:
+            tables = [table for table, count in zip(tables, counts) if count > 0]
+            counts = [count for count in counts if count > 0]
+            self.logger.info("Reducing from %s to %s tables", len(self.tables), len(tables))
+            self.tables = tables
+        
+        self._max_table_count = max(counts, default=0)
         
-        if len(table_counts) <= 1:
+        if len(tables) <= 1:
             # Only one table left, no balancing needed
             return
         
         # Check if tables are imbalanced
-        min_count = min(count for _, count in table_counts)
-        max_count = max(count for _, count in table_counts)
+        min_count = min(counts)
+        max_count = self._max_table_count
         
         if max_count - min_count <= 1:
             # Tables are balanced (difference of at most 1 player)
             return
         
-        self.logger.info(f"Balancing tables: min={min_count}, max={max_count} players")
+        self.logger.info("Balancing tables: min=%s, max=%s players", min_count, max_count)
         
-        # Sort tables by player count (descending)
-        table_counts.sort(key=lambda x: x[1], reverse=True)
+        # Keep a max-heap and a min-heap of (count, table index). Entries go stale
+        # when a table's count changes; they are skipped lazily when popped.
+        max_heap = [(-count, i) for i, count in enumerate(counts)]
+        min_heap = [(count, i) for i, count in enumerate(counts)]
+        heapq.heapify(max_heap)
+        heapq.heapify(min_heap)
         
         # Move players from larger tables to smaller ones
-        while max_count - min_count > 1:
-            # Find table with most players
-            source_table, source_count = table_counts[0]
+        while True:
+            while -max_heap[0][0] != counts[max_heap[0][1]]:
+                heapq.heappop(max_heap)
+            while min_heap[0][0] != counts[min_heap[0][1]]:
+                heapq.heappop(min_heap)
             
-            # Find table with fewest players
-            dest_table, dest_count = table_counts[-1]
+            source_index = max_heap[0][1]
+            dest_index = min_heap[0][1]
+            if counts[source_index] - counts[dest_index] <= 1:
+                break
             
             # Move a player
-            self._move_player(source_table, dest_table)
+            self._move_player(tables[source_index], tables[dest_index])
             
             # Update counts
-            table_counts[0] = (source_table, source_count - 1)
-            table_counts[-1] = (dest_table, dest_count + 1)
-            
-            # Re-sort tables
-            table_counts.sort(key=lambda x: x[1], reverse=True)
-            
-            # Update min/max
-            min_count = table_counts[-1][1]
-            max_count = table_counts[0][1]
+            counts[source_index] -= 1
+            counts[dest_index] += 1
+            heapq.heappush(max_heap, (-counts[source_index], source_index))
+            heapq.heappush(min_heap, (counts[source_index], source_index))
+            heapq.heappush(max_heap, (-counts[dest_index], dest_index))
+            heapq.heappush(min_heap, (counts[dest_index], dest_index))
+        
+        self._max_table_count = max(counts)
     
     def _move_player(self, source_table: Table, dest_table: Table) -> None:
         """
@@ -415,22 +463,23 @@ class Tournament:
             dest_table: Table to move player to
         """
         # Find a player to move (use the one in the largest position)
-        player_to_move = None
-        for i in range(source_table.max_seats - 1, -1, -1):
-            player = source_table.get_player_at_position(i)
-            if player is not None and player.status != PlayerStatus.ELIMINATED:
-                player_to_move = player
-                source_table.remove_player(player)
-                break
+        player_to_move = next((player for player in reversed(source_table.seats)
+                               if player is not None and player.status != PlayerStatus.ELIMINATED),
+                              None)
+        if player_to_move is not None:
+            source_table.remove_player(player_to_move)
         
         if player_to_move is None:
             self.logger.warning("No player found to move")
             return
         
         # Add player to destination table
-        dest_table.add_player(player_to_move)
+        if dest_table.add_player(player_to_move):
+            self._player_table[player_to_move.id] = dest_table
+        else:
+            self._player_table.pop(player_to_move.id, None)
         
-        self.logger.info(f"Moved player {player_to_move.name} from {source_table.name} to {dest_table.name}")
+        self.logger.info("Moved player %s from %s to %s", player_to_move.name, source_table.name, dest_table.name)
     
     def _finish_tournament(self) -> None:
         """Finish the tournament and allocate prizes."""
@@ -442,21 +491,20 @@ class Tournament:
         # Get final standings
         standings = self._get_final_standings()
         
-        # Calculate prize pool
-        prize_pool = len(self.players) * self.config.buy_in
+        prize_pool = self._prize_pool
         
         # Allocate prizes based on payout percentages
         payouts = self._calculate_payouts(prize_pool, len(standings))
         
-        self.logger.info(f"Tournament finished. Prize pool: {prize_pool}")
+        self.logger.info("Tournament finished. Prize pool: %s", prize_pool)
         
         # Assign winnings to players
         for i, (player, position) in enumerate(standings):
             if i < len(payouts):
                 player.add_chips(payouts[i])
-                self.logger.info(f"{position}. {player.name}: {payouts[i]}")
+                self.logger.info("%s. %s: %s", position, player.name, payouts[i])
             else:
-                self.logger.info(f"{position}. {player.name}: 0")
+                self.logger.info("%s. %s: 0", position, player.name)
     
     def _get_final_standings(self) -> List[Tuple[Player, int]]:
         """
@@ -466,18 +514,16 @@ class Tournament:
             List of (player, position) tuples
         """
         # Start with any remaining active players
-        active_players = [p for p in self.players.values() if p.status != PlayerStatus.ELIMINATED]
+        eliminated_ids = self._eliminated_ids
+        active_players = [p for pid, p in self.players.items() if pid not in eliminated_ids]
         
         # Sort active players by chip count (descending)
-        active_players.sort(key=lambda p: p.chips, reverse=True)
+        active_players.sort(key=attrgetter("chips"), reverse=True)
+        standings = list(zip(active_players, itertools.count(1)))
         
         # Add eliminated players in reverse elimination order
-        standings = [(p, i+1) for i, p in enumerate(active_players)]
-        
-        elim_position = len(active_players) + 1
-        for player in reversed(self.eliminated_players):
-            standings.append((player, elim_position))
-            elim_position += 1
+        standings.extend(zip(reversed(self.eliminated_players),
+                             itertools.count(len(active_players) + 1)))
         
         return standings
     
@@ -509,13 +555,15 @@ class Tournament:
         # Use configured percentages, or default if not enough
         percentages = self.config.payouts_percentage[:num_paying]
         
-        # If percentages don't add up to 100%, adjust them
-        total_percentage = sum(percentages)
-        if total_percentage != 100.0:
-            percentages = [p * 100.0 / total_percentage for p in percentages]
+        if not percentages:
+            return []
         
-        # Calculate actual payouts
-        payouts = [int(prize_pool * p / 100.0) for p in percentages]
+        # Calculate actual payouts, scaling the percentages so they add up to 100%.
+        # Totals that are 100% up to float error are used as-is.
+        total_percentage = sum(percentages)
+        if abs(total_percentage - 100.0) <= 1e-9:
+            total_percentage = 100.0
+        payouts = [int(prize_pool * p / total_percentage) for p in percentages]
         
         # Adjust for rounding errors
         remaining = prize_pool - sum(payouts)
@@ -531,27 +579,39 @@ class Tournament:
         Returns:
             Dictionary with tournament status information
         """
+        status = self.status
+        current_blinds = self._current_blinds
+        level_start_time = self.level_start_time
+        
         # Calculate time remaining in current level
-        current_time = time.time()
-        if self.level_start_time is not None and self.current_level < len(self.config.blind_levels):
-            level_duration = self.config.blind_levels[self.current_level].duration_minutes * 60
-            elapsed_time = current_time - self.level_start_time
+        if level_start_time is not None and current_blinds is not None:
+            level_duration = current_blinds.duration_minutes * 60
+            elapsed_time = time.time() - level_start_time
             time_remaining = max(0, level_duration - elapsed_time)
         else:
             time_remaining = 0
         
+        # Blinds are cached once the tournament starts; before that they are
+        # only reported if it finished without starting
+        blinds_dict = self._current_blinds_dict
+        if blinds_dict is not None:
+            blinds = dict(blinds_dict)
+        elif status != TournamentStatus.REGISTERING:
+            blinds = asdict(self._get_current_blinds())
+        else:
+            blinds = None
+        
         # Count active and eliminated players
-        active_players = sum(1 for p in self.players.values() if p.status != PlayerStatus.ELIMINATED)
+        active_players = self._active_count
         eliminated_players = len(self.eliminated_players)
         
         return {
-            "id": self.id,
-            "name": self.config.name,
-            "status": self.status.name,
+            **self._static_status,
+            "status": status.name,
             "start_time": self.start_time,
             "current_level": self.current_level + 1,
             "time_remaining": time_remaining,
-            "blinds": self._get_current_blinds().__dict__ if self.status != TournamentStatus.REGISTERING else None,
+            "blinds": blinds,
             "players": {
                 "total": len(self.players),
                 "active": active_players,
@@ -562,8 +622,7 @@ class Tournament:
                 "name": table.name,
                 "players": table.player_count()
             } for table in self.tables],
-            "buy_in": self.config.buy_in,
-            "prize_pool": len(self.players) * self.config.buy_in
+            "prize_pool": self._prize_pool
         }
     
     def get_player_status(self, player_id: str) -> Optional[Dict[str, Any]]:
@@ -576,20 +635,12 @@ class Tournament:
         Returns:
             Dictionary with player status information, or None if player not found
         """
-        if player_id not in self.players:
+        player = self.players.get(player_id)
+        if player is None:
             return None
         
-        player = self.players[player_id]
-        
         # Find player's table
-        table = None
-        for t in self.tables:
-            for i, seat in enumerate(t.seats):
-                if seat is not None and seat.id == player_id:
-                    table = t
-                    break
-            if table:
-                break
+        table = self._player_table.get(player_id)
         
         return {
             "id": player.id,
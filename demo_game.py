@@ -2,12 +2,15 @@
 Demo script to test the Texas Hold'em poker game functionality.
 This runs a simple automated game with 6 players to verify the core logic.
 """
+import os
+import sys
 import time
 import logging
 import random
-from typing import Dict, Any
+from multiprocessing import Pool
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from core.card import Card, Rank, Suit
+from core.card import Card, Deck, Rank, Suit
 from core.player import Player, PlayerStatus
 from core.table import Table
 from core.game import Game, GameAction, GameStatus, GameConfig, BettingRound
@@ -21,6 +24,20 @@ logging.basicConfig(
 
 logger = logging.getLogger("poker.demo")
 
+# Set POKER_FAST=1 to run without the per-action delay and state printouts,
+# e.g. when timing the engine
+FAST_MODE = bool(os.environ.get("POKER_FAST"))
+ACTION_DELAY = 0.0 if FAST_MODE else 0.5
+
+# Symbols shown next to each player in the game state printout
+STATUS_SYMBOLS = {
+    PlayerStatus.ACTIVE: "🟢",
+    PlayerStatus.FOLDED: "🔴",
+    PlayerStatus.ALL_IN: "⚪",
+    PlayerStatus.SITTING_OUT: "⚫",
+    PlayerStatus.ELIMINATED: "⚫"
+}
+
 
 def create_demo_game() -> Game:
     """Create a demo game with 6 players."""
@@ -56,30 +73,26 @@ def print_game_state(game: Game):
     """Print the current game state."""
     state = game.state
     
-    print("\n" + "="*80)
-    print(f"Game Status: {state.status.name}")
-    print(f"Betting Round: {state.betting_round.name}")
-    print(f"Pot: {state.pot}")
-    print(f"Current Bet: {state.current_bet}")
+    community_cards = state.community_cards
+    current_idx = state.current_player_idx
     
-    if state.community_cards:
-        print(f"Community Cards: {' '.join(str(card) for card in state.community_cards)}")
-    else:
-        print("Community Cards: None")
-    
-    print("-"*80)
-    print("Players:")
+    lines = [
+        "\n" + "="*80,
+        f"Game Status: {state.status.name}",
+        f"Betting Round: {state.betting_round.name}",
+        f"Pot: {state.pot}",
+        f"Current Bet: {state.current_bet}",
+        f"Community Cards: {' '.join(str(card) for card in community_cards)}"
+        if community_cards else "Community Cards: None",
+        "-"*80,
+        "Players:"
+    ]
+    append = lines.append
     for i, player in enumerate(game.table.seats):
         if player is None:
             continue
             
-        status_symbol = {
-            PlayerStatus.ACTIVE: "🟢",
-            PlayerStatus.FOLDED: "🔴",
-            PlayerStatus.ALL_IN: "⚪",
-            PlayerStatus.SITTING_OUT: "⚫",
-            PlayerStatus.ELIMINATED: "⚫"
-        }.get(player.status, "?")
+        status_symbol = STATUS_SYMBOLS.get(player.status, "?")
         
         position_marker = ""
         if player.is_dealer:
@@ -89,118 +102,162 @@ def print_game_state(game: Game):
         if player.is_big_blind:
             position_marker += "BB "
         
-        current_marker = "→ " if i == state.current_player_idx else "  "
+        current_marker = "→ " if i == current_idx else "  "
         
-        cards_str = " ".join(str(card) for card in player.hand.cards) if player.hand.cards else "XX XX"
+        hand_cards = player.hand.cards
+        cards_str = " ".join(str(card) for card in hand_cards) if hand_cards else "XX XX"
         
-        print(f"{current_marker}{status_symbol} {player.name} ({position_marker}): ${player.chips} - Bet: ${player.current_bet} - Cards: {cards_str}")
+        append(f"{current_marker}{status_symbol} {player.name} ({position_marker}): ${player.chips} - Bet: ${player.current_bet} - Cards: {cards_str}")
     
-    print("="*80 + "\n")
+    append("="*80 + "\n")
+    print("\n".join(lines))
 
 
-def simulate_player_action(game: Game, player_id: str) -> bool:
-    """Simulate a player taking an action."""
-    # Get available actions
-    actions = game.get_available_actions(player_id)
-    
-    if not actions:
-        return False
-    
-    # Get player
-    player = None
-    for p in game.table.seats:
-        if p is not None and p.id == player_id:
-            player = p
-            break
-    
-    if player is None:
-        return False
+def print_hand_log(events: List[Tuple[str, str, int, int, PlayerStatus, int]]):
+    """Print the actions recorded during a hand, one line per action."""
+    print("Actions:")
+    for betting_round, name, bet, chips, status, pot in events:
+        print(f"  {betting_round:<8} {STATUS_SYMBOLS.get(status, '?')} {name}: "
+              f"Bet: ${bet} - Chips: ${chips} - Pot: ${pot}")
+
+
+def _decide_action(has_strong_hand: bool, chips: int, actions: Dict[GameAction, int],
+                   big_blind: int, rand: Callable[[], float] = random.random
+                   ) -> Optional[Tuple[GameAction, int]]:
+    """
+    Pick an action for the simple AI from plain numbers, without touching the game.
     
-    # Decide on action (simple AI)
-    # 1. If check is available, check 70% of the time
-    # 2. If call is available and affordable, call 60% of the time
-    # 3. If raise is available and affordable, raise 30% of the time
+    Args:
+        has_strong_hand: Whether the player holds a pocket pair or two cards Queen or higher
+        chips: The player's chip count
+        actions: Available actions mapped to their minimum amounts
+        big_blind: Current big blind, used to size bets
+        rand: Source of uniform random numbers in [0, 1)
+        
+    Returns:
+        The chosen action and amount, or None if no action applies
+    """
+    # 1. If check is available, always check rather than fold
+    # 2. If call is available and affordable, call 50-70% of the time
+    # 3. If raise or bet is available, raise 50-80% of the time
     # 4. Otherwise fold
-    
-    # Check if player has a strong hand (pair or better)
-    has_strong_hand = False
-    if len(player.hand.cards) == 2:
-        if player.hand.cards[0].rank == player.hand.cards[1].rank:  # Pocket pair
-            has_strong_hand = True
-        elif player.hand.cards[0].rank.value >= Rank.QUEEN.value and player.hand.cards[1].rank.value >= Rank.QUEEN.value:
-            has_strong_hand = True
+    if GameAction.CHECK in actions:
+        rand()  # Keeps the random stream unchanged for seeded runs
+        return GameAction.CHECK, 0
     
     # Decision probabilities
-    check_prob = 0.4
     call_prob = 0.5 if not has_strong_hand else 0.7
     raise_prob = 0.5 if not has_strong_hand else 0.8
     
-    action_taken = False
-    
-    # Special case for big blind in preflop with no raises
-    if player.is_big_blind and game.state.betting_round == BettingRound.PREFLOP and game.state.current_bet == player.current_bet:
-        # If no one raised beyond the BB, check instead of folding (100% of the time)
-        logger.info(f"Player {player.name} (BB) decides to check")
-        action_taken = game.handle_player_action(player_id, GameAction.CHECK)
-        return action_taken
-    
-    # If CHECK is available, always prioritize it over folding
-    if GameAction.CHECK in actions:
-        if random.random() < check_prob:
-            logger.info(f"Player {player.name} decides to check")
-            action_taken = game.handle_player_action(player_id, GameAction.CHECK)
-        else:
-            # Even if we don't "want" to check based on probability,
-            # still check rather than fold when there's no bet to call
-            logger.info(f"Player {player.name} decides to check (no bet to call)")
-            action_taken = game.handle_player_action(player_id, GameAction.CHECK)
-        return action_taken
-    
     # Try to call
-    if GameAction.CALL in actions and random.random() < call_prob:
+    if GameAction.CALL in actions and rand() < call_prob:
         call_amount = actions[GameAction.CALL]
         # Check if affordable (less than 25% of stack unless strong hand)
-        affordable = call_amount <= player.chips * (0.25 if not has_strong_hand else 0.5)
+        affordable = call_amount <= chips * (0.25 if not has_strong_hand else 0.5)
         
-        if affordable or random.random() < 0.3:  # Sometimes call anyway
-            logger.info(f"Player {player.name} decides to call {call_amount}")
-            action_taken = game.handle_player_action(player_id, GameAction.CALL)
+        if affordable or rand() < 0.3:  # Sometimes call anyway
+            return GameAction.CALL, call_amount
     
     # Try to raise
-    elif GameAction.RAISE in actions and random.random() < raise_prob:
+    elif GameAction.RAISE in actions and rand() < raise_prob:
         min_raise = actions[GameAction.RAISE]
         # Calculate raise amount (1.5-3x the minimum)
-        raise_amount = min(int(min_raise * (1.5 + random.random() * 1.5)), player.chips)
-        
-        logger.info(f"Player {player.name} decides to raise to {raise_amount}")
-        action_taken = game.handle_player_action(player_id, GameAction.RAISE, raise_amount)
+        return GameAction.RAISE, min(int(min_raise * (1.5 + rand() * 1.5)), chips)
     
     # Try to bet
-    elif GameAction.BET in actions and random.random() < raise_prob:
-        min_bet = actions[GameAction.BET]
-        # Calculate bet amount (1-3x the big blind)
-        bet_amount = min(int(game.config.big_blind * (1 + random.random() * 2)), player.chips)
-        bet_amount = max(bet_amount, min_bet)  # Ensure minimum bet
-        
-        logger.info(f"Player {player.name} decides to bet {bet_amount}")
-        action_taken = game.handle_player_action(player_id, GameAction.BET, bet_amount)
+    elif GameAction.BET in actions and rand() < raise_prob:
+        # Calculate bet amount (1-3x the big blind), at least the minimum bet
+        bet_amount = min(int(big_blind * (1 + rand() * 2)), chips)
+        return GameAction.BET, max(bet_amount, actions[GameAction.BET])
     
     # Fold as a last resort (only possible if there's a bet to call)
-    if not action_taken and GameAction.FOLD in actions:
-        logger.info(f"Player {player.name} decides to fold")
+    if GameAction.FOLD in actions:
+        return GameAction.FOLD, 0
+    
+    return None
+
+
+def simulate_player_action(game: Game, player_id: str,
+                           rand: Callable[[], float] = random.random) -> bool:
+    """
+    Simulate a player taking an action.
+    
+    Args:
+        game: Game the player is seated in
+        player_id: ID of the player to act
+        rand: Source of uniform random numbers in [0, 1), e.g. the bound
+            random method of a seeded random.Random
+        
+    Returns:
+        True if an action was taken, False otherwise
+    """
+    # Get available actions
+    actions = game.get_available_actions(player_id)
+    
+    if not actions:
+        return False
+    
+    # Get player
+    player = game.table.get_player(player_id)
+    
+    if player is None:
+        return False
+    
+    # Special case for big blind in preflop with no raises
+    if player.is_big_blind and game.state.betting_round == BettingRound.PREFLOP and game.state.current_bet == player.current_bet:
+        # If no one raised beyond the BB, check instead of folding (100% of the time)
+        logger.info("Player %s (BB) decides to check", player.name)
+        return game.handle_player_action(player_id, GameAction.CHECK)
+    
+    # Check if player has a strong hand (pocket pair or both cards Queen or higher)
+    has_strong_hand = False
+    cards = player.hand.cards
+    if len(cards) == 2:
+        first, second = cards[0].rank.value, cards[1].rank.value
+        has_strong_hand = first == second or min(first, second) >= Rank.QUEEN.value
+    
+    decision = _decide_action(has_strong_hand, player.chips, actions, game.config.big_blind, rand)
+    if decision is None:
+        return False
+    
+    action, amount = decision
+    if amount:
+        logger.info("Player %s decides to %s %d", player.name, action.name.lower(), amount)
+    else:
+        logger.info("Player %s decides to %s", player.name, action.name.lower())
+    action_taken = game.handle_player_action(player_id, action, amount)
+    
+    # Fold if a call, raise or bet was rejected
+    if (not action_taken and action not in (GameAction.CHECK, GameAction.FOLD)
+            and GameAction.FOLD in actions):
+        logger.info("Player %s decides to fold", player.name)
         action_taken = game.handle_player_action(player_id, GameAction.FOLD)
     
     return action_taken
 
 
-def play_hand(game: Game):
-    """Play a single hand of poker."""
+def play_hand(game: Game, verbose: bool = not FAST_MODE,
+              rand: Callable[[], float] = random.random):
+    """
+    Play a single hand of poker.
+    
+    Args:
+        game: Game to play the hand in
+        verbose: Whether to print the hand and pause between actions
+        rand: Source of uniform random numbers in [0, 1) for the players'
+            decisions, passed on to simulate_player_action
+    """
     # Start the hand
     if not game.start_hand():
         logger.error("Failed to start hand")
         return
     
-    print_game_state(game)
+    # Full state dumps after every action are only shown when debugging
+    show_states = verbose and logger.isEnabledFor(logging.DEBUG)
+    events: List[Tuple[str, str, int, int, PlayerStatus, int]] = []
+    
+    if verbose:
+        print_game_state(game)
     
     # Play until hand is finished
     while game.state.status in (GameStatus.BETTING, GameStatus.DEALING):
@@ -213,23 +270,78 @@ def play_hand(game: Game):
             logger.warning("No current player")
             break
         
-        # Simulate player action
-        simulate_player_action(game, current_player.id)
+        # Simulate player action and record its outcome
+        betting_round = game.state.betting_round.name
+        simulate_player_action(game, current_player.id, rand)
+        events.append((betting_round, current_player.name, current_player.current_bet,
+                       current_player.chips, current_player.status, game.state.pot))
         
-        # Display game state
-        print_game_state(game)
+        if show_states:
+            print_game_state(game)
         
         # Small delay for readability
-        time.sleep(0.5)
+        if verbose and ACTION_DELAY:
+            time.sleep(ACTION_DELAY)
     
-    # Print final state
-    print_game_state(game)
+    # Print the action log and final state
+    if verbose:
+        print_hand_log(events)
+        print_game_state(game)
     
     # Make sure we're ready for the next hand
     if game.state.status == GameStatus.FINISHED:
         game.reset_game()
 
 
+def run_one_hand(seed: int) -> Dict[str, Any]:
+    """
+    Play one quiet hand on a fresh demo game.
+    
+    Args:
+        seed: Seed for the hand's own random.Random, which shuffles the deck
+            and drives the players' decisions, making the hand reproducible
+            without touching the random module's global state
+        
+    Returns:
+        The seed, each player's final chip count and the community cards
+    """
+    rng = random.Random(seed)
+    
+    def shuffled_deck() -> Deck:
+        deck = Deck()
+        rng.shuffle(deck.cards)
+        return deck
+    
+    game = create_demo_game()
+    game.deck_factory = shuffled_deck
+    play_hand(game, verbose=False, rand=rng.random)
+    return {
+        "seed": seed,
+        "chips": {p.name: p.chips for p in game.table.seats if p is not None},
+        "community_cards": [str(card) for card in game.state.community_cards]
+    }
+
+
+def _init_worker() -> None:
+    """Silence per-action logging in simulation worker processes."""
+    logging.getLogger("poker").setLevel(logging.WARNING)
+
+
+def run_hands(num_hands: int, processes: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Play independent hands in parallel, one seed per hand.
+    
+    Args:
+        num_hands: Number of hands to play
+        processes: Number of worker processes (one per CPU if None)
+        
+    Returns:
+        The run_one_hand result of each hand, in seed order
+    """
+    with Pool(processes, initializer=_init_worker) as pool:
+        return pool.map(run_one_hand, range(num_hands))
+
+
 def main():
     """Run the demo."""
     logger.info("Starting poker game demo")
@@ -239,12 +351,17 @@ def main():
     
     # Play 3 hands
     for i in range(2):
-        logger.info(f"Starting hand #{i+1}")
+        logger.info("Starting hand #%s", i+1)
         play_hand(game)
-        logger.info(f"Hand #{i+1} complete")
+        logger.info("Hand #%s complete", i+1)
     
     logger.info("Demo complete")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if len(sys.argv) > 1:
+        # Batch mode: python demo_game.py <hands> [processes]
+        results = run_hands(int(sys.argv[1]), int(sys.argv[2]) if len(sys.argv) > 2 else None)
+        logger.info("Played %d hands", len(results))
+    else:
+        main()
\ No newline at end of file
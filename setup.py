@@ -4,4 +4,8 @@ setup(
     name="texas_holdem",
     version="0.1",
     packages=find_packages(),
+    extras_require={
+        # Optional faster JSON for the web UI; ui/app.py falls back to json without it
+        "fast-json": ["orjson==3.9.15"],
+    },
 )
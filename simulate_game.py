@@ -11,67 +11,73 @@ from typing import List, Dict, Optional, Tuple, Any
 # Add the project root to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.card import Card, Rank, Suit, Deck, create_deck
+from core.card import Card, Rank, Suit, Deck, CANONICAL_DECK, create_deck
 from core.player import Player, PlayerStatus
 from core.table import Table
 from core.game import Game, GameAction, GameStatus, GameConfig, BettingRound
 from core.hand import HandEvaluator, HandRank
 
+# Symbols shown next to each player in the game state printout
+STATUS_SYMBOLS = {
+    PlayerStatus.ACTIVE: "🟢",
+    PlayerStatus.FOLDED: "🔴",
+    PlayerStatus.ALL_IN: "⚪",
+    PlayerStatus.SITTING_OUT: "⚫",
+    PlayerStatus.ELIMINATED: "⚫"
+}
+
+# Accepted spellings of each rank and suit in card strings
+_RANK_CHARS = {
+    '2': Rank.TWO,
+    '3': Rank.THREE,
+    '4': Rank.FOUR,
+    '5': Rank.FIVE,
+    '6': Rank.SIX,
+    '7': Rank.SEVEN,
+    '8': Rank.EIGHT,
+    '9': Rank.NINE,
+    '10': Rank.TEN,
+    'J': Rank.JACK,
+    'j': Rank.JACK,
+    'Q': Rank.QUEEN,
+    'q': Rank.QUEEN,
+    'K': Rank.KING,
+    'k': Rank.KING,
+    'A': Rank.ACE,
+    'a': Rank.ACE
+}
+
+_SUIT_CHARS = {
+    'c': Suit.CLUBS,
+    'C': Suit.CLUBS,
+    'd': Suit.DIAMONDS,
+    'D': Suit.DIAMONDS,
+    'h': Suit.HEARTS,
+    'H': Suit.HEARTS,
+    's': Suit.SPADES,
+    'S': Suit.SPADES,
+    '♣': Suit.CLUBS,
+    '♦': Suit.DIAMONDS,
+    '♥': Suit.HEARTS,
+    '♠': Suit.SPADES
+}
+
+# Every valid card string (e.g. 'As', '10c', 'q♥') mapped to its canonical card
+_CARDS_BY_STR = {
+    value + suit_char: Card(rank, suit)
+    for value, rank in _RANK_CHARS.items()
+    for suit_char, suit in _SUIT_CHARS.items()
+}
+
 def parse_card(card_str):
     """Parse a card string like 'As' or '10c' into a Card object."""
     card_str = card_str.strip()
     
-    # Handle the value part
-    if card_str[0] == '1' and len(card_str) > 2:  # Handle '10'
-        value = card_str[:2]
-        suit_char = card_str[2]
-    else:
-        value = card_str[0]
-        suit_char = card_str[1]
-    
-    # Map value to Rank
-    rank_map = {
-        '2': Rank.TWO,
-        '3': Rank.THREE,
-        '4': Rank.FOUR,
-        '5': Rank.FIVE,
-        '6': Rank.SIX,
-        '7': Rank.SEVEN,
-        '8': Rank.EIGHT,
-        '9': Rank.NINE,
-        '10': Rank.TEN,
-        'J': Rank.JACK,
-        'j': Rank.JACK,
-        'Q': Rank.QUEEN,
-        'q': Rank.QUEEN,
-        'K': Rank.KING,
-        'k': Rank.KING,
-        'A': Rank.ACE,
-        'a': Rank.ACE
-    }
-    
-    # Map suit char to Suit
-    suit_map = {
-        'c': Suit.CLUBS,
-        'C': Suit.CLUBS,
-        'd': Suit.DIAMONDS,
-        'D': Suit.DIAMONDS,
-        'h': Suit.HEARTS,
-        'H': Suit.HEARTS,
-        's': Suit.SPADES,
-        'S': Suit.SPADES,
-        '♣': Suit.CLUBS,
-        '♦': Suit.DIAMONDS,
-        '♥': Suit.HEARTS,
-        '♠': Suit.SPADES
-    }
-    
-    try:
-        rank = rank_map[value]
-        suit = suit_map[suit_char]
-        return Card(rank, suit)
-    except KeyError:
+    # A rank of '10' takes two characters; anything after the suit is ignored
+    card = _CARDS_BY_STR.get(card_str[:3] if card_str[:1] == '1' else card_str[:2])
+    if card is None:
         raise ValueError(f"Invalid card format: {card_str}")
+    return card
 
 def parse_cards(cards_str):
     """Parse a string of multiple cards."""
@@ -81,10 +87,13 @@ def parse_cards(cards_str):
 class InteractivePokerSimulator:
     """Interactive Texas Hold'em Poker simulator."""
     
+    _ALL_CARDS = frozenset(CANONICAL_DECK)
+    
     def __init__(self):
         """Initialize the simulator."""
         self.game = None
         self.rigged_deck = []
+        self._rigged_set = set()  # Cards already placed in the rigged deck
         self.rigged_mode = False
         
     def setup_game(self):
@@ -150,6 +159,7 @@ class InteractivePokerSimulator:
     def rig_deck(self):
         """Set up a rigged deck with predetermined cards."""
         self.rigged_deck = []
+        self._rigged_set = set()
         self.rigged_mode = True
         
         print("\nRigging the deck. You can specify cards for players and community cards.")
@@ -174,12 +184,13 @@ class InteractivePokerSimulator:
                         continue
                         
                     # Check for duplicate cards
-                    if any(c in self.rigged_deck for c in cards):
+                    if len(set(cards)) != len(cards) or not self._rigged_set.isdisjoint(cards):
                         print("Duplicate card detected. Please use unique cards.")
                         continue
                         
                     # Add cards to the rigged deck
                     self.rigged_deck.extend(cards)
+                    self._rigged_set.update(cards)
                     break
                 except Exception as e:
                     print(f"Error: {e}")
@@ -197,20 +208,20 @@ class InteractivePokerSimulator:
                     continue
                     
                 # Check for duplicate cards
-                if any(c in self.rigged_deck for c in cards):
+                if len(set(cards)) != len(cards) or not self._rigged_set.isdisjoint(cards):
                     print("Duplicate card detected. Please use unique cards.")
                     continue
                     
                 # Add cards to the rigged deck
                 self.rigged_deck.extend(cards)
+                self._rigged_set.update(cards)
                 break
             except Exception as e:
                 print(f"Error: {e}")
         
         # Fill the rest of the deck with random cards
-        all_cards = [Card(rank, suit) for suit in Suit for rank in Rank]
-        remaining_cards = [c for c in all_cards if c not in self.rigged_deck]
-        random.shuffle(remaining_cards)
+        remaining_cards = tuple(self._ALL_CARDS - self._rigged_set)
+        remaining_cards = random.sample(remaining_cards, len(remaining_cards))
         
         # Complete the rigged deck
         self.rigged_deck.extend(remaining_cards)
@@ -229,6 +240,7 @@ class InteractivePokerSimulator:
         
         # Reset rigged deck (used only once)
         self.rigged_deck = []
+        self._rigged_set = set()
         self.rigged_mode = False
         
         return deck
@@ -245,17 +257,14 @@ class InteractivePokerSimulator:
         
         # Override the deck creation if in rigged mode
         if self.rigged_mode and self.rigged_deck:
-            original_create_deck = create_deck
+            original_deck_factory = self.game.deck_factory
             
-            # Monkey patch create_deck with our rigged version
-            import core.card
-            core.card.create_deck = self._create_rigged_deck
-            
-            # Start the hand
-            result = self.game.start_hand()
-            
-            # Restore the original function
-            core.card.create_deck = original_create_deck
+            # Deal this hand from our rigged deck
+            self.game.deck_factory = self._create_rigged_deck
+            try:
+                result = self.game.start_hand()
+            finally:
+                self.game.deck_factory = original_deck_factory
         else:
             # Start with normal deck
             result = self.game.start_hand()
@@ -270,30 +279,26 @@ class InteractivePokerSimulator:
         """Print the current game state."""
         state = self.game.state
         
-        print("\n" + "="*80)
-        print(f"Game Status: {state.status.name}")
-        print(f"Betting Round: {state.betting_round.name}")
-        print(f"Pot: {state.pot}")
-        print(f"Current Bet: {state.current_bet}")
-        
-        if state.community_cards:
-            print(f"Community Cards: {' '.join(str(card) for card in state.community_cards)}")
-        else:
-            print("Community Cards: None")
-        
-        print("-"*80)
-        print("Players:")
+        community_cards = state.community_cards
+        current_idx = state.current_player_idx
+        
+        lines = [
+            "\n" + "="*80,
+            f"Game Status: {state.status.name}",
+            f"Betting Round: {state.betting_round.name}",
+            f"Pot: {state.pot}",
+            f"Current Bet: {state.current_bet}",
+            f"Community Cards: {' '.join(str(card) for card in community_cards)}"
+            if community_cards else "Community Cards: None",
+            "-"*80,
+            "Players:"
+        ]
+        append = lines.append
         for i, player in enumerate(self.game.table.seats):
             if player is None:
                 continue
                 
-            status_symbol = {
-                PlayerStatus.ACTIVE: "🟢",
-                PlayerStatus.FOLDED: "🔴",
-                PlayerStatus.ALL_IN: "⚪",
-                PlayerStatus.SITTING_OUT: "⚫",
-                PlayerStatus.ELIMINATED: "⚫"
-            }.get(player.status, "?")
+            status_symbol = STATUS_SYMBOLS.get(player.status, "?")
             
             position_marker = ""
             if player.is_dealer:
@@ -303,13 +308,15 @@ class InteractivePokerSimulator:
             if player.is_big_blind:
                 position_marker += "BB "
             
-            current_marker = "→ " if i == state.current_player_idx else "  "
+            current_marker = "→ " if i == current_idx else "  "
             
-            cards_str = " ".join(str(card) for card in player.hand.cards) if player.hand.cards else "XX XX"
+            hand_cards = player.hand.cards
+            cards_str = " ".join(str(card) for card in hand_cards) if hand_cards else "XX XX"
             
-            print(f"{current_marker}{status_symbol} {player.name} ({position_marker}): ${player.chips} - Bet: ${player.current_bet} - Cards: {cards_str}")
+            append(f"{current_marker}{status_symbol} {player.name} ({position_marker}): ${player.chips} - Bet: ${player.current_bet} - Cards: {cards_str}")
         
-        print("="*80)
+        append("="*80)
+        print("\n".join(lines))
         
         # Print available actions for current player
         if state.current_player_idx >= 0:
@@ -419,40 +426,33 @@ class InteractivePokerSimulator:
         print("\n*** SHOWDOWN RESULTS ***")
         
         # Get active players
-        active_players = [p for p in self.game.table.seats if p is not None and 
-                         p.status in (PlayerStatus.ACTIVE, PlayerStatus.ALL_IN)]
+        active_players = self.game.table.get_players_in_hand()
         
         if not active_players:
             print("No active players at showdown.")
             return
             
-        # Evaluate each player's hand
-        player_hands = {}
-        for player in active_players:
+        # Score every player's hand for comparison in one pass over the board
+        community_cards = self.game.state.community_cards
+        scores = HandEvaluator.evaluate_fast_many(
+            [player.hand.cards for player in active_players], community_cards)
+        
+        # Evaluate each player's hand for display, indexed like active_players
+        descriptions = [""] * len(active_players)
+        for i, player in enumerate(active_players):
             # Combine hole cards and community cards
-            all_cards = player.hand.cards + self.game.state.community_cards
-            
-            # Evaluate the hand
-            hand_rank, best_cards, description = HandEvaluator.evaluate(all_cards)
+            all_cards = player.hand.cards + community_cards
             
-            player_hands[player.id] = {
-                "player": player,
-                "hand_rank": hand_rank,
-                "best_cards": best_cards,
-                "description": description
-            }
+            _, best_cards, descriptions[i] = HandEvaluator.evaluate(all_cards)
             
-            print(f"{player.name}: {description}")
+            print(f"{player.name}: {descriptions[i]}")
             print(f"  Cards: {' '.join(str(card) for card in player.hand.cards)}")
             print(f"  Best 5: {' '.join(str(card) for card in best_cards)}")
         
-        print("\nPot distribution:")
-        # Get pot winners from action history (or we could recalculate)
-        for action in self.game.state.action_history:
-            if "wins" in action.__dict__:
-                winner = next((p for p in active_players if p.id == action.player_id), None)
-                if winner:
-                    print(f"{winner.name} wins {action.amount} with {player_hands[winner.id]['description']}")
+        # Same comparison Game uses to award the pot
+        print("\nBest hand:")
+        for i in HandEvaluator.winning_indices(scores):
+            print(f"{active_players[i].name} with {descriptions[i]}")
     
     def run(self):
         """Run the interactive simulator."""
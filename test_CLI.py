@@ -12,12 +12,76 @@ from typing import List, Dict, Optional, Tuple, Any
 # Add the project root to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.card import Card, Rank, Suit, Deck, create_deck
+from core.card import Card, Rank, Suit, Deck, CANONICAL_DECK, create_deck
 from core.player import Player, PlayerStatus
 from core.table import Table
 from core.game import Game, GameAction, GameStatus, GameConfig, BettingRound
 from core.hand import HandEvaluator, HandRank
 
+# Symbols shown next to each player in the game state printout
+STATUS_SYMBOLS = {
+    PlayerStatus.ACTIVE: "🟢",
+    PlayerStatus.FOLDED: "🔴",
+    PlayerStatus.ALL_IN: "⚪",
+    PlayerStatus.SITTING_OUT: "⚫",
+    PlayerStatus.ELIMINATED: "⚫"
+}
+
+# (is_dealer, is_small_blind, is_big_blind) -> position marker in the printout
+POSITION_MARKERS = {
+    (dealer, small_blind, big_blind):
+        ("D " if dealer else "") + ("SB " if small_blind else "") + ("BB " if big_blind else "")
+    for dealer in (False, True)
+    for small_blind in (False, True)
+    for big_blind in (False, True)
+}
+
+# Accepted spellings of each rank and suit in card strings
+_RANK_CHARS = {
+    '2': Rank.TWO,
+    '3': Rank.THREE,
+    '4': Rank.FOUR,
+    '5': Rank.FIVE,
+    '6': Rank.SIX,
+    '7': Rank.SEVEN,
+    '8': Rank.EIGHT,
+    '9': Rank.NINE,
+    '10': Rank.TEN,
+    'J': Rank.JACK,
+    'j': Rank.JACK,
+    'Q': Rank.QUEEN,
+    'q': Rank.QUEEN,
+    'K': Rank.KING,
+    'k': Rank.KING,
+    'A': Rank.ACE,
+    'a': Rank.ACE
+}
+
+_SUIT_CHARS = {
+    'c': Suit.CLUBS,
+    'C': Suit.CLUBS,
+    'd': Suit.DIAMONDS,
+    'D': Suit.DIAMONDS,
+    'h': Suit.HEARTS,
+    'H': Suit.HEARTS,
+    's': Suit.SPADES,
+    'S': Suit.SPADES,
+    '♣': Suit.CLUBS,
+    '♦': Suit.DIAMONDS,
+    '♥': Suit.HEARTS,
+    '♠': Suit.SPADES
+}
+
+# Every valid card string (e.g. 'As', '10c', 'q♥') mapped to its canonical card
+_CARDS_BY_STR = {
+    value + suit_char: Card(rank, suit)
+    for value, rank in _RANK_CHARS.items()
+    for suit_char, suit in _SUIT_CHARS.items()
+}
+
+# One bit per card of the 52-card deck, for duplicate checks while rigging
+_CARD_BITS = {card: 1 << i for i, card in enumerate(CANONICAL_DECK)}
+
 class PokerCLI:
     """Command-line interface for playing Texas Hold'em Poker."""
     
@@ -26,8 +90,12 @@ class PokerCLI:
         self.game = None
         self.table = None
         self.rigged_deck = []
+        self._rigged_mask = 0  # _CARD_BITS of the cards already in the rigged deck
         self.rigged_mode = False
         self.auto_advance = False
+        # Pause and show the table after each auto-played action only when a
+        # person is watching; scripted runs print just the final state
+        self.interactive_auto = sys.stdout.isatty()
         self.custom_player_names = ["Alice", "Bob", "Charlie", "Dave"]
     
     def setup_game(self, num_players=4, starting_chips=1000, small_blind=5, big_blind=10):
@@ -56,7 +124,8 @@ class PokerCLI:
         )
         
         # Create game
-        self.game = Game("cli_game", self.table, config)
+        # Hands are dealt from the rigged deck when one is set, otherwise a shuffled deck
+        self.game = Game("cli_game", self.table, config, deck_factory=self._create_rigged_deck)
         print(f"Game set up with {num_players} players, {starting_chips} chips each, blinds {small_blind}/{big_blind}.")
     
     def print_cards(self, cards):
@@ -70,83 +139,76 @@ class PokerCLI:
             return
             
         state = self.game.state
+        lines = []
+        write = lines.append
         
-        print("\n" + "="*80)
-        print(f"Game Status: {state.status.name}")
-        print(f"Betting Round: {state.betting_round.name}")
-        print(f"Total Pot: ${state.pot}")
+        write("\n" + "="*80)
+        write(f"Game Status: {state.status.name}")
+        write(f"Betting Round: {state.betting_round.name}")
+        write(f"Total Pot: ${state.pot}")
         
         # Display pot information
         if hasattr(state, 'main_pot') and state.main_pot > 0:
-            print(f"Main Pot: ${state.main_pot}")
+            write(f"Main Pot: ${state.main_pot}")
             
             if hasattr(state, 'side_pots') and state.side_pots:
                 for i, pot in enumerate(state.side_pots, 1):
                     eligible_players = pot.get("eligible_players", [])
                     player_names = []
                     for player_id in eligible_players:
-                        player = next((p for p in self.table.seats if p is not None and p.id == player_id), None)
+                        player = self.table.get_player(player_id)
                         if player:
                             player_names.append(player.name)
                     
-                    print(f"Side Pot {i}: ${pot['amount']} - Eligible: {', '.join(player_names)}")
+                    write(f"Side Pot {i}: ${pot['amount']} - Eligible: {', '.join(player_names)}")
         
-        print("-"*80)
+        write("-"*80)
         
         # Display community cards
         if state.community_cards:
-            print(f"Community Cards: {self.print_cards(state.community_cards)}")
+            write(f"Community Cards: {self.print_cards(state.community_cards)}")
         else:
-            print("Community Cards: None")
+            write("Community Cards: None")
         
-        print("-"*80)
+        write("-"*80)
         
         # Display player information
-        print("Players:")
+        write("Players:")
         for i, player in enumerate(self.table.seats):
             if player is None:
                 continue
                 
-            status_symbol = {
-                PlayerStatus.ACTIVE: "🟢",
-                PlayerStatus.FOLDED: "🔴",
-                PlayerStatus.ALL_IN: "⚪",
-                PlayerStatus.SITTING_OUT: "⚫",
-                PlayerStatus.ELIMINATED: "⚫"
-            }.get(player.status, "?")
-            
-            position_marker = ""
-            if player.is_dealer:
-                position_marker += "D "
-            if player.is_small_blind:
-                position_marker += "SB "
-            if player.is_big_blind:
-                position_marker += "BB "
+            status_symbol = STATUS_SYMBOLS.get(player.status, "?")
+            position_marker = POSITION_MARKERS[
+                (player.is_dealer, player.is_small_blind, player.is_big_blind)]
             
             current_marker = "→ " if i == state.current_player_idx else "  "
             
             cards_str = self.print_cards(player.hand.cards) if player.hand.cards else ""
             
-            print(f"{current_marker}{status_symbol} {player.name} ({position_marker}): ${player.chips} - Bet: ${player.current_bet}")
-            print(f"     Cards: {cards_str}")
+            write(f"{current_marker}{status_symbol} {player.name} ({position_marker}): ${player.chips} - Bet: ${player.current_bet}")
+            write(f"     Cards: {cards_str}")
         
-        print("="*80)
+        write("="*80)
         
         # Display current player and available actions
         if state.status == GameStatus.BETTING and state.current_player_idx >= 0:
             current_player = self.table.get_player_at_position(state.current_player_idx)
             if current_player:
-                print(f"Current Player: {current_player.name}")
+                write(f"Current Player: {current_player.name}")
                 
                 actions = self.game.get_available_actions(current_player.id)
                 if actions:
-                    print("Available Actions:")
+                    write("Available Actions:")
                     for action, amount in actions.items():
                         if action in (GameAction.FOLD, GameAction.CHECK):
-                            print(f"- {action.name}")
+                            write(f"- {action.name}")
                         else:
-                            print(f"- {action.name} (Min: ${amount})")
-                print()
+                            write(f"- {action.name} (Min: ${amount})")
+                write("")
+        
+        # One write for the whole state display instead of one per line
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def print_hand_result(self):
         """Print the results of the hand."""
@@ -156,8 +218,7 @@ class PokerCLI:
         print("\n" + "="*40 + " HAND RESULTS " + "="*40)
         
         # Get active players
-        active_players = [p for p in self.table.seats if p is not None and 
-                         p.status in (PlayerStatus.ACTIVE, PlayerStatus.ALL_IN)]
+        active_players = self.table.get_players_in_hand()
         
         if not active_players:
             print("No active players at showdown.")
@@ -169,68 +230,44 @@ class PokerCLI:
             print(f"{winner.name} wins ${self.game.state.pot} uncontested")
             return
         
-        # Evaluate each player's hand
+        # Score every player's hand for comparison in one pass over the board;
+        # equal scores are exact ties, so no kicker comparison is needed. This
+        # is the comparison Game uses to award the pot.
+        community_cards = self.game.state.community_cards
+        scores = HandEvaluator.evaluate_fast_many(
+            [player.hand.cards for player in active_players], community_cards)
+        
+        # Evaluate each player's hand for display
         print("Player Hands:")
-        player_hands = {}
-        for player in active_players:
+        descriptions = [""] * len(active_players)
+        for i, player in enumerate(active_players):
             # Combine hole cards and community cards
-            all_cards = player.hand.cards + self.game.state.community_cards
+            all_cards = player.hand.cards + community_cards
             
-            # Evaluate the hand
-            hand_rank, best_cards, description = HandEvaluator.evaluate(all_cards)
+            _, best_cards, descriptions[i] = HandEvaluator.evaluate(all_cards)
             
-            player_hands[player.id] = {
-                "player": player,
-                "hand_rank": hand_rank,
-                "best_cards": best_cards,
-                "description": description
-            }
-            
-            print(f"{player.name}: {description}")
+            print(f"{player.name}: {descriptions[i]}")
             print(f"  Cards: {self.print_cards(player.hand.cards)}")
             print(f"  Best 5: {self.print_cards(best_cards)}")
         
         # Determine winners
-        best_rank = HandRank.HIGH_CARD
-        for hand_info in player_hands.values():
-            if hand_info["hand_rank"] > best_rank:
-                best_rank = hand_info["hand_rank"]
-        
-        best_players = [info for info in player_hands.values() if info["hand_rank"] == best_rank]
+        winners = HandEvaluator.winning_indices(scores)
         
-        if len(best_players) == 1:
-            winner = best_players[0]["player"]
-            print(f"\n{winner.name} wins ${self.game.state.pot} with {best_players[0]['description']}")
+        if len(winners) == 1:
+            winner = active_players[winners[0]]
+            print(f"\n{winner.name} wins ${self.game.state.pot} with {descriptions[winners[0]]}")
         else:
-            # Compare kickers
-            best_kicker = None
-            tied_winners = []
-            
-            for player_info in best_players:
-                player = player_info["player"]
-                best_cards = player_info["best_cards"]
-                kicker = HandEvaluator._get_kicker_key(best_cards, best_rank)
-                
-                if best_kicker is None or kicker > best_kicker:
-                    best_kicker = kicker
-                    tied_winners = [player]
-                elif kicker == best_kicker:
-                    tied_winners.append(player)
-            
-            if len(tied_winners) == 1:
-                winner = tied_winners[0]
-                print(f"\n{winner.name} wins ${self.game.state.pot} with {player_hands[winner.id]['description']}")
-            else:
-                # True tie
-                winner_names = [p.name for p in tied_winners]
-                split_amount = self.game.state.pot // len(tied_winners)
-                print(f"\nTie between {', '.join(winner_names)}. Each wins ${split_amount}.")
+            # True tie
+            winner_names = [active_players[i].name for i in winners]
+            split_amount = self.game.state.pot // len(winners)
+            print(f"\nTie between {', '.join(winner_names)}. Each wins ${split_amount}.")
         
         print("="*90)
     
     def rig_deck(self):
         """Set up a rigged deck with predetermined cards."""
         self.rigged_deck = []
+        self._rigged_mask = 0
         self.rigged_mode = True
         
         print("\nRigging the deck. You can specify cards for players and community cards.")
@@ -255,12 +292,14 @@ class PokerCLI:
                         continue
                         
                     # Check for duplicate cards
-                    if any(c in self.rigged_deck for c in cards):
+                    mask = self._add_to_mask(cards)
+                    if mask is None:
                         print("Duplicate card detected. Please use unique cards.")
                         continue
                         
                     # Add cards to the rigged deck
                     self.rigged_deck.extend(cards)
+                    self._rigged_mask = mask
                     break
                 except Exception as e:
                     print(f"Error: {e}")
@@ -278,19 +317,21 @@ class PokerCLI:
                     continue
                     
                 # Check for duplicate cards
-                if any(c in self.rigged_deck for c in cards):
+                mask = self._add_to_mask(cards)
+                if mask is None:
                     print("Duplicate card detected. Please use unique cards.")
                     continue
                     
                 # Add cards to the rigged deck
                 self.rigged_deck.extend(cards)
+                self._rigged_mask = mask
                 break
             except Exception as e:
                 print(f"Error: {e}")
         
         # Fill the rest of the deck with random cards
-        all_cards = [Card(rank, suit) for suit in Suit for rank in Rank]
-        remaining_cards = [c for c in all_cards if c not in self.rigged_deck]
+        rigged_mask = self._rigged_mask
+        remaining_cards = [c for c, bit in _CARD_BITS.items() if not rigged_mask & bit]
         random.shuffle(remaining_cards)
         
         # Complete the rigged deck
@@ -298,6 +339,16 @@ class PokerCLI:
         
         print(f"Deck rigged with {len(self.rigged_deck)} cards.")
     
+    def _add_to_mask(self, cards):
+        """Return the rigged-card mask with cards added, or None if any card repeats."""
+        mask = self._rigged_mask
+        for card in cards:
+            bit = _CARD_BITS[card]
+            if mask & bit:
+                return None
+            mask |= bit
+        return mask
+    
     def _create_rigged_deck(self):
         """Create a rigged deck with predetermined cards."""
         if not self.rigged_mode or not self.rigged_deck:
@@ -310,69 +361,21 @@ class PokerCLI:
         
         # Reset rigged deck (used only once)
         self.rigged_deck = []
+        self._rigged_mask = 0
         self.rigged_mode = False
         
         return deck
     
     def parse_cards(self, cards_str):
         """Parse a string of cards into Card objects."""
-        card_strings = cards_str.split()
         cards = []
         
-        for card_str in card_strings:
-            card_str = card_str.strip()
-            
-            # Handle the value part
-            if card_str[0] == '1' and len(card_str) > 2:  # Handle '10'
-                value = card_str[:2]
-                suit_char = card_str[2]
-            else:
-                value = card_str[0]
-                suit_char = card_str[1]
-            
-            # Map value to Rank
-            rank_map = {
-                '2': Rank.TWO,
-                '3': Rank.THREE,
-                '4': Rank.FOUR,
-                '5': Rank.FIVE,
-                '6': Rank.SIX,
-                '7': Rank.SEVEN,
-                '8': Rank.EIGHT,
-                '9': Rank.NINE,
-                '10': Rank.TEN,
-                'J': Rank.JACK,
-                'j': Rank.JACK,
-                'Q': Rank.QUEEN,
-                'q': Rank.QUEEN,
-                'K': Rank.KING,
-                'k': Rank.KING,
-                'A': Rank.ACE,
-                'a': Rank.ACE
-            }
-            
-            # Map suit char to Suit
-            suit_map = {
-                'c': Suit.CLUBS,
-                'C': Suit.CLUBS,
-                'd': Suit.DIAMONDS,
-                'D': Suit.DIAMONDS,
-                'h': Suit.HEARTS,
-                'H': Suit.HEARTS,
-                's': Suit.SPADES,
-                'S': Suit.SPADES,
-                '♣': Suit.CLUBS,
-                '♦': Suit.DIAMONDS,
-                '♥': Suit.HEARTS,
-                '♠': Suit.SPADES
-            }
-            
-            try:
-                rank = rank_map[value]
-                suit = suit_map[suit_char]
-                cards.append(Card(rank, suit))
-            except KeyError:
+        for card_str in cards_str.split():
+            # A rank of '10' takes two characters; anything after the suit is ignored
+            card = _CARDS_BY_STR.get(card_str[:3] if card_str[0] == '1' else card_str[:2])
+            if card is None:
                 raise ValueError(f"Invalid card format: {card_str}")
+            cards.append(card)
         
         return cards
     
@@ -386,22 +389,8 @@ class PokerCLI:
             print("Game is not in WAITING state. Resetting game...")
             self.game.reset_game()
         
-        # Override the deck creation if in rigged mode
-        if self.rigged_mode and self.rigged_deck:
-            original_create_deck = create_deck
-            
-            # Monkey patch create_deck with our rigged version
-            import core.card
-            core.card.create_deck = self._create_rigged_deck
-            
-            # Start the hand
-            result = self.game.start_hand()
-            
-            # Restore the original function
-            core.card.create_deck = original_create_deck
-        else:
-            # Start with normal deck
-            result = self.game.start_hand()
+        # The game's deck factory deals the rigged deck if one is set
+        result = self.game.start_hand()
         
         if result:
             print("Hand started successfully.")
@@ -499,7 +488,8 @@ class PokerCLI:
         while self.game.state.status == GameStatus.BETTING:
             if not self.handle_player_action_auto():
                 break
-            time.sleep(0.5)  # Slight delay between actions
+            if self.interactive_auto:
+                time.sleep(0.5)  # Slight delay between actions
         
         self.auto_advance = False
     
@@ -552,7 +542,8 @@ class PokerCLI:
                 self.print_hand_result()
                 return False
             else:
-                self.print_game_state()
+                if self.interactive_auto:
+                    self.print_game_state()
                 return True
         else:
             print("Action failed.")
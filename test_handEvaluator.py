@@ -5,6 +5,7 @@ Shows comprehensive comparison information between multiple players' hands.
 """
 import sys
 import os
+from functools import lru_cache
 from typing import List, Tuple
 import itertools
 
@@ -14,85 +15,333 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.card import Card, Rank, Suit
 from core.hand import HandEvaluator, HandRank
 
+# Accepted spellings of each rank and suit in card strings
+_RANK_CHARS = {
+    '2': Rank.TWO,
+    '3': Rank.THREE,
+    '4': Rank.FOUR,
+    '5': Rank.FIVE,
+    '6': Rank.SIX,
+    '7': Rank.SEVEN,
+    '8': Rank.EIGHT,
+    '9': Rank.NINE,
+    '10': Rank.TEN,
+    'J': Rank.JACK,
+    'j': Rank.JACK,
+    'Q': Rank.QUEEN,
+    'q': Rank.QUEEN,
+    'K': Rank.KING,
+    'k': Rank.KING,
+    'A': Rank.ACE,
+    'a': Rank.ACE
+}
+
+_SUIT_CHARS = {
+    'c': Suit.CLUBS,
+    'C': Suit.CLUBS,
+    'd': Suit.DIAMONDS,
+    'D': Suit.DIAMONDS,
+    'h': Suit.HEARTS,
+    'H': Suit.HEARTS,
+    's': Suit.SPADES,
+    'S': Suit.SPADES,
+    '♣': Suit.CLUBS,
+    '♦': Suit.DIAMONDS,
+    '♥': Suit.HEARTS,
+    '♠': Suit.SPADES
+}
+
+# Readable rank names indexed by rank value (2-14, and 1 for an ace played low)
+_RANK_NAMES = (
+    "", "Ace",
+    "Two", "Three", "Four", "Five", "Six", "Seven", "Eight",
+    "Nine", "Ten", "Jack", "Queen", "King", "Ace"
+)
+
+# Every valid card string (e.g. 'As', '10c', 'q♥') mapped to its canonical card
+_CARDS_BY_STR = {
+    value + suit_char: Card(rank, suit)
+    for value, rank in _RANK_CHARS.items()
+    for suit_char, suit in _SUIT_CHARS.items()
+}
+
 def parse_card(card_str):
     """Parse a card string like 'As' or '10c' into a Card object."""
     card_str = card_str.strip()
     
-    # Handle the value part
-    if card_str[0] == '1' and len(card_str) > 2:  # Handle '10'
-        value = card_str[:2]
-        suit_char = card_str[2]
-    else:
-        value = card_str[0]
-        suit_char = card_str[1]
-    
-    # Map value to Rank
-    rank_map = {
-        '2': Rank.TWO,
-        '3': Rank.THREE,
-        '4': Rank.FOUR,
-        '5': Rank.FIVE,
-        '6': Rank.SIX,
-        '7': Rank.SEVEN,
-        '8': Rank.EIGHT,
-        '9': Rank.NINE,
-        '10': Rank.TEN,
-        'J': Rank.JACK,
-        'j': Rank.JACK,
-        'Q': Rank.QUEEN,
-        'q': Rank.QUEEN,
-        'K': Rank.KING,
-        'k': Rank.KING,
-        'A': Rank.ACE,
-        'a': Rank.ACE
-    }
-    
-    # Map suit char to Suit
-    suit_map = {
-        'c': Suit.CLUBS,
-        'C': Suit.CLUBS,
-        'd': Suit.DIAMONDS,
-        'D': Suit.DIAMONDS,
-        'h': Suit.HEARTS,
-        'H': Suit.HEARTS,
-        's': Suit.SPADES,
-        'S': Suit.SPADES,
-        '♣': Suit.CLUBS,
-        '♦': Suit.DIAMONDS,
-        '♥': Suit.HEARTS,
-        '♠': Suit.SPADES
-    }
+    # A rank of '10' takes two characters; anything after the suit is ignored
+    card = _CARDS_BY_STR.get(card_str[:3] if card_str[:1] == '1' else card_str[:2])
+    if card is None:
+        raise ValueError(f"Invalid card format: {card_str}")
+    return card
+
+def parse_cards(cards_str):
+    """Parse a string of multiple cards, or a list of card strings."""
+    card_strings = cards_str.split() if isinstance(cards_str, str) else cards_str
     
+    # Look every card up directly; only fall back to parse_card (which strips
+    # whitespace and reports the bad card) if one is not found
+    cards_by_str = _CARDS_BY_STR
     try:
-        rank = rank_map[value]
-        suit = suit_map[suit_char]
-        return Card(rank, suit)
+        return [cards_by_str[s[:3] if s[:1] == '1' else s[:2]] for s in card_strings]
     except KeyError:
-        raise ValueError(f"Invalid card format: {card_str}")
+        return [parse_card(card_str) for card_str in card_strings]
 
-def parse_cards(cards_str):
-    """Parse a string of multiple cards."""
-    card_strings = cards_str.split()
-    return [parse_card(card_str) for card_str in card_strings]
+@lru_cache(maxsize=4096)
+def evaluate_hand(cards):
+    """
+    HandEvaluator.evaluate for a tuple of cards, cached so the same cards
+    (in the same order) are only evaluated once. The result is shared, so
+    callers must not modify the returned best cards.
+    """
+    return HandEvaluator.evaluate(list(cards))
+
+@lru_cache(maxsize=4096)
+def kicker_key(best_cards, hand_rank):
+    """HandEvaluator._get_kicker_key for a tuple of cards, cached like evaluate_hand."""
+    return HandEvaluator._get_kicker_key(list(best_cards), hand_rank)
 
 def rank_value_to_name(value):
     """Convert a card rank value to a readable name."""
-    rank_names = {
-        2: "Two",
-        3: "Three",
-        4: "Four",
-        5: "Five",
-        6: "Six",
-        7: "Seven",
-        8: "Eight",
-        9: "Nine",
-        10: "Ten",
-        11: "Jack",
-        12: "Queen",
-        13: "King",
-        14: "Ace"
-    }
-    return rank_names.get(value, str(value))
+    return _RANK_NAMES[value] if 2 <= value <= 14 else str(value)
+
+def score_key(score):
+    """
+    The rank values packed into an evaluate_fast score, most significant first:
+    the ranks that decide ties within the hand rank (a straight is just its
+    high card, 5 for a wheel).
+    """
+    key = []
+    for shift in (16, 12, 8, 4, 0):
+        value = score >> shift & 0xF
+        if not value:
+            break
+        key.append(value)
+    return tuple(key)
+
+def _first_differences(players_with_keys):
+    """
+    For each pair of neighbouring players (sorted best first), the first
+    position where their score keys differ, or None if the keys are equal.
+    """
+    diffs = []
+    for p1, p2 in zip(players_with_keys, players_with_keys[1:]):
+        for j, (value1, value2) in enumerate(zip(p1[2], p2[2])):
+            if value1 != value2:
+                diffs.append(j)
+                break
+        else:
+            diffs.append(None)
+    return diffs
+
+def _explain_royal_flush(players_with_keys, _diffs):
+    """Explain a tie between royal flushes."""
+    explanations = []
+    # All royal flushes are equal
+    names = [p[1] for p in players_with_keys]
+    explanations.append(f"Players with Royal Flush tie: {', '.join(names)}")
+    return explanations
+
+def _explain_straight_flush(players_with_keys, _diffs):
+    """Explain straight flushes by their high card."""
+    explanations = []
+    best_key = players_with_keys[0][2]
+    best_players = [p for p in players_with_keys if p[2] == best_key]
+
+    if len(best_players) > 1:
+        # Tied straight flushes
+        names = [p[1] for p in best_players]
+        high_card = best_players[0][3][0]
+        explanations.append(f"Players tie with {high_card}-high Straight Flush: {', '.join(names)}")
+    else:
+        # Compare straight flush by high card
+        winner = best_players[0][1]
+        high_card = best_players[0][3][0]
+        others = [p[1] for p in players_with_keys if p[1] != winner]
+        explanations.append(f"{winner} wins with {high_card}-high Straight Flush vs {', '.join(others)}")
+    return explanations
+
+def _explain_four_of_a_kind(players_with_keys, diffs):
+    """Explain four of a kind by the quads rank, then the kicker."""
+    explanations = []
+    # Compare by quads rank, then kicker
+    for i in range(len(players_with_keys) - 1):
+        p1 = players_with_keys[i]
+        p2 = players_with_keys[i + 1]
+
+        if diffs[i] == 0:
+            # Different quad ranks
+            quad_rank1 = p1[3][0]
+            quad_rank2 = p2[3][0]
+            explanations.append(f"{p1[1]} beats {p2[1]} with four {quad_rank1}s vs four {quad_rank2}s")
+        else:
+            # Same quads, different kicker
+            kicker1 = p1[3][1]
+            kicker2 = p2[3][1]
+            explanations.append(f"{p1[1]} beats {p2[1]} with {kicker1} kicker vs {kicker2} kicker (both have four {p1[3][0]}s)")
+    return explanations
+
+def _explain_full_house(players_with_keys, diffs):
+    """Explain full houses by the trips rank, then the pair rank."""
+    explanations = []
+    # Compare by trips rank, then pair rank
+    for i in range(len(players_with_keys) - 1):
+        p1 = players_with_keys[i]
+        p2 = players_with_keys[i + 1]
+
+        if diffs[i] == 0:
+            # Different trip ranks
+            trips1 = p1[3][0]
+            trips2 = p2[3][0]
+            explanations.append(f"{p1[1]} beats {p2[1]} with {trips1}s full vs {trips2}s full")
+        else:
+            # Same trips, different pairs
+            trips = p1[3][0]
+            pair1 = p1[3][1]
+            pair2 = p2[3][1]
+            explanations.append(f"{p1[1]} beats {p2[1]} with {trips}s full of {pair1}s vs {trips}s full of {pair2}s")
+    return explanations
+
+def _explain_flush(players_with_keys, diffs):
+    """Explain flushes by the first differing card."""
+    explanations = []
+    # Compare by highest card, then next highest, etc.
+    for i in range(len(players_with_keys) - 1):
+        p1 = players_with_keys[i]
+        p2 = players_with_keys[i + 1]
+
+        # The first differing card
+        j = diffs[i]
+        if j is not None:
+            card1 = p1[3][j]
+            card2 = p2[3][j]
+            explanations.append(f"{p1[1]} beats {p2[1]} with {card1}-high flush vs {card2}-high flush")
+    return explanations
+
+def _explain_straight(players_with_keys, _diffs):
+    """Explain straights by their high card."""
+    explanations = []
+    # Compare by highest card
+    best_key = players_with_keys[0][2]
+    best_players = [p for p in players_with_keys if p[2] == best_key]
+
+    if len(best_players) > 1:
+        # Tied straights
+        names = [p[1] for p in best_players]
+        high_card = best_players[0][3][0]
+        explanations.append(f"Players tie with {high_card}-high Straight: {', '.join(names)}")
+    else:
+        # Different high cards
+        winner = best_players[0][1]
+        high_card = best_players[0][3][0]
+        others = [p[1] for p in players_with_keys if p[1] != winner]
+        explanations.append(f"{winner} wins with {high_card}-high Straight vs {', '.join(others)}")
+    return explanations
+
+def _explain_three_of_a_kind(players_with_keys, diffs):
+    """Explain three of a kind by the trips rank, then the kickers."""
+    explanations = []
+    # Compare by trips rank, then kickers
+    for i in range(len(players_with_keys) - 1):
+        p1 = players_with_keys[i]
+        p2 = players_with_keys[i + 1]
+
+        if diffs[i] == 0:
+            # Different trip ranks
+            trips1 = p1[3][0]
+            trips2 = p2[3][0]
+            explanations.append(f"{p1[1]} beats {p2[1]} with three {trips1}s vs three {trips2}s")
+        else:
+            # Same trips, compare kickers
+            trips = p1[3][0]
+            # The first differing kicker
+            j = diffs[i]
+            if j is not None:
+                kicker1 = p1[3][j]
+                kicker2 = p2[3][j]
+                explanations.append(f"{p1[1]} beats {p2[1]} with three {trips}s, {kicker1} kicker vs {kicker2} kicker")
+    return explanations
+
+def _explain_two_pair(players_with_keys, diffs):
+    """Explain two pair by the high pair, the low pair, then the kicker."""
+    explanations = []
+    # Compare by high pair, low pair, then kicker
+    for i in range(len(players_with_keys) - 1):
+        p1 = players_with_keys[i]
+        p2 = players_with_keys[i + 1]
+
+        if diffs[i] == 0:
+            # Different high pair
+            pair1 = p1[3][0]
+            pair2 = p2[3][0]
+            explanations.append(f"{p1[1]} beats {p2[1]} with {pair1}s and {p1[3][1]}s vs {pair2}s and {p2[3][1]}s")
+        elif diffs[i] == 1:
+            # Same high pair, different low pair
+            high = p1[3][0]
+            low1 = p1[3][1]
+            low2 = p2[3][1]
+            explanations.append(f"{p1[1]} beats {p2[1]} with {high}s and {low1}s vs {high}s and {low2}s")
+        else:
+            # Same pairs, different kicker
+            high = p1[3][0]
+            low = p1[3][1]
+            kicker1 = p1[3][2]
+            kicker2 = p2[3][2]
+            explanations.append(f"{p1[1]} beats {p2[1]} with {high}s and {low}s, {kicker1} kicker vs {kicker2} kicker")
+    return explanations
+
+def _explain_pair(players_with_keys, diffs):
+    """Explain pairs by the pair rank, then the kickers."""
+    explanations = []
+    # Compare by pair rank, then kickers
+    for i in range(len(players_with_keys) - 1):
+        p1 = players_with_keys[i]
+        p2 = players_with_keys[i + 1]
+
+        if diffs[i] == 0:
+            # Different pair rank
+            pair1 = p1[3][0]
+            pair2 = p2[3][0]
+            explanations.append(f"{p1[1]} beats {p2[1]} with pair of {pair1}s vs pair of {pair2}s")
+        else:
+            # Same pair, the first differing kicker
+            pair = p1[3][0]
+            j = diffs[i]
+            if j is not None:
+                kicker1 = p1[3][j]
+                kicker2 = p2[3][j]
+                explanations.append(f"{p1[1]} beats {p2[1]} with pair of {pair}s, {kicker1} kicker vs {kicker2} kicker")
+    return explanations
+
+def _explain_high_card(players_with_keys, diffs):
+    """Explain high-card hands by the first differing card."""
+    explanations = []
+    # Compare by highest card, then next highest, etc.
+    for i in range(len(players_with_keys) - 1):
+        p1 = players_with_keys[i]
+        p2 = players_with_keys[i + 1]
+
+        # The first differing card
+        j = diffs[i]
+        if j is not None:
+            card1 = p1[3][j]
+            card2 = p2[3][j]
+            explanations.append(f"{p1[1]} beats {p2[1]} with {card1} high vs {card2} high")
+    return explanations
+
+# Tie-break explainer for each hand rank, called with a sorted rank group
+_EXPLAINERS = {
+    HandRank.ROYAL_FLUSH: _explain_royal_flush,
+    HandRank.STRAIGHT_FLUSH: _explain_straight_flush,
+    HandRank.FOUR_OF_A_KIND: _explain_four_of_a_kind,
+    HandRank.FULL_HOUSE: _explain_full_house,
+    HandRank.FLUSH: _explain_flush,
+    HandRank.STRAIGHT: _explain_straight,
+    HandRank.THREE_OF_A_KIND: _explain_three_of_a_kind,
+    HandRank.TWO_PAIR: _explain_two_pair,
+    HandRank.PAIR: _explain_pair,
+    HandRank.HIGH_CARD: _explain_high_card
+}
 
 def get_comparison_explanation(players_hands):
     """
@@ -101,216 +350,44 @@ def get_comparison_explanation(players_hands):
     """
     if len(players_hands) < 2:
         return []
-    
+
     explanations = []
-    
-    # Group players by hand rank
-    rank_groups = {}
-    for i, (name, hand_rank, best_cards, description) in enumerate(players_hands):
-        if hand_rank not in rank_groups:
-            rank_groups[hand_rank] = []
-        rank_groups[hand_rank].append((i, name, best_cards, description))
-    
-    # Sort rank groups by hand rank (highest first)
-    sorted_ranks = sorted(rank_groups.keys(), reverse=True)
-    
+
+    # Group players by the hand rank in their score
+    buckets = [[] for _ in range(HandRank.ROYAL_FLUSH.value + 1)]
+    for i, (name, hand_rank, best_cards, description, key, score) in enumerate(players_hands):
+        buckets[score >> 20].append((i, name, score))
+
+    # Walk the buckets from the highest hand rank down
+    sorted_ranks = [rank for rank in range(len(buckets) - 1, -1, -1) if buckets[rank]]
+
     # If all players have different hand ranks, explain the ranking order
-    if len(rank_groups) == len(players_hands):
+    if len(sorted_ranks) == len(players_hands):
         top_rank = sorted_ranks[0]
-        top_player = rank_groups[top_rank][0][1]
+        top_player = buckets[top_rank][0][1]
         explanation = f"{top_player} wins with {HandRank(top_rank).name} - higher hand rank than all others"
         explanations.append(explanation)
         return explanations
-    
+
     # For each rank group with multiple players, explain tie breakers
     for rank in sorted_ranks:
-        players_in_group = rank_groups[rank]
-        
+        players_in_group = buckets[rank]
+
         # Skip groups with only one player
         if len(players_in_group) < 2:
             continue
-        
-        # Get kicker keys for comparison
+
+        # Sort players by score (best first), the same order determine_winners
+        # uses, keyed by the ranks in the score and naming each of them once
         players_with_keys = []
-        for idx, name, best_cards, description in players_in_group:
-            key = HandEvaluator._get_kicker_key(best_cards, rank)
-            players_with_keys.append((idx, name, key))
-        
-        # Sort players by kicker key (best first)
-        players_with_keys.sort(key=lambda x: x[2], reverse=True)
-        
-        # Generate explanation based on hand type
-        hand_type = HandRank(rank)
-        
-        if hand_type == HandRank.ROYAL_FLUSH:
-            # All royal flushes are equal
-            names = [p[1] for p in players_with_keys]
-            explanations.append(f"Players with Royal Flush tie: {', '.join(names)}")
-            
-        elif hand_type == HandRank.STRAIGHT_FLUSH:
-            best_key = players_with_keys[0][2]
-            best_players = [p for p in players_with_keys if p[2] == best_key]
-            
-            if len(best_players) > 1:
-                # Tied straight flushes
-                names = [p[1] for p in best_players]
-                high_card = rank_value_to_name(best_key[0])
-                explanations.append(f"Players tie with {high_card}-high Straight Flush: {', '.join(names)}")
-            else:
-                # Compare straight flush by high card
-                winner = best_players[0][1]
-                high_card = rank_value_to_name(best_key[0])
-                others = [p[1] for p in players_with_keys if p[1] != winner]
-                explanations.append(f"{winner} wins with {high_card}-high Straight Flush vs {', '.join(others)}")
-                
-        elif hand_type == HandRank.FOUR_OF_A_KIND:
-            # Compare by quads rank, then kicker
-            for i in range(len(players_with_keys) - 1):
-                p1 = players_with_keys[i]
-                p2 = players_with_keys[i + 1]
-                
-                if p1[2][0] != p2[2][0]:
-                    # Different quad ranks
-                    quad_rank1 = rank_value_to_name(p1[2][0])
-                    quad_rank2 = rank_value_to_name(p2[2][0])
-                    explanations.append(f"{p1[1]} beats {p2[1]} with four {quad_rank1}s vs four {quad_rank2}s")
-                else:
-                    # Same quads, different kicker
-                    kicker1 = rank_value_to_name(p1[2][1])
-                    kicker2 = rank_value_to_name(p2[2][1])
-                    explanations.append(f"{p1[1]} beats {p2[1]} with {kicker1} kicker vs {kicker2} kicker (both have four {rank_value_to_name(p1[2][0])}s)")
-        
-        elif hand_type == HandRank.FULL_HOUSE:
-            # Compare by trips rank, then pair rank
-            for i in range(len(players_with_keys) - 1):
-                p1 = players_with_keys[i]
-                p2 = players_with_keys[i + 1]
-                
-                if p1[2][0] != p2[2][0]:
-                    # Different trip ranks
-                    trips1 = rank_value_to_name(p1[2][0])
-                    trips2 = rank_value_to_name(p2[2][0])
-                    explanations.append(f"{p1[1]} beats {p2[1]} with {trips1}s full vs {trips2}s full")
-                else:
-                    # Same trips, different pairs
-                    trips = rank_value_to_name(p1[2][0])
-                    pair1 = rank_value_to_name(p1[2][1])
-                    pair2 = rank_value_to_name(p2[2][1])
-                    explanations.append(f"{p1[1]} beats {p2[1]} with {trips}s full of {pair1}s vs {trips}s full of {pair2}s")
-        
-        elif hand_type == HandRank.FLUSH:
-            # Compare by highest card, then next highest, etc.
-            for i in range(len(players_with_keys) - 1):
-                p1 = players_with_keys[i]
-                p2 = players_with_keys[i + 1]
-                
-                # Find the first differing card
-                for j in range(5):
-                    if p1[2][j] != p2[2][j]:
-                        card1 = rank_value_to_name(p1[2][j])
-                        card2 = rank_value_to_name(p2[2][j])
-                        explanations.append(f"{p1[1]} beats {p2[1]} with {card1}-high flush vs {card2}-high flush")
-                        break
-        
-        elif hand_type == HandRank.STRAIGHT:
-            # Compare by highest card
-            best_key = players_with_keys[0][2]
-            best_players = [p for p in players_with_keys if p[2] == best_key]
-            
-            if len(best_players) > 1:
-                # Tied straights
-                names = [p[1] for p in best_players]
-                high_card = rank_value_to_name(best_key[0])
-                explanations.append(f"Players tie with {high_card}-high Straight: {', '.join(names)}")
-            else:
-                # Different high cards
-                winner = best_players[0][1]
-                high_card = rank_value_to_name(best_key[0])
-                others = [p[1] for p in players_with_keys if p[1] != winner]
-                explanations.append(f"{winner} wins with {high_card}-high Straight vs {', '.join(others)}")
-        
-        elif hand_type == HandRank.THREE_OF_A_KIND:
-            # Compare by trips rank, then kickers
-            for i in range(len(players_with_keys) - 1):
-                p1 = players_with_keys[i]
-                p2 = players_with_keys[i + 1]
-                
-                if p1[2][0] != p2[2][0]:
-                    # Different trip ranks
-                    trips1 = rank_value_to_name(p1[2][0])
-                    trips2 = rank_value_to_name(p2[2][0])
-                    explanations.append(f"{p1[1]} beats {p2[1]} with three {trips1}s vs three {trips2}s")
-                else:
-                    # Same trips, compare kickers
-                    trips = rank_value_to_name(p1[2][0])
-                    # Find first differing kicker
-                    for j in range(1, 3):
-                        if p1[2][j] != p2[2][j]:
-                            kicker1 = rank_value_to_name(p1[2][j])
-                            kicker2 = rank_value_to_name(p2[2][j])
-                            explanations.append(f"{p1[1]} beats {p2[1]} with three {trips}s, {kicker1} kicker vs {kicker2} kicker")
-                            break
-        
-        elif hand_type == HandRank.TWO_PAIR:
-            # Compare by high pair, low pair, then kicker
-            for i in range(len(players_with_keys) - 1):
-                p1 = players_with_keys[i]
-                p2 = players_with_keys[i + 1]
-                
-                if p1[2][0] != p2[2][0]:
-                    # Different high pair
-                    pair1 = rank_value_to_name(p1[2][0])
-                    pair2 = rank_value_to_name(p2[2][0])
-                    explanations.append(f"{p1[1]} beats {p2[1]} with {pair1}s and {rank_value_to_name(p1[2][1])}s vs {pair2}s and {rank_value_to_name(p2[2][1])}s")
-                elif p1[2][1] != p2[2][1]:
-                    # Same high pair, different low pair
-                    high = rank_value_to_name(p1[2][0])
-                    low1 = rank_value_to_name(p1[2][1])
-                    low2 = rank_value_to_name(p2[2][1])
-                    explanations.append(f"{p1[1]} beats {p2[1]} with {high}s and {low1}s vs {high}s and {low2}s")
-                else:
-                    # Same pairs, different kicker
-                    high = rank_value_to_name(p1[2][0])
-                    low = rank_value_to_name(p1[2][1])
-                    kicker1 = rank_value_to_name(p1[2][2])
-                    kicker2 = rank_value_to_name(p2[2][2])
-                    explanations.append(f"{p1[1]} beats {p2[1]} with {high}s and {low}s, {kicker1} kicker vs {kicker2} kicker")
-        
-        elif hand_type == HandRank.PAIR:
-            # Compare by pair rank, then kickers
-            for i in range(len(players_with_keys) - 1):
-                p1 = players_with_keys[i]
-                p2 = players_with_keys[i + 1]
-                
-                if p1[2][0] != p2[2][0]:
-                    # Different pair rank
-                    pair1 = rank_value_to_name(p1[2][0])
-                    pair2 = rank_value_to_name(p2[2][0])
-                    explanations.append(f"{p1[1]} beats {p2[1]} with pair of {pair1}s vs pair of {pair2}s")
-                else:
-                    # Same pair, find first differing kicker
-                    pair = rank_value_to_name(p1[2][0])
-                    for j in range(1, 4):
-                        if p1[2][j] != p2[2][j]:
-                            kicker1 = rank_value_to_name(p1[2][j])
-                            kicker2 = rank_value_to_name(p2[2][j])
-                            explanations.append(f"{p1[1]} beats {p2[1]} with pair of {pair}s, {kicker1} kicker vs {kicker2} kicker")
-                            break
-        
-        elif hand_type == HandRank.HIGH_CARD:
-            # Compare by highest card, then next highest, etc.
-            for i in range(len(players_with_keys) - 1):
-                p1 = players_with_keys[i]
-                p2 = players_with_keys[i + 1]
-                
-                # Find the first differing card
-                for j in range(5):
-                    if p1[2][j] != p2[2][j]:
-                        card1 = rank_value_to_name(p1[2][j])
-                        card2 = rank_value_to_name(p2[2][j])
-                        explanations.append(f"{p1[1]} beats {p2[1]} with {card1} high vs {card2} high")
-                        break
-    
+        for idx, name, score in sorted(players_in_group, key=lambda x: x[2], reverse=True):
+            key = score_key(score)
+            players_with_keys.append((idx, name, key, tuple(_RANK_NAMES[value] for value in key)))
+        diffs = _first_differences(players_with_keys)
+
+        # Explain the tie-breaks for this hand type
+        explanations.extend(_EXPLAINERS[rank](players_with_keys, diffs))
+
     return explanations
 
 def determine_winners(players_hands):
@@ -322,36 +399,59 @@ def determine_winners(players_hands):
     if not players_hands:
         return []
     
-    best_rank = HandRank.HIGH_CARD
-    best_key = None
+    # Single pass over the packed scores, keeping every player tied for the best
+    best_score = -1
     winners = []
-    
-    # First pass: find the highest hand rank
-    for i, (_, hand_rank, _, _) in enumerate(players_hands):
-        if hand_rank > best_rank:
-            best_rank = hand_rank
-    
-    # Second pass: find players with the highest rank
-    candidates = [i for i, (_, hand_rank, _, _) in enumerate(players_hands) if hand_rank == best_rank]
-    
-    # If only one player has the best rank, they win
-    if len(candidates) == 1:
-        return candidates
-    
-    # Third pass: compare kickers for tied players
-    for i in candidates:
-        best_cards = players_hands[i][2]
-        key = HandEvaluator._get_kicker_key(best_cards, best_rank)
-        
-        if best_key is None or key > best_key:
-            best_key = key
+    for i, score in enumerate(hand[5] for hand in players_hands):
+        if score > best_score:
+            best_score = score
             winners = [i]
-        elif key == best_key:
-            # True tie
+        elif score == best_score:
             winners.append(i)
     
     return winners
 
+def batch_winners(record):
+    """
+    Find the winners of one batch record: five community cards, then each
+    player's two hole cards, separated by '|' (e.g. "Ah Kd Qc Js 10h | As Ks | 2c 2d").
+    Returns list of indices of winning players.
+    """
+    fields = record.split('|')
+    community_cards = parse_cards(fields[0])
+    if len(community_cards) != 5:
+        raise ValueError("Please enter exactly 5 community cards!")
+    
+    hole_cards = [parse_cards(field) for field in fields[1:]]
+    if not hole_cards:
+        raise ValueError("No players added.")
+    if any(len(cards) != 2 for cards in hole_cards):
+        raise ValueError("Please enter exactly 2 hole cards!")
+    
+    all_cards = community_cards + [card for cards in hole_cards for card in cards]
+    if len(set(all_cards)) != len(all_cards):
+        raise ValueError("Duplicate card detected. Please use unique cards.")
+    
+    # The board is reduced once and shared by every player's score
+    scores = HandEvaluator.evaluate_fast_many(hole_cards, community_cards)
+    return HandEvaluator.winning_indices(scores)
+
+def run_batch(stream):
+    """
+    Print the winning player numbers (1-based) for each record in the stream.
+    Blank lines and lines starting with '#' are skipped.
+    """
+    for line_number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        try:
+            winners = batch_winners(line)
+        except ValueError as e:
+            print(f"Line {line_number}: Error: {e}")
+            continue
+        print(' '.join(str(i + 1) for i in winners))
+
 def main():
     """Run the multi-player hand comparison test."""
     print("🃏 Detailed Poker Hand Comparison Tool 🃏")
@@ -439,16 +539,21 @@ def main():
             continue
         
         # Evaluate each player's hand
-        players_hands = []  # List of (name, hand_rank, best_cards, description)
+        players_hands = []  # List of (name, hand_rank, best_cards, description, kicker_key, score)
         
         for name, hole_cards in players:
             # Combine hole cards with community cards
             all_cards = hole_cards + community_cards
             
             # Evaluate the hand
-            hand_rank, best_cards, description = HandEvaluator.evaluate(all_cards)
+            hand_rank, best_cards, description = evaluate_hand(tuple(all_cards))
             
-            players_hands.append((name, hand_rank, best_cards, description))
+            # Kicker key for display; the packed score (hand rank, then kickers)
+            # decides and orders the winners and drives the explanations
+            key = kicker_key(tuple(best_cards), hand_rank)
+            score = HandEvaluator.evaluate_fast(best_cards)
+            
+            players_hands.append((name, hand_rank, best_cards, description, key, score))
         
         # Determine winner(s)
         winner_indices = determine_winners(players_hands)
@@ -462,16 +567,10 @@ def main():
         print("\nPlayer hands (ranked from best to worst):")
         
         # Sort players by hand strength
-        ranked_players = []
-        for i, (name, hand_rank, best_cards, description) in enumerate(players_hands):
-            key = HandEvaluator._get_kicker_key(best_cards, hand_rank)
-            ranked_players.append((i, name, hand_rank, best_cards, description, key))
-        
-        # Sort by hand rank, then kicker key
-        ranked_players.sort(key=lambda x: (x[2], x[5]), reverse=True)
+        ranked_players = sorted(enumerate(players_hands), key=lambda x: x[1][5], reverse=True)
         
         # Display players in order
-        for rank, (i, name, hand_rank, best_cards, description, key) in enumerate(ranked_players, 1):
+        for rank, (i, (name, hand_rank, best_cards, description, key, score)) in enumerate(ranked_players, 1):
             player_cards = players[i][1]
             is_winner = i in winner_indices
             
@@ -500,4 +599,12 @@ def main():
         print()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == '--batch':
+        # Batch mode: python test_handEvaluator.py --batch [path], reading stdin without a path
+        if len(sys.argv) > 2 and sys.argv[2] != '-':
+            with open(sys.argv[2]) as batch_file:
+                run_batch(batch_file)
+        else:
+            run_batch(sys.stdin)
+    else:
+        main()
@@ -1,6 +1,7 @@
 """Unit tests for the Card module."""
+import pickle
 import unittest
-from core.card import Card, Suit, Rank, Deck
+from core.card import Card, Suit, Rank, Deck, CANONICAL_DECK
 
 
 class TestCard(unittest.TestCase):
@@ -36,6 +37,34 @@ class TestCard(unittest.TestCase):
         card_dict = {card1: "test"}
         self.assertEqual(card_dict[card2], "test")
 
+    def test_card_int_value(self):
+        """Test the Cactus-Kev integer encoding of cards."""
+        # King of diamonds: rank bit 11, diamond bit, rank index 11, prime 37
+        card = Card(Rank.KING, Suit.DIAMONDS)
+        self.assertEqual(card.int_value, 0x08004B25)
+        self.assertEqual(Card(Rank.TWO, Suit.SPADES).int_value, 0x00011002)
+
+        values = {Card(rank, suit).int_value for suit in Suit for rank in Rank}
+        self.assertEqual(len(values), 52)
+
+    def test_card_interning(self):
+        """Test that each rank and suit has a single shared card instance."""
+        card = Card(Rank.ACE, Suit.SPADES)
+        self.assertIs(Card(Rank.ACE, Suit.SPADES), card)
+        self.assertIs(pickle.loads(pickle.dumps(card)), card)
+        self.assertIsNot(Card(Rank.ACE, Suit.HEARTS), card)
+
+    def test_card_bitmask(self):
+        """Test that each card sets its own bit in its suit's 16-bit lane."""
+        self.assertEqual(Card(Rank.TWO, Suit.CLUBS).bitmask, 1)
+        self.assertEqual(Card(Rank.ACE, Suit.SPADES).bitmask, 1 << 60)
+
+        combined = 0
+        for suit in Suit:
+            for rank in Rank:
+                combined |= Card(rank, suit).bitmask
+        self.assertEqual(combined, 0x1FFF1FFF1FFF1FFF)
+
 
 class TestDeck(unittest.TestCase):
     def test_deck_creation(self):
@@ -66,19 +95,19 @@ class TestDeck(unittest.TestCase):
         deck2 = Deck()
         
         # Before shuffling, decks should have same order
-        self.assertEqual([str(c) for c in deck1.cards], [str(c) for c in deck2.cards])
+        self.assertEqual(deck1.cards, deck2.cards)
         
         # After shuffling, order should very likely be different
         deck2.shuffle()
         
         # There's a tiny chance this could fail if the shuffle doesn't change anything
         # but that's extremely unlikely with 52 cards
-        self.assertNotEqual([str(c) for c in deck1.cards], [str(c) for c in deck2.cards])
+        self.assertNotEqual(deck1.cards, deck2.cards)
     
     def test_deck_reset(self):
         """Test resetting the deck."""
         deck = Deck()
-        original_cards = [str(c) for c in deck.cards]
+        original_cards = list(deck.cards)
         
         # Deal some cards
         for _ in range(10):
@@ -90,7 +119,21 @@ class TestDeck(unittest.TestCase):
         deck.reset()
         
         self.assertEqual(len(deck.cards), 52)
-        self.assertEqual([str(c) for c in deck.cards], original_cards)
+        self.assertEqual(deck.cards, original_cards)
+
+    def test_canonical_deck(self):
+        """Test that decks share the canonical cards without sharing the list."""
+        self.assertEqual(len(set(CANONICAL_DECK)), 52)
+
+        deck = Deck()
+        self.assertEqual(tuple(deck.cards), CANONICAL_DECK)
+        for card, canonical in zip(deck.cards, CANONICAL_DECK):
+            self.assertIs(card, canonical)
+
+        deck.shuffle()
+        deck.deal()
+        self.assertEqual(len(CANONICAL_DECK), 52)
+        self.assertEqual(CANONICAL_DECK[0], Card(Rank.TWO, Suit.CLUBS))
 
 
 if __name__ == "__main__":
@@ -1,13 +1,28 @@
 """Unit tests for the Game module."""
 import unittest
-from unittest.mock import patch, MagicMock
 from core.game import Game, GameStatus, GameAction, BettingRound, GameConfig
 from core.player import Player, PlayerStatus
 from core.table import Table
-from core.card import Card, Rank, Suit
+from core.card import Card, Deck, Rank, Suit
 
 
-class TestGame(unittest.TestCase):
+_ACE_SPADES = Card(Rank.ACE, Suit.SPADES)
+
+
+class _FakeDeck:
+    """Deck stand-in that deals the ace of spades forever."""
+    __slots__ = ()
+
+    def deal(self):
+        return _ACE_SPADES
+
+    burn = deal
+
+
+_FAKE_DECK = _FakeDeck()
+
+
+class GameTestCase(unittest.TestCase):
     def setUp(self):
         """Set up a game with a table and players for testing."""
         # Create table
@@ -15,14 +30,13 @@ class TestGame(unittest.TestCase):
         
         # Create players
         self.players = [
-            Player(f"player{i}", name=f"Player {i}", chips=1000)
+            Player(f"player{i}", name=f"Player {i}", chips=1000, status=PlayerStatus.ACTIVE)
             for i in range(4)
         ]
         
         # Add players to table
         for i, player in enumerate(self.players):
             self.table.add_player(player, position=i)
-            player.status = PlayerStatus.ACTIVE
         
         # Create game
         self.config = GameConfig(
@@ -33,8 +47,11 @@ class TestGame(unittest.TestCase):
             max_players=6,
             starting_chips=1000
         )
-        self.game = Game("test_game", self.table, self.config)
-    
+        self.game = Game("test_game", self.table, self.config,
+                         deck_factory=lambda: _FAKE_DECK)
+
+
+class TestGame(GameTestCase):
     def test_game_creation(self):
         """Test that games can be created with proper attributes."""
         self.assertEqual(self.game.game_id, "test_game")
@@ -42,14 +59,8 @@ class TestGame(unittest.TestCase):
         self.assertEqual(self.game.config, self.config)
         self.assertEqual(self.game.state.status, GameStatus.WAITING)
     
-    @patch('core.game.create_deck')
-    def test_start_hand(self, mock_create_deck):
+    def test_start_hand(self):
         """Test starting a new hand."""
-        # Mock deck
-        mock_deck = MagicMock()
-        mock_deck.deal.return_value = Card(Rank.ACE, Suit.SPADES)
-        mock_create_deck.return_value = mock_deck
-        
         # Start hand
         result = self.game.start_hand()
         
@@ -79,18 +90,51 @@ class TestGame(unittest.TestCase):
         # Each player should have 2 cards
         for player in self.players:
             self.assertEqual(len(player.hand.cards), 2)
+
+    def test_deck_factory(self):
+        """Test that a deck factory supplies the deck for the hand."""
+        deck = Deck()
+        self.game.deck_factory = lambda: deck
+
+        self.assertTrue(self.game.start_hand())
+        self.assertIs(self.game.state.deck, deck)
+
+        # Unshuffled deck: hole cards are dealt one at a time around the table
+        dealt = [card for player in self.players for card in player.hand.cards]
+        self.assertEqual(len(dealt), 2 * len(self.players))
+        self.assertEqual(set(dealt), set(Deck().cards[:len(dealt)]))
+
+    def test_showdown_wheel_loses_to_six_high_straight(self):
+        """Test that the pot goes to a six-high straight over an ace-low straight."""
+        board = [Card(Rank.FIVE, Suit.CLUBS), Card(Rank.FOUR, Suit.CLUBS),
+                 Card(Rank.THREE, Suit.SPADES), Card(Rank.KING, Suit.DIAMONDS),
+                 Card(Rank.NINE, Suit.HEARTS)]
+        wheel, six_high = self.players[0], self.players[1]
+        wheel.receive_card(Card(Rank.ACE, Suit.HEARTS))
+        wheel.receive_card(Card(Rank.TWO, Suit.CLUBS))
+        six_high.receive_card(Card(Rank.SIX, Suit.HEARTS))
+        six_high.receive_card(Card(Rank.TWO, Suit.DIAMONDS))
+        for player in self.players[2:]:
+            player.status = PlayerStatus.FOLDED
+        for player in (wheel, six_high):
+            player.chips -= 100
+            player.total_bet = 100
+        self.game.state.community_cards = board
+        self.game.state.pot = 200
+        
+        self.game._go_to_showdown()
+        
+        self.assertEqual((wheel.chips, six_high.chips), (900, 1100))
+        self.assertEqual(self.game.state.status, GameStatus.FINISHED)
+
+class TestGameInHand(GameTestCase):
+    def setUp(self):
+        """Set up a game with a hand already started."""
+        super().setUp()
+        self.game.start_hand()
     
-    @patch('core.game.create_deck')
-    def test_handle_player_action_fold(self, mock_create_deck):
+    def test_handle_player_action_fold(self):
         """Test handling a fold action."""
-        # Mock deck
-        mock_deck = MagicMock()
-        mock_deck.deal.return_value = Card(Rank.ACE, Suit.SPADES)
-        mock_create_deck.return_value = mock_deck
-        
-        # Start hand
-        self.game.start_hand()
-        
         # Set up current player
         self.game.state.current_player_idx = 3
         current_player = self.players[3]
@@ -103,23 +147,14 @@ class TestGame(unittest.TestCase):
         self.assertEqual(current_player.status, PlayerStatus.FOLDED)
         self.assertTrue(current_player.has_acted)
     
-    @patch('core.game.create_deck')
-    def test_handle_player_action_check(self, mock_create_deck):
+    def test_handle_player_action_check(self):
         """Test handling a check action."""
-        # Mock deck
-        mock_deck = MagicMock()
-        mock_deck.deal.return_value = Card(Rank.ACE, Suit.SPADES)
-        mock_create_deck.return_value = mock_deck
-        
-        # Start hand and advance to flop
-        self.game.start_hand()
+        # Advance to flop
         self.game.state.betting_round = BettingRound.FLOP
         self.game.state.current_bet = 0
         
         # Reset player bets for new betting round
-        for player in self.players:
-            player.reset_for_new_betting_round()
-            player.has_acted = False
+        Player.reset_all_for_new_betting_round(self.players)
         
         # Set up current player
         self.game.state.current_player_idx = 0
@@ -133,17 +168,8 @@ class TestGame(unittest.TestCase):
         self.assertTrue(current_player.has_acted)
         self.assertEqual(current_player.current_bet, 0)
     
-    @patch('core.game.create_deck')
-    def test_handle_player_action_call(self, mock_create_deck):
+    def test_handle_player_action_call(self):
         """Test handling a call action."""
-        # Mock deck
-        mock_deck = MagicMock()
-        mock_deck.deal.return_value = Card(Rank.ACE, Suit.SPADES)
-        mock_create_deck.return_value = mock_deck
-        
-        # Start hand
-        self.game.start_hand()
-        
         # Set up current player
         self.game.state.current_player_idx = 3
         current_player = self.players[3]
@@ -159,17 +185,8 @@ class TestGame(unittest.TestCase):
         self.assertEqual(current_player.chips, initial_chips - 10)
         self.assertEqual(self.game.state.pot, 25)  # SB + BB + Call
     
-    @patch('core.game.create_deck')
-    def test_handle_player_action_raise(self, mock_create_deck):
+    def test_handle_player_action_raise(self):
         """Test handling a raise action."""
-        # Mock deck
-        mock_deck = MagicMock()
-        mock_deck.deal.return_value = Card(Rank.ACE, Suit.SPADES)
-        mock_create_deck.return_value = mock_deck
-        
-        # Start hand
-        self.game.start_hand()
-        
         # Set up current player
         self.game.state.current_player_idx = 3
         current_player = self.players[3]
@@ -187,20 +204,10 @@ class TestGame(unittest.TestCase):
         self.assertEqual(self.game.state.current_bet, 30)
         
         # Other players should need to act again
-        for player in self.players[:3]:
-            self.assertFalse(player.has_acted)
+        self.assertEqual([p.has_acted for p in self.players[:3]], [False] * 3)
     
-    @patch('core.game.create_deck')
-    def test_get_available_actions(self, mock_create_deck):
+    def test_get_available_actions(self):
         """Test getting available actions for a player."""
-        # Mock deck
-        mock_deck = MagicMock()
-        mock_deck.deal.return_value = Card(Rank.ACE, Suit.SPADES)
-        mock_create_deck.return_value = mock_deck
-        
-        # Start hand
-        self.game.start_hand()
-        
         # Set up current player (after the BB)
         self.game.state.current_player_idx = 3
         current_player = self.players[3]
@@ -223,8 +230,7 @@ class TestGame(unittest.TestCase):
         # Simulate moving to flop with no bets
         self.game.state.betting_round = BettingRound.FLOP
         self.game.state.current_bet = 0
-        for player in self.players:
-            player.reset_for_new_betting_round()
+        Player.reset_all_for_new_betting_round(self.players)
         
         # Get available actions again
         actions = self.game.get_available_actions(current_player.id)
@@ -236,17 +242,21 @@ class TestGame(unittest.TestCase):
         self.assertNotIn(GameAction.CALL, actions)
         self.assertNotIn(GameAction.RAISE, actions)
     
-    @patch('core.game.create_deck')
-    def test_reset_game(self, mock_create_deck):
-        """Test resetting the game."""
-        # Mock deck
-        mock_deck = MagicMock()
-        mock_deck.deal.return_value = Card(Rank.ACE, Suit.SPADES)
-        mock_create_deck.return_value = mock_deck
+    def test_available_actions_follow_changes(self):
+        """Test that available actions follow state and player changes."""
+        self.game.state.current_player_idx = 3
+        current_player = self.players[3]
         
-        # Start hand
-        self.game.start_hand()
+        self.assertEqual(self.game.get_available_actions(current_player.id)[GameAction.CALL], 10)
+        
+        self.game.state.current_bet = 40
+        self.assertEqual(self.game.get_available_actions(current_player.id)[GameAction.CALL], 40)
         
+        current_player.chips = 25
+        self.assertEqual(self.game.get_available_actions(current_player.id)[GameAction.CALL], 25)
+    
+    def test_reset_game(self):
+        """Test resetting the game."""
         # Advance to showdown
         self.game.state.status = GameStatus.SHOWDOWN
         self.game.state.betting_round = BettingRound.SHOWDOWN
@@ -263,11 +273,9 @@ class TestGame(unittest.TestCase):
         self.assertEqual(self.game.state.current_bet, 0)
         self.assertEqual(self.game.state.min_raise, self.config.big_blind)
         
-        # Players should be reset
-        for player in self.players:
-            self.assertEqual(player.current_bet, 0)
-            self.assertEqual(player.total_bet, 0)
-            self.assertEqual(len(player.hand.cards), 0)
+        # Players should be reset: (current bet, total bet, cards held)
+        self.assertEqual([(p.current_bet, p.total_bet, len(p.hand.cards)) for p in self.players],
+                         [(0, 0, 0)] * len(self.players))
 
 
 if __name__ == "__main__":
@@ -4,183 +4,148 @@ from core.card import Card, Suit, Rank
 from core.hand import Hand, HandEvaluator, HandRank
 
 
+# Every card by its spec code (rank symbol + suit initial), built once
+CARDS = {rank.symbol + suit.name[0]: Card(rank, suit) for rank in Rank for suit in Suit}
+
+
+def make_cards(spec: str):
+    """Build cards from a spec like "AH KD 10C" (rank symbol + suit initial)."""
+    return [CARDS[code] for code in spec.split()]
+
+
+# (case name, 7 cards, expected hand rank) for HandEvaluator.evaluate, built once at import
+EVALUATE_CASES = (
+    ("royal_flush", tuple(make_cards("AH KH QH JH 10H 2C 3D")), HandRank.ROYAL_FLUSH),
+    ("straight_flush", tuple(make_cards("9C 8C 7C 6C 5C 2H 3D")), HandRank.STRAIGHT_FLUSH),
+    ("four_of_a_kind", tuple(make_cards("QH QD QC QS 2H 3D 4C")), HandRank.FOUR_OF_A_KIND),
+    ("full_house", tuple(make_cards("KH KD KC 6H 6D 3C 4C")), HandRank.FULL_HOUSE),
+    ("flush", tuple(make_cards("AD JD 9D 7D 3D KC QH")), HandRank.FLUSH),
+    ("straight", tuple(make_cards("8H 7D 6C 5S 4H KC AD")), HandRank.STRAIGHT),
+    ("three_of_a_kind", tuple(make_cards("10H 10D 10C 5S 3H KC AD")), HandRank.THREE_OF_A_KIND),
+    ("two_pair", tuple(make_cards("JH JD 4C 4S 3H KC AD")), HandRank.TWO_PAIR),
+    ("pair", tuple(make_cards("QH QD 10C 8S 3H KC AD")), HandRank.PAIR),
+    ("high_card", tuple(make_cards("AH KD JC 9S 7H 5C 3D")), HandRank.HIGH_CARD),
+    ("ace_low_straight", tuple(make_cards("AH 2D 3C 4S 5H KC QD")), HandRank.STRAIGHT),
+)
+
+
 class TestHandEvaluator(unittest.TestCase):
-    def test_royal_flush(self):
-        """Test identification of a royal flush."""
-        cards = [
-            Card(Rank.ACE, Suit.HEARTS),
-            Card(Rank.KING, Suit.HEARTS),
-            Card(Rank.QUEEN, Suit.HEARTS),
-            Card(Rank.JACK, Suit.HEARTS),
-            Card(Rank.TEN, Suit.HEARTS),
-            Card(Rank.TWO, Suit.CLUBS),
-            Card(Rank.THREE, Suit.DIAMONDS)
-        ]
-        
-        rank, best_cards, description = HandEvaluator.evaluate(cards)
-        self.assertEqual(rank, HandRank.ROYAL_FLUSH)
-        self.assertEqual(len(best_cards), 5)
+    def test_evaluate(self):
+        """Test identification of each hand rank from 7 cards."""
+        for name, cards, expected_rank in EVALUATE_CASES:
+            with self.subTest(name):
+                rank, best_cards, description = HandEvaluator.evaluate(cards)
+                self.assertEqual(rank, expected_rank)
+                self.assertEqual(len(best_cards), 5)
     
-    def test_straight_flush(self):
-        """Test identification of a straight flush."""
-        cards = [
-            Card(Rank.NINE, Suit.CLUBS),
-            Card(Rank.EIGHT, Suit.CLUBS),
-            Card(Rank.SEVEN, Suit.CLUBS),
-            Card(Rank.SIX, Suit.CLUBS),
-            Card(Rank.FIVE, Suit.CLUBS),
-            Card(Rank.TWO, Suit.HEARTS),
-            Card(Rank.THREE, Suit.DIAMONDS)
-        ]
-        
-        rank, best_cards, description = HandEvaluator.evaluate(cards)
-        self.assertEqual(rank, HandRank.STRAIGHT_FLUSH)
-        self.assertEqual(len(best_cards), 5)
+    def test_wheel_kicker_key(self):
+        """Test that the ace plays low in the kicker key of a wheel."""
+        wheel = HandEvaluator._get_kicker_key(make_cards("5H 4D 3C 2S AH"), HandRank.STRAIGHT)
+        six_high = HandEvaluator._get_kicker_key(make_cards("6H 5D 4C 3S 2H"), HandRank.STRAIGHT)
+        self.assertEqual(wheel, [5, 4, 3, 2, 1])
+        self.assertLess(wheel, six_high)
     
-    def test_four_of_a_kind(self):
-        """Test identification of four of a kind."""
-        cards = [
-            Card(Rank.QUEEN, Suit.HEARTS),
-            Card(Rank.QUEEN, Suit.DIAMONDS),
-            Card(Rank.QUEEN, Suit.CLUBS),
-            Card(Rank.QUEEN, Suit.SPADES),
-            Card(Rank.TWO, Suit.HEARTS),
-            Card(Rank.THREE, Suit.DIAMONDS),
-            Card(Rank.FOUR, Suit.CLUBS)
-        ]
-        
-        rank, best_cards, description = HandEvaluator.evaluate(cards)
-        self.assertEqual(rank, HandRank.FOUR_OF_A_KIND)
-        self.assertEqual(len(best_cards), 5)
+    def test_wheel_straight_flush(self):
+        """Test that a suited A-2-3-4-5 is a five-high straight flush."""
+        rank, best_cards, description = HandEvaluator.evaluate(make_cards("AS 2S 3S 4S 5S KD 9H"))
+        self.assertEqual(rank, HandRank.STRAIGHT_FLUSH)
+        self.assertEqual(description, "Straight Flush, 5 high")
+
+
+class TestFastHandEvaluator(unittest.TestCase):
+    def assertScoreRank(self, spec, expected_rank):
+        """Check the hand rank encoded in a fast evaluator score."""
+        score = HandEvaluator.evaluate_fast(make_cards(spec))
+        self.assertEqual(HandRank(score >> 20), expected_rank)
+        return score
     
-    def test_full_house(self):
-        """Test identification of a full house."""
-        cards = [
-            Card(Rank.KING, Suit.HEARTS),
-            Card(Rank.KING, Suit.DIAMONDS),
-            Card(Rank.KING, Suit.CLUBS),
-            Card(Rank.SIX, Suit.HEARTS),
-            Card(Rank.SIX, Suit.DIAMONDS),
-            Card(Rank.THREE, Suit.CLUBS),
-            Card(Rank.FOUR, Suit.CLUBS)
+    def test_hand_ranks(self):
+        """Test that scores carry the expected hand rank."""
+        cases = [
+            ("AH KH QH JH 10H 2C 3D", HandRank.ROYAL_FLUSH),
+            ("9C 8C 7C 6C 5C 2H 3D", HandRank.STRAIGHT_FLUSH),
+            ("AS 2S 3S 4S 5S KD QD", HandRank.STRAIGHT_FLUSH),
+            ("QH QD QC QS 2H 3D 4C", HandRank.FOUR_OF_A_KIND),
+            ("KH KD KC 7S 7H 2D 3C", HandRank.FULL_HOUSE),
+            ("KH KD KC 7S 7H 7D 3C", HandRank.FULL_HOUSE),
+            ("AH JH 8H 6H 2H KD 3C", HandRank.FLUSH),
+            ("9H 8D 7C 6S 5H 2D KC", HandRank.STRAIGHT),
+            ("AH 2D 3C 4S 5H KC QD", HandRank.STRAIGHT),
+            ("JH JD JC 8S 6H 2D 3C", HandRank.THREE_OF_A_KIND),
+            ("AH AD 8C 8S 5H 2D 3C", HandRank.TWO_PAIR),
+            ("10H 10D 8C 6S 4H 2D 3C", HandRank.PAIR),
+            ("AH JD 9C 7S 5H 2D 3C", HandRank.HIGH_CARD),
         ]
-        
-        rank, best_cards, description = HandEvaluator.evaluate(cards)
-        self.assertEqual(rank, HandRank.FULL_HOUSE)
-        self.assertEqual(len(best_cards), 5)
+        for spec, expected_rank in cases:
+            with self.subTest(spec=spec):
+                self.assertScoreRank(spec, expected_rank)
     
-    def test_flush(self):
-        """Test identification of a flush."""
-        cards = [
-            Card(Rank.ACE, Suit.DIAMONDS),
-            Card(Rank.JACK, Suit.DIAMONDS),
-            Card(Rank.NINE, Suit.DIAMONDS),
-            Card(Rank.SEVEN, Suit.DIAMONDS),
-            Card(Rank.THREE, Suit.DIAMONDS),
-            Card(Rank.KING, Suit.CLUBS),
-            Card(Rank.QUEEN, Suit.HEARTS)
-        ]
-        
-        rank, best_cards, description = HandEvaluator.evaluate(cards)
-        self.assertEqual(rank, HandRank.FLUSH)
-        self.assertEqual(len(best_cards), 5)
+    def test_stronger_hand_rank_wins(self):
+        """Test that a stronger made hand beats a flush or straight on the same cards."""
+        self.assertScoreRank("KH KD KC 7H 7S 2H 3H", HandRank.FULL_HOUSE)
+        self.assertScoreRank("QH QD QC QS JS 10S 9S", HandRank.FOUR_OF_A_KIND)
+        self.assertScoreRank("8H 9D 10C JS QH QD QC", HandRank.STRAIGHT)
     
-    def test_straight(self):
-        """Test identification of a straight."""
-        cards = [
-            Card(Rank.EIGHT, Suit.HEARTS),
-            Card(Rank.SEVEN, Suit.DIAMONDS),
-            Card(Rank.SIX, Suit.CLUBS),
-            Card(Rank.FIVE, Suit.SPADES),
-            Card(Rank.FOUR, Suit.HEARTS),
-            Card(Rank.KING, Suit.CLUBS),
-            Card(Rank.ACE, Suit.DIAMONDS)
-        ]
+    def test_kickers(self):
+        """Test that scores compare kickers within the same hand rank."""
+        better = self.assertScoreRank("AH AD KC 9S 5H 3D 2C", HandRank.PAIR)
+        worse = self.assertScoreRank("AC AS QC 9D 5C 3H 2D", HandRank.PAIR)
+        self.assertGreater(better, worse)
         
-        rank, best_cards, description = HandEvaluator.evaluate(cards)
-        self.assertEqual(rank, HandRank.STRAIGHT)
-        self.assertEqual(len(best_cards), 5)
+        # The sixth and seventh cards do not play
+        self.assertEqual(HandEvaluator.evaluate_fast(make_cards("AH KD 9C 7S 5H 3D 2C")),
+                         HandEvaluator.evaluate_fast(make_cards("AC KS 9D 7C 5D 4H 3C")))
     
-    def test_three_of_a_kind(self):
-        """Test identification of three of a kind."""
-        cards = [
-            Card(Rank.TEN, Suit.HEARTS),
-            Card(Rank.TEN, Suit.DIAMONDS),
-            Card(Rank.TEN, Suit.CLUBS),
-            Card(Rank.FIVE, Suit.SPADES),
-            Card(Rank.THREE, Suit.HEARTS),
-            Card(Rank.KING, Suit.CLUBS),
-            Card(Rank.ACE, Suit.DIAMONDS)
-        ]
-        
-        rank, best_cards, description = HandEvaluator.evaluate(cards)
-        self.assertEqual(rank, HandRank.THREE_OF_A_KIND)
-        self.assertEqual(len(best_cards), 5)
+    def test_evaluate_fast_many(self):
+        """Test scoring several players against shared community cards."""
+        community_cards = make_cards("KH 9H 4C 2H 7D")
+        hole_cards = [make_cards("AH 3H"), make_cards("KD KS"), make_cards("QC JC")]
+        scores = HandEvaluator.evaluate_fast_many(hole_cards, community_cards)
+        self.assertEqual(scores, [HandEvaluator.evaluate_fast(cards + community_cards)
+                                  for cards in hole_cards])
+        self.assertEqual([HandRank(score >> 20) for score in scores],
+                         [HandRank.FLUSH, HandRank.THREE_OF_A_KIND, HandRank.HIGH_CARD])
     
-    def test_two_pair(self):
-        """Test identification of two pair."""
-        cards = [
-            Card(Rank.JACK, Suit.HEARTS),
-            Card(Rank.JACK, Suit.DIAMONDS),
-            Card(Rank.FOUR, Suit.CLUBS),
-            Card(Rank.FOUR, Suit.SPADES),
-            Card(Rank.THREE, Suit.HEARTS),
-            Card(Rank.KING, Suit.CLUBS),
-            Card(Rank.ACE, Suit.DIAMONDS)
-        ]
-        
-        rank, best_cards, description = HandEvaluator.evaluate(cards)
-        self.assertEqual(rank, HandRank.TWO_PAIR)
-        self.assertEqual(len(best_cards), 5)
+    def test_evaluate_with_board(self):
+        """Test scoring hole cards against a precomputed board."""
+        community_cards = make_cards("10S JS QS 2D 2C")
+        board = HandEvaluator.precompute_board(community_cards)
+        for spec in ("KS AS", "2H 2S", "10D 10H", "3C 4C"):
+            with self.subTest(hole_cards=spec):
+                hole_cards = make_cards(spec)
+                self.assertEqual(HandEvaluator.evaluate_with_board(hole_cards, board),
+                                 HandEvaluator.evaluate_fast(hole_cards + community_cards))
     
-    def test_pair(self):
-        """Test identification of a pair."""
-        cards = [
-            Card(Rank.QUEEN, Suit.HEARTS),
-            Card(Rank.QUEEN, Suit.DIAMONDS),
-            Card(Rank.TEN, Suit.CLUBS),
-            Card(Rank.EIGHT, Suit.SPADES),
-            Card(Rank.THREE, Suit.HEARTS),
-            Card(Rank.KING, Suit.CLUBS),
-            Card(Rank.ACE, Suit.DIAMONDS)
-        ]
-        
-        rank, best_cards, description = HandEvaluator.evaluate(cards)
-        self.assertEqual(rank, HandRank.PAIR)
-        self.assertEqual(len(best_cards), 5)
+    def test_evaluate_cases_from_bits(self):
+        """Test that the bitmask fast path agrees with the evaluate() cases."""
+        for name, cards, expected_rank in EVALUATE_CASES:
+            with self.subTest(name):
+                hand_mask = 0
+                for card in cards:
+                    hand_mask |= card.bitmask
+                self.assertEqual(HandRank(HandEvaluator.evaluate_bits(hand_mask) >> 20),
+                                 expected_rank)
     
-    def test_high_card(self):
-        """Test identification of high card."""
-        cards = [
-            Card(Rank.ACE, Suit.HEARTS),
-            Card(Rank.KING, Suit.DIAMONDS),
-            Card(Rank.JACK, Suit.CLUBS),
-            Card(Rank.NINE, Suit.SPADES),
-            Card(Rank.SEVEN, Suit.HEARTS),
-            Card(Rank.FIVE, Suit.CLUBS),
-            Card(Rank.THREE, Suit.DIAMONDS)
+    def test_evaluate_bits(self):
+        """Test scoring a hand from its combined card bitmask."""
+        cases = [
+            ("10S JS QS KS AS 2D 2C", HandRank.ROYAL_FLUSH),
+            ("7H 7D 7C 2S 2H", HandRank.FULL_HOUSE),
+            ("3C 4D 5H 6S 7C 9D JH", HandRank.STRAIGHT),
         ]
-        
-        rank, best_cards, description = HandEvaluator.evaluate(cards)
-        self.assertEqual(rank, HandRank.HIGH_CARD)
-        self.assertEqual(len(best_cards), 5)
+        for spec, expected_rank in cases:
+            with self.subTest(cards=spec):
+                hand_mask = 0
+                for card in make_cards(spec):
+                    hand_mask |= card.bitmask
+                self.assertEqual(HandRank(HandEvaluator.evaluate_bits(hand_mask) >> 20),
+                                 expected_rank)
     
-    def test_ace_low_straight(self):
-        """Test identification of A-2-3-4-5 straight."""
-        cards = [
-            Card(Rank.ACE, Suit.HEARTS),
-            Card(Rank.TWO, Suit.DIAMONDS),
-            Card(Rank.THREE, Suit.CLUBS),
-            Card(Rank.FOUR, Suit.SPADES),
-            Card(Rank.FIVE, Suit.HEARTS),
-            Card(Rank.KING, Suit.CLUBS),
-            Card(Rank.QUEEN, Suit.DIAMONDS)
-        ]
-        
-        rank, best_cards, description = HandEvaluator.evaluate(cards)
-        self.assertEqual(rank, HandRank.STRAIGHT)
-        self.assertEqual(len(best_cards), 5)
-
+    def test_wheel_is_lowest_straight(self):
+        """Test that A-2-3-4-5 ranks below a six-high straight."""
+        wheel = self.assertScoreRank("AH 2D 3C 4S 5H KC QD", HandRank.STRAIGHT)
+        six_high = self.assertScoreRank("6H 2D 3C 4S 5H KC QD", HandRank.STRAIGHT)
+        self.assertLess(wheel, six_high)
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
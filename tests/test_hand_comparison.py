@@ -0,0 +1,48 @@
+"""Unit tests for the hand comparison tool (test_handEvaluator.py)."""
+import unittest
+from core.hand import HandEvaluator
+from test_handEvaluator import (batch_winners, determine_winners, evaluate_hand, get_comparison_explanation,
+                                kicker_key, parse_cards)
+
+
+def players_hands(board, *hole_cards):
+    """Build the tool's (name, rank, best cards, description, key, score) entries."""
+    hands = []
+    for i, hole in enumerate(hole_cards, 1):
+        cards = tuple(parse_cards(hole) + parse_cards(board))
+        hand_rank, best_cards, description = evaluate_hand(cards)
+        hands.append((f"P{i}", hand_rank, best_cards, description,
+                      kicker_key(tuple(best_cards), hand_rank), HandEvaluator.evaluate_fast(best_cards)))
+    return hands
+
+
+class TestHandComparison(unittest.TestCase):
+    def test_wheel_loses_to_higher_straight(self):
+        """Test that the winner and the explanation agree when a wheel meets a higher straight."""
+        hands = players_hands("5c 4c 3s Kd 9h", "Ah 2c", "6h 2d")
+        self.assertEqual(determine_winners(hands), [1])
+        self.assertEqual(get_comparison_explanation(hands),
+                         ["P2 wins with Six-high Straight vs P1"])
+
+    def test_wheel_straight_flush(self):
+        """Test that a wheel straight flush is ranked and explained as a straight flush."""
+        hands = players_hands("5s 4s 3s Kd 9h", "As 2s", "6h 2d")
+        self.assertEqual(determine_winners(hands), [0])
+        self.assertEqual(get_comparison_explanation(hands),
+                         ["P1 wins with STRAIGHT_FLUSH - higher hand rank than all others"])
+
+    def test_batch_winners(self):
+        """Test that a batch record's winners are found and split pots are kept."""
+        self.assertEqual(batch_winners("5c 4c 3s Kd 9h | Ah 2c | 6h 2d"), [1])
+        self.assertEqual(batch_winners("Ah Kd Qc Js 10h | 2c 3d | 4c 5d"), [0, 1])
+
+    def test_batch_winners_rejects_duplicate_cards(self):
+        """Test that a card dealt twice in one batch record is rejected."""
+        with self.assertRaises(ValueError):
+            batch_winners("Ah Kd Qc Js 10h | Ah 2c | 6h 2d")
+        with self.assertRaises(ValueError):
+            batch_winners("5c 4c 3s Kd 9h | 7h 2c | 7h 2d")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -98,6 +98,20 @@ class TestPlayer(unittest.TestCase):
         self.assertEqual(self.player.current_bet, 0)
         self.assertFalse(self.player.has_acted)
     
+    def test_reset_all_for_new_betting_round(self):
+        """Test resetting several players for a new betting round at once."""
+        players = [self.player, Player(name="Other", chips=500)]
+        for player in players:
+            player.place_bet(50)
+            player.has_acted = True
+        
+        Player.reset_all_for_new_betting_round(players)
+        
+        for player in players:
+            self.assertEqual(player.current_bet, 0)
+            self.assertEqual(player.total_bet, 50)
+            self.assertFalse(player.has_acted)
+    
     def test_can_act(self):
         """Test checking if a player can act."""
         # Player is active with chips
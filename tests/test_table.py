@@ -11,15 +11,13 @@ class TestTable(unittest.TestCase):
         
         # Create some players
         self.players = [
-            Player(f"player{i}", name=f"Player {i}", chips=1000)
+            Player(f"player{i}", name=f"Player {i}", chips=1000, status=PlayerStatus.ACTIVE)
             for i in range(4)
         ]
         
         # Add players to table
         for i, player in enumerate(self.players):
             self.table.add_player(player, position=i)
-            # Set all players as ACTIVE instead of default SITTING_OUT
-            player.status = PlayerStatus.ACTIVE
     
     def test_table_creation(self):
         """Test that tables can be created with proper attributes."""
@@ -89,6 +87,12 @@ class TestTable(unittest.TestCase):
         
         for i, player in enumerate(self.players):
             self.assertEqual(positions[player.id], i)
+        
+        # The mapping follows removals, and callers get their own copy
+        positions.clear()
+        self.table.remove_player(self.players[0])
+        self.assertEqual(self.table.get_player_positions(),
+                         {player.id: i for i, player in enumerate(self.players) if i > 0})
     
     def test_get_empty_seats(self):
         """Test getting a list of empty seat positions."""
@@ -103,6 +107,13 @@ class TestTable(unittest.TestCase):
         # Now only position 5 should be empty
         empty_seats = self.table.get_empty_seats()
         self.assertEqual(empty_seats, [5])
+        
+        # Freed and replaced seats are tracked too
+        self.table.remove_player(self.players[1])
+        self.assertEqual(self.table.get_empty_seats(), [1, 5])
+        self.table.seats = [None, self.players[1], None, None, None, None]
+        self.assertEqual(self.table.get_empty_seats(), [0, 2, 3, 4, 5])
+        self.assertEqual(self.table.player_count(), 1)
     
     def test_is_full_and_empty(self):
         """Test checking if the table is full or empty."""
@@ -137,6 +148,11 @@ class TestTable(unittest.TestCase):
         
         # Active player count should be 3
         self.assertEqual(self.table.active_player_count(), 3)
+        
+        # All-in players still count; removed players don't
+        self.players[1].status = PlayerStatus.ALL_IN
+        self.table.remove_player(self.players[2])
+        self.assertEqual(self.table.active_player_count(), 2)
     
     def test_advance_dealer_button(self):
         """Test advancing the dealer button."""
@@ -225,6 +241,56 @@ class TestTable(unittest.TestCase):
         # Get next to act (should be player 2)
         next_player = self.table.get_next_to_act()
         self.assertEqual(next_player, self.players[2])
+    
+    def test_get_player(self):
+        """Test looking up seated players by ID."""
+        self.assertIs(self.table.get_player("player2"), self.players[2])
+        self.assertIsNone(self.table.get_player("missing"))
+        
+        self.table.remove_player(self.players[2])
+        self.assertIsNone(self.table.get_player("player2"))
+        
+        self.table.add_player(self.players[2], position=5)
+        self.assertIs(self.table.get_player("player2"), self.players[2])
+    
+    def test_active_count(self):
+        """Test that the active count follows seating and eliminations."""
+        self.assertEqual(self.table.active_count, 4)
+        
+        # Eliminating a seated player drops the count, reinstating restores it
+        self.players[0].status = PlayerStatus.ELIMINATED
+        self.assertEqual(self.table.active_count, 3)
+        self.players[0].status = PlayerStatus.ACTIVE
+        self.assertEqual(self.table.active_count, 4)
+        
+        # Removed players no longer affect the count
+        self.table.remove_player(self.players[1])
+        self.assertEqual(self.table.active_count, 3)
+        self.players[1].status = PlayerStatus.ELIMINATED
+        self.assertEqual(self.table.active_count, 3)
+        
+        # Eliminated players are seated without counting
+        self.table.remove_player(self.players[2])
+        self.players[2].status = PlayerStatus.ELIMINATED
+        self.table.add_player(self.players[2])
+        self.assertEqual(self.table.active_count, 2)
+
+    def test_get_players_in_hand(self):
+        """Test that the cached in-hand list follows status and seating changes."""
+        self.assertEqual(self.table.get_players_in_hand(), self.players)
+        
+        self.players[1].fold()
+        self.players[2].place_bet(1000)  # All-in players stay in the hand
+        self.assertEqual(self.table.get_players_in_hand(),
+                         [self.players[0], self.players[2], self.players[3]])
+        
+        self.table.remove_player(self.players[3])
+        self.assertEqual(self.table.get_players_in_hand(), [self.players[0], self.players[2]])
+        
+        newcomer = Player("player4", name="Player 4", chips=1000, status=PlayerStatus.ACTIVE)
+        self.table.add_player(newcomer, position=3)
+        self.assertEqual(self.table.get_players_in_hand(),
+                         [self.players[0], self.players[2], newcomer])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,197 @@
+"""Unit tests for the Tournament module."""
+import unittest
+from core.tournament import Tournament, TournamentConfig, TournamentStatus
+from core.player import Player, PlayerStatus
+
+
+class TestTournament(unittest.TestCase):
+    def setUp(self):
+        """Set up a tournament with registered players for testing."""
+        self.tournament = Tournament("test_tournament")
+        self.players = [
+            Player(f"player{i}", name=f"Player {i}")
+            for i in range(20)
+        ]
+        for player in self.players:
+            self.tournament.register_player(player)
+
+    def assertActiveCountConsistent(self):
+        """Check the incremental active-player count against a full scan."""
+        expected = sum(1 for p in self.tournament.players.values()
+                       if p.status != PlayerStatus.ELIMINATED)
+        self.assertEqual(self.tournament._active_count, expected)
+
+    def assertSeatIndexConsistent(self):
+        """Check the player -> table index against the actual seating."""
+        seated = {}
+        for table in self.tournament.tables:
+            for position, seat in enumerate(table.seats):
+                if seat is not None:
+                    self.assertEqual(seat.position, position)
+                    seated[seat.id] = table
+        self.assertEqual(len(seated), len(self.tournament._player_table))
+        for player_id, table in seated.items():
+            self.assertIs(self.tournament._player_table[player_id], table)
+
+    def test_register_player(self):
+        """Test registering players for the tournament."""
+        self.assertEqual(len(self.tournament.players), 20)
+        self.assertActiveCountConsistent()
+
+        # Duplicate registration is rejected
+        self.assertFalse(self.tournament.register_player(self.players[0]))
+        self.assertActiveCountConsistent()
+
+    def test_unregister_player(self):
+        """Test unregistering a player before the tournament starts."""
+        self.assertTrue(self.tournament.unregister_player("player0"))
+        self.assertNotIn("player0", self.tournament.players)
+        self.assertActiveCountConsistent()
+
+        status = self.tournament.get_tournament_status()
+        self.assertEqual(status["prize_pool"], 19 * self.tournament.config.buy_in)
+        self.assertEqual(status["buy_in"], self.tournament.config.buy_in)
+
+        self.assertFalse(self.tournament.unregister_player("player0"))
+        self.assertActiveCountConsistent()
+
+    def test_start_tournament(self):
+        """Test that starting the tournament seats every player."""
+        self.assertTrue(self.tournament.start_tournament())
+        self.assertEqual(self.tournament.status, TournamentStatus.RUNNING)
+        self.assertEqual(len(self.tournament.tables), 3)
+
+        seated = sum(table.player_count() for table in self.tournament.tables)
+        self.assertEqual(seated, 20)
+
+    def test_seating_is_reproducible(self):
+        """Test that seeding the tournament's RNG fixes the seat draw."""
+        seatings = []
+        for _ in range(2):
+            tournament = Tournament("seeded")
+            tournament._rng.seed(42)
+            for i in range(20):
+                tournament.register_player(Player(f"player{i}", name=f"Player {i}"))
+            tournament.start_tournament()
+            seatings.append([[p.id if p else None for p in table.seats]
+                             for table in tournament.tables])
+        self.assertEqual(seatings[0], seatings[1])
+
+    def test_advance_level(self):
+        """Test that advancing the level updates the blinds everywhere."""
+        self.assertIsNone(self.tournament.get_tournament_status()["blinds"])
+        self.tournament.start_tournament()
+        self.assertEqual(self.tournament.get_tournament_status()["blinds"]["big_blind"], 10)
+
+        # Each status gets its own blinds dict
+        self.tournament.get_tournament_status()["blinds"]["big_blind"] = 999
+        self.assertEqual(self.tournament.get_tournament_status()["blinds"]["big_blind"], 10)
+
+        self.assertTrue(self.tournament.advance_level())
+        blinds = self.tournament.config.blind_levels[1]
+        self.assertIs(self.tournament._get_current_blinds(), blinds)
+        self.assertEqual(self.tournament.get_tournament_status()["blinds"]["big_blind"],
+                         blinds.big_blind)
+        for game in self.tournament.games.values():
+            self.assertEqual(game.config.small_blind, blinds.small_blind)
+            self.assertEqual(game.config.big_blind, blinds.big_blind)
+
+    def test_eliminate_player(self):
+        """Test eliminating players keeps the active count in sync."""
+        self.tournament.start_tournament()
+
+        for player in self.players[:5]:
+            self.assertTrue(self.tournament.eliminate_player(player.id))
+            self.assertActiveCountConsistent()
+
+            player_status = self.tournament.get_player_status(player.id)
+            self.assertFalse(player_status["is_active"])
+            self.assertIsNone(player_status["table"])
+
+        status = self.tournament.get_tournament_status()
+        self.assertEqual(status["players"]["active"], 15)
+        self.assertEqual(status["players"]["eliminated"], 5)
+
+        self.assertFalse(self.tournament.eliminate_player("unknown"))
+        self.assertActiveCountConsistent()
+
+        # A second elimination of the same player is rejected
+        self.assertFalse(self.tournament.eliminate_player(self.players[0].id))
+        self.assertEqual(len(self.tournament.eliminated_players), 5)
+        self.assertActiveCountConsistent()
+
+    def test_tables_stay_balanced(self):
+        """Test that eliminations keep tables within one player of each other."""
+        self.tournament.start_tournament()
+
+        for player in self.players[:12]:
+            self.tournament.eliminate_player(player.id)
+            counts = [table.player_count() for table in self.tournament.tables]
+            self.assertLessEqual(max(counts) - min(counts), 1)
+
+            self.assertSeatIndexConsistent()
+
+    def test_balance_skewed_tables(self):
+        """Test balancing tables that are several players apart."""
+        self.tournament.start_tournament()
+        source, dest = self.tournament.tables[2], self.tournament.tables[0]
+
+        # Pile players onto the last table until it is full
+        for player in [p for p in dest.seats if p is not None][:2]:
+            dest.remove_player(player)
+            source.add_player(player)
+            self.tournament._player_table[player.id] = source
+
+        self.tournament._balance_tables()
+        counts = [table.player_count() for table in self.tournament.tables]
+        self.assertEqual(sum(counts), 20)
+        self.assertLessEqual(max(counts) - min(counts), 1)
+        self.assertSeatIndexConsistent()
+
+    def test_final_standings(self):
+        """Test that standings rank survivors by chips, then last-out first."""
+        self.tournament.start_tournament()
+        for player in self.players[:17]:
+            self.tournament.eliminate_player(player.id)
+        survivors = self.players[17:]
+        for chips, player in zip((500, 3000, 1500), survivors):
+            player.chips = chips
+
+        standings = self.tournament._get_final_standings()
+        self.assertEqual([position for _, position in standings], list(range(1, 21)))
+        self.assertEqual([p for p, _ in standings[:3]],
+                         [survivors[1], survivors[2], survivors[0]])
+        self.assertEqual([p for p, _ in standings[3:]], self.players[16::-1])
+
+    def test_finish_tournament(self):
+        """Test that the tournament finishes when one player remains."""
+        config = TournamentConfig(buy_in=100, starting_chips=1000,
+                                  payouts_percentage=[100.0])
+        config.blind_levels = Tournament._create_default_config().blind_levels
+        tournament = Tournament("heads_up", config)
+        first = Player("first", name="First")
+        second = Player("second", name="Second")
+        tournament.register_player(first)
+        tournament.register_player(second)
+        tournament.start_tournament()
+
+        self.assertTrue(tournament.eliminate_player("second"))
+        self.assertEqual(tournament.status, TournamentStatus.FINISHED)
+        self.assertEqual(tournament._active_count, 1)
+        self.assertEqual(tournament.get_tournament_status()["prize_pool"], 200)
+
+    def test_finish_without_starting(self):
+        """Test the status of a tournament that finishes while still registering."""
+        tournament = Tournament("never_started")
+        tournament.register_player(Player("first", name="First"))
+        tournament.register_player(Player("second", name="Second"))
+
+        self.assertTrue(tournament.eliminate_player("second"))
+        self.assertEqual(tournament.status, TournamentStatus.FINISHED)
+        status = tournament.get_tournament_status()
+        self.assertEqual(status["status"], "FINISHED")
+        self.assertEqual(status["blinds"]["big_blind"], tournament.config.blind_levels[0].big_blind)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,13 +5,19 @@ import asyncio
 import enum
 import os
 import json
-from typing import Any
+import logging
+from typing import Any, Dict, Optional
 import uuid
 import sys
 
 # Add the root directory to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+try:
+    import orjson  # Optional faster JSON (the "fast-json" extra) for broadcasts and client messages
+except ImportError:
+    orjson = None
+
 from fastapi import FastAPI, WebSocket, Request, WebSocketDisconnect
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
@@ -24,6 +30,7 @@ from core.table import Table
 
 # Create FastAPI app
 app = FastAPI(title="Texas Hold'em Poker")
+logger = logging.getLogger("poker.app")
 
 # Set up templates and static files directories
 # Use absolute paths or paths relative to the module location
@@ -31,10 +38,15 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 templates = Jinja2Templates(directory=os.path.join(current_dir, "templates"))
 app.mount("/assets", StaticFiles(directory=os.path.join(current_dir, "assets")), name="assets")
 
+# Client action names to actions, looked up once per action message
+_ACTION_BY_NAME = {action.name: action for action in GameAction}
+
 # Store active games in memory (in a real app, you'd use a database)
 active_games = {}
 active_players = {}
 active_connections = {}
+next_hand_tasks = {}  # Pending start_next_hand task per game ID
+last_sent_states = {}  # Last game-state message sent on each player's connection
 
 
 
@@ -121,8 +133,9 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str, player_id: str)
     # Accept the WebSocket connection
     await websocket.accept()
     
-    # Store the connection
+    # Store the connection; a new connection always gets the current state
     active_connections[player_id] = websocket
+    last_sent_states.pop(player_id, None)
     
     try:
         # Send initial game state
@@ -131,7 +144,7 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str, player_id: str)
         # Listen for messages
         while True:
             data = await websocket.receive_text()
-            message = json.loads(data)
+            message = _loads(data)
             
             # Handle player action
             if message["type"] == "action":
@@ -139,7 +152,7 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str, player_id: str)
                 amount = message.get("amount", 0)
                 
                 # Convert action string to enum
-                action = GameAction[action_type]
+                action = _ACTION_BY_NAME[action_type]
                 
                 # Process the action
                 if game.state.current_player_idx >= 0:
@@ -164,6 +177,7 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str, player_id: str)
         # Remove the connection
         if player_id in active_connections:
             del active_connections[player_id]
+        last_sent_states.pop(player_id, None)
         
         # If this is a game in progress, make the player sit out
         if player.status == PlayerStatus.ACTIVE:
@@ -172,62 +186,107 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str, player_id: str)
             # Send updated game state to all players
             await broadcast_game_state(game)
 
-async def send_game_state(game: Game, player_id: str):
-    """Send game state to a specific player."""
+async def send_game_state(game: Game, player_id: str, public_state: Optional[Dict[str, Any]] = None):
+    """Send game state to a specific player, on top of a shared public state if given."""
+    message = _game_state_message(game, player_id, public_state)
+    if message is not None:
+        await active_connections[player_id].send_text(message)
+
+def _game_state_message(game: Game, player_id: str,
+                        public_state: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """
+    Build the game-state message for a player.
+    
+    Returns:
+        The JSON text to send, or None if the player isn't connected or
+        already has this exact state
+    """
     if player_id not in active_connections:
-        return
+        return None
     
     # Get the player's view of the game state
-    game_state = game.get_game_state_for_player(player_id)
+    game_state = game.get_game_state_for_player(player_id, public_state)
     
-    # If the game is finished, automatically start a new hand after 3 seconds
-    if game_state['status'] == 'FINISHED':
+    # If the game is finished, automatically start a new hand after 3 seconds,
+    # scheduling it only once however many players are sent this state
+    if game_state['status'] == 'FINISHED' and game.game_id not in next_hand_tasks:
         # We use asyncio.create_task to avoid blocking this function
-        asyncio.create_task(start_next_hand(game, 3))
+        next_hand_tasks[game.game_id] = asyncio.create_task(start_next_hand(game, 3))
     
-    # Convert the game state to be JSON serializable
-    game_state_json = prepare_for_json(game_state)
+    # Action names as keys; anything else the encoder can't handle goes
+    # through _json_default as it is reached, in the same pass
+    game_state["available_actions"] = {
+        action.name: amount for action, amount in game_state["available_actions"].items()
+    }
     
-    # Convert to JSON and send
-    await active_connections[player_id].send_text(json.dumps({
+    # Convert to JSON, unless the player already has this exact state
+    message = _dumps({
         "type": "game_state",
-        "state": game_state_json
-    }))
+        "state": game_state
+    })
+    if last_sent_states.get(player_id) == message:
+        return None
+    last_sent_states[player_id] = message
+    return message
 
-def prepare_for_json(obj: Any) -> Any:
+def _dumps(message: Any) -> str:
+    """Encode a message as JSON text, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(message, default=_json_default).decode()
+    return json.dumps(message, default=_json_default)
+
+def _loads(data: str) -> Any:
+    """Decode a JSON message from a client, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_default(obj: Any) -> Any:
     """
-    Recursively convert objects to JSON-serializable types.
-    Handles Enum objects, nested dictionaries, and lists.
+    JSON encoder fallback for objects json.dumps can't serialize itself.
+    Enums become their names and custom objects their attribute dicts.
     """
     if isinstance(obj, enum.Enum):
-        return obj.name  # Convert Enum to string
-    elif isinstance(obj, dict):
-        # Convert dictionary keys and values
-        return {
-            prepare_for_json(key): prepare_for_json(value)
-            for key, value in obj.items()
-        }
-    elif isinstance(obj, list):
-        # Convert list items
-        return [prepare_for_json(item) for item in obj]
-    elif hasattr(obj, '__dict__'):
-        # Convert custom objects to dictionaries
-        return prepare_for_json(obj.__dict__)
-    else:
-        # Return basic types as-is
-        return obj
+        return obj.name
+    if hasattr(obj, '__dict__'):
+        return obj.__dict__
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 async def broadcast_game_state(game: Game):
     """Broadcast game state to all connected players."""
+    # Built once; each player's view only adds their own cards and actions
+    public_state = game.get_public_state()
+    messages = {}
     for player in game.table.seats:
         if player is not None:
-            await send_game_state(game, player.id)
+            message = _game_state_message(game, player.id, public_state)
+            if message is not None:
+                messages[player.id] = message
+    
+    # Send to everyone concurrently; one failed connection doesn't stop the rest
+    sockets = {player_id: active_connections[player_id] for player_id in messages}
+    results = await asyncio.gather(
+        *(websocket.send_text(messages[player_id]) for player_id, websocket in sockets.items()),
+        return_exceptions=True)
+    for (player_id, websocket), result in zip(sockets.items(), results):
+        if isinstance(result, BaseException):
+            logger.warning("Dropping connection for player %s after a failed send",
+                           player_id, exc_info=result)
+            # Forget the dead connection (unless the player has already reconnected)
+            if active_connections.get(player_id) is websocket:
+                del active_connections[player_id]
+                last_sent_states.pop(player_id, None)
 
 async def start_next_hand(game: Game, delay_seconds: int = 3):
     """Wait for a delay and then start the next hand."""
     try:
-        # Wait for the specified delay
-        await asyncio.sleep(delay_seconds)
+        try:
+            # Wait for the specified delay
+            await asyncio.sleep(delay_seconds)
+        finally:
+            # Free the game's slot before broadcasting, so a broadcast that
+            # still sees FINISHED can schedule another attempt
+            next_hand_tasks.pop(game.game_id, None)
         
         # Check if the game is still in FINISHED state
         if game.state.status == GameStatus.FINISHED: